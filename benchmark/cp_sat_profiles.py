@@ -0,0 +1,71 @@
+#!/usr/bin/python
+
+import json
+import os
+import sys
+
+from main import create_simulator_input
+from nsp_solver.batch.batch_runner import BatchJob, BatchRunner
+from nsp_solver.solver.cp_sat_profiles import PROFILES
+from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
+from nsp_solver.utils import utils
+from nsp_solver.validator.decision_policy import AlwaysContinuePolicy
+
+# the weekly CP-SAT model computed with each profile of the parameters of CP-SAT
+
+if __name__ == "__main__":
+    original_stdout = sys.stdout
+
+    try:
+        output_file = 'outputs\\logs\\output_cp_sat_profiles.txt'
+
+        if not os.path.exists("outputs"):
+            os.makedirs("outputs")
+        if not os.path.exists("outputs\\logs"):
+            os.makedirs("outputs\\logs")
+        if not os.path.exists("outputs\\schedules"):
+            os.makedirs("outputs\\schedules")
+
+        time_limit = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+        config_file_id = 0
+        history_id = 0
+        week_ids = {4: [1, 7, 1, 8], 8: [1, 7, 1, 8, 2, 5, 0, 3]}
+        instances = [35, 70]
+
+        # list of input for benchmark
+        jobs = []
+        for number_of_nurses in instances:
+            for number_weeks, weeks in week_ids.items():
+                for profile in PROFILES:
+                    input = create_simulator_input(
+                        time_limit, 1, number_of_nurses, number_weeks, history_id, weeks, config_file_id, path="data",
+                        config_policy=AlwaysContinuePolicy(),
+                    )
+                    input.solver = ORTOOLS_Solver()
+                    input.cp_sat_profile = profile
+                    jobs.append(BatchJob(f'{profile} {number_of_nurses} {number_weeks}', input))
+
+        # the jobs are computed one after another, so that their times are comparable
+        records = {}
+        with utils.redirect_stdout_to_file(output_file):
+            with open('outputs/cp_sat_profiles.jsonl', 'w') as records_file:
+                for record in BatchRunner(1).run(jobs):
+                    print(record)
+                    records_file.write(json.dumps(record.to_dict()) + "\n")
+                    records[record.name] = record
+
+        with open('outputs/cp_sat_profiles.txt', 'w') as file:
+            file.write("profile                 | instance | value | time\n")
+            file.write("--------------------------------------------------------\n")
+            for number_of_nurses in instances:
+                for number_weeks in week_ids:
+                    for profile in PROFILES:
+                        record = records[f'{profile} {number_of_nurses} {number_weeks}']
+                        file.write(profile.ljust(23))
+                        file.write(f" | n0{number_of_nurses}w{number_weeks}".ljust(11))
+                        file.write(f" | {record.objective}".ljust(8))
+                        file.write(f" | {record.total_time:.1f} s\n")
+
+    except Exception as e:
+        sys.stdout = original_stdout
+        print(f"An error occurred: {e}")
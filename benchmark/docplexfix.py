@@ -1,49 +1,64 @@
 #!/usr/bin/python
 
+import json
 import os
 import sys
-import subprocess
 
+from main import create_simulator_input, write_result
+from nsp_solver.batch.batch_runner import BatchJob, BatchRunner
 from nsp_solver.utils import utils
 
-original_stdout = sys.stdout
+if __name__ == "__main__":
+    original_stdout = sys.stdout
 
-try:
-    output_file = 'outputs\\logs\\output_docplexfix.txt'
+    try:
+        output_file = 'outputs\\logs\\output_docplexfix.txt'
 
-    if not os.path.exists("outputs"): 
-        os.makedirs("outputs") 
-    if not os.path.exists("outputs\\logs"): 
-        os.makedirs("outputs\\logs") 
-    if not os.path.exists("outputs\\schedules"): 
-        os.makedirs("outputs\\schedules") 
+        if not os.path.exists("outputs"): 
+            os.makedirs("outputs") 
+        if not os.path.exists("outputs\\logs"): 
+            os.makedirs("outputs\\logs") 
+        if not os.path.exists("outputs\\schedules"): 
+            os.makedirs("outputs\\schedules") 
 
-    number_of_iteration = 8
-    number_of_nurses = 35
-    config_file_id = 0
+        number_of_iteration = 8
+        number_of_nurses = 35
+        config_file_id = 0
+        number_of_workers = os.cpu_count()
 
-    week_combinations = []
-    with open('input\\week_combinations.txt') as f:
-        week_combinations = [line.strip() for line in f.readlines()]
+        week_combinations = []
+        with open('input\\week_combinations.txt') as f:
+            week_combinations = [line.strip() for line in f.readlines()]
 
 
-    with open('outputs/results.txt', 'w') as file:
-        ajustment = 7 + len(week_combinations[0])
-        file.write("solver  | " + "configuration".ljust(ajustment) + " | value | time\n")
-        file.write("-----------------------------------------------------------\n")
+        with open('outputs/results.txt', 'w') as file:
+            ajustment = 7 + len(week_combinations[0])
+            file.write("solver  | " + "configuration".ljust(ajustment) + " | value | time\n")
+            file.write("-----------------------------------------------------------\n")
 
-    # list of input for benchmark
-    with utils.redirect_stdout_to_file(output_file):
-        # print(arguments_list)
-        # run the main script in iterations
+        # list of input for benchmark
+        jobs = []
         for time_limit in [0]:
             for solver_id in [2]:
-                arguments_list = [ f'{time_limit} {solver_id} {number_of_nurses} {config_file_id} ' + combination for combination in week_combinations]
-                for arg in arguments_list:
-                    for _ in range(number_of_iteration):
-                        subprocess.run(['python', 'main.py'] + arg.split(' '), stdout=sys.stdout)
+                for combination in week_combinations:
+                    number_weeks, history_id, *week_ids = map(int, combination.split(' '))
+                    for iteration in range(number_of_iteration):
+                        input = create_simulator_input(
+                            time_limit, solver_id, number_of_nurses, number_weeks, history_id, week_ids, config_file_id
+                        )
+                        jobs.append(BatchJob(f'{time_limit} {solver_id} {combination}', input, iteration))
 
-except Exception as e:
-    sys.stdout = original_stdout
-    print(f"An error occurred: {e}")
+        # run all inputs on a pool of workers that is kept alive for the whole benchmark
+        with utils.redirect_stdout_to_file(output_file):
+            with open('outputs/results.jsonl', 'w') as records_file:
+                for record in BatchRunner(number_of_workers).run(jobs):
+                    print(record)
+                    records_file.write(json.dumps(record.to_dict()) + "\n")
+                    _, _, number_weeks, history_id, *week_ids = map(int, record.name.split(' '))
+                    write_result(
+                        record.solver, number_of_nurses, number_weeks, history_id, week_ids, record.objective, record.total_time
+                    )
 
+    except Exception as e:
+        sys.stdout = original_stdout
+        print(f"An error occurred: {e}")
@@ -6,15 +6,45 @@ import time
 
 from nsp_solver.simulator.history_simulator import HistorySimulator
 from nsp_solver.simulator.simulator import Simulator, SimulatorInput
+from nsp_solver.simulator.solution_cache import SolutionCache
+from nsp_solver.solver.horizon_solver import HorizonSolver
 from nsp_solver.solver.nsp_cplex import CplexSolver
+from nsp_solver.solver.ir_solver import IR_Solver
+from nsp_solver.solver.lns_solver import LNS_Solver
+from nsp_solver.solver.model_cache import ModelCache
 from nsp_solver.solver.nsp_docplex import DOCPLEX_Solver
 from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
-from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.solver.nsp_solver import NSP_solver, SolverResources
+from nsp_solver.solver.portfolio_solver import PortfolioSolver
 from nsp_solver.validator.conf_validator import ConfigValidator
-from nsp_solver.validator.validator import ScheduleValidator
+from nsp_solver.validator.decision_policy import DecisionPolicy
+from nsp_solver.validator.numpy_validator import NumpyScheduleValidator
 
 
-def main(
+MODE_LABELS = {0: "CPLEX", 1: "OR_TOOLS", 2: "DOCPLEX", 3: "PORTFOLIO", 4: "LNS", 5: "IR_CP_SAT", 6: "IR_CPLEX", 7: "IR_DOCPLEX", 8: "HORIZON"}
+
+
+def get_solver(mode: int, model_cache: ModelCache = None) -> NSP_solver:
+    """Returns the solver for the given mode: 0 - CPLEX, 1 - OR-tools CP-SAT, 2 - docplex, 3 - portfolio of all three,
+    4 - LNS over CP-SAT, 5, 6, 7 - the constraint IR compiled to CP-SAT, CPLEX and docplex
+    (using the model_cache if it is given), 8 - one CP-SAT model of all weeks."""
+    if mode == 0:
+        return CplexSolver()
+    if mode == 1:
+        return ORTOOLS_Solver()
+    if mode == 2:
+        return DOCPLEX_Solver()
+    if mode == 3:
+        return PortfolioSolver([CplexSolver(), ORTOOLS_Solver(), DOCPLEX_Solver()])
+    if mode == 4:
+        return LNS_Solver()
+    if mode in (5, 6, 7):
+        return IR_Solver(("cp-sat", "cplex", "docplex")[mode - 5], model_cache)
+    if mode == 8:
+        return HorizonSolver()
+
+
+def create_simulator_input(
     time_limit_for_week,
     mode,
     number_nurses: int,
@@ -22,25 +52,13 @@ def main(
     history_data_file_id: int,
     week_data_files_ids: list,
     config_data_file_id: int,
-):
-    solver: NSP_solver
-    print("++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
-    if mode == 0:
-        solver = CplexSolver()
-        print(
-            f"configuration: CPLEX-w{number_weeks}_n{number_nurses}_h{history_data_file_id}_{' '.join(map(str, week_data_files_ids))}"
-        )
-    if mode == 1:
-        solver = ORTOOLS_Solver()
-        print(
-            f"configuration: OR_TOOLS-w{number_weeks}_n{number_nurses}_h{history_data_file_id}_{' '.join(map(str, week_data_files_ids))}"
-        )
-    if mode == 2:
-        solver = DOCPLEX_Solver()
-        print(
-            f"configuration: DOCPLEX-w{number_weeks}_n{number_nurses}_h{history_data_file_id}_{' '.join(map(str, week_data_files_ids))}"
-        )
-
+    path: str = "modified_data",
+    resources: SolverResources = None,
+    model_cache: ModelCache = None,
+    solution_cache: SolutionCache = None,
+    config_policy: DecisionPolicy = None,
+) -> SimulatorInput:
+    solver = get_solver(mode, model_cache)
     if time_limit_for_week == 0:
         time_limit_for_week = 10 + 10 * (number_nurses - 20)
         # time_limit_for_week = 10
@@ -48,33 +66,61 @@ def main(
     graph_file = f'outputs\\schedules\\{solver.name}_n{number_nurses}_h{history_data_file_id}_w{number_weeks}_{"".join(map(str, week_data_files_ids))}.png'
     validator_out_file = 'outputs/validator_result.txt'
     # accumulate results over weeks
-    path = "modified_data"
-    config_file = path + f"\C{config_data_file_id}.json"
+    config_file = path + f"\\C{config_data_file_id}.json"
     hist_file = (
-        path + f"\H0-n0{number_nurses}w{number_weeks}-{history_data_file_id}.json"
+        path + f"\\H0-n0{number_nurses}w{number_weeks}-{history_data_file_id}.json"
     )
-    scen_file = path + f"\Sc-n0{number_nurses}w{number_weeks}.json"
+    scen_file = path + f"\\Sc-n0{number_nurses}w{number_weeks}.json"
     wd_files = []
     for week in range(number_weeks):
         wd_files.append(
             path
-            + f"\WD-n0{number_nurses}w{number_weeks}-{week_data_files_ids[week]}.json"
+            + f"\\WD-n0{number_nurses}w{number_weeks}-{week_data_files_ids[week]}.json"
         )
 
-    simulator = Simulator()
-    input = SimulatorInput(
+    return SimulatorInput(
         config_file,
         hist_file,
         scen_file,
         wd_files,
         time_limit_for_week,
         solver,
-        ScheduleValidator(),
+        NumpyScheduleValidator(),
         ConfigValidator(),
         HistorySimulator(),
         graph_file,
-        validator_out_file
+        validator_out_file,
+        resources=resources,
+        solution_cache=solution_cache,
+        config_policy=config_policy,
+    )
+
+
+def main(
+    time_limit_for_week,
+    mode,
+    number_nurses: int,
+    number_weeks: int,
+    history_data_file_id: int,
+    week_data_files_ids: list,
+    config_data_file_id: int,
+):
+    print("++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
+    input = create_simulator_input(
+        time_limit_for_week,
+        mode,
+        number_nurses,
+        number_weeks,
+        history_data_file_id,
+        week_data_files_ids,
+        config_data_file_id,
+    )
+    solver = input.solver
+    print(
+        f"configuration: {MODE_LABELS[mode]}-w{number_weeks}_n{number_nurses}_h{history_data_file_id}_{' '.join(map(str, week_data_files_ids))}"
     )
+
+    simulator = Simulator()
     start = time.time()
     total_value, _ = simulator.simulate_computation(input)
     end = time.time()
@@ -83,8 +129,20 @@ def main(
     print("++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     print("----------------------------------------------------------------")
     # print(f"configuration: n{number_nurses}_h{history_data_file_id}_w{number_weeks}_{"".join(map(str, week_data_files_ids))}")
+    write_result(solver.name, number_nurses, number_weeks, history_data_file_id, week_data_files_ids, total_value, end - start)
+
+
+def write_result(
+    solver_name: str,
+    number_nurses: int,
+    number_weeks: int,
+    history_data_file_id: int,
+    week_data_files_ids: list,
+    total_value,
+    seconds: float,
+):
     with open("outputs/results.txt", "a") as file:
-        file.write(solver.name.ljust(7))
+        file.write(solver_name.ljust(7))
         file.write(" | ")
         file.write(
             f'n0{number_nurses}_w{number_weeks}_h{history_data_file_id}_{"-".join(map(str, week_data_files_ids))}'
@@ -92,7 +150,7 @@ def main(
         file.write(" | ")
         file.write(f"{total_value}".ljust(5))
         file.write(" | ")
-        file.write(f"{math.ceil(end - start)} s".ljust(7) + "\n")
+        file.write(f"{math.ceil(seconds)} s".ljust(7) + "\n")
 
 
 if __name__ == "__main__":
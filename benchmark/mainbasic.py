@@ -11,7 +11,7 @@ from nsp_solver.solver.nsp_docplex import DOCPLEX_Solver
 from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
 from nsp_solver.solver.nsp_solver import NSP_solver
 from nsp_solver.validator.conf_validator import ConfigValidator
-from nsp_solver.validator.validator import ScheduleValidator
+from nsp_solver.validator.numpy_validator import NumpyScheduleValidator
 
 
 def main(
@@ -69,7 +69,7 @@ def main(
         wd_files,
         time_limit_for_week,
         solver,
-        ScheduleValidator(),
+        NumpyScheduleValidator(),
         ConfigValidator(),
         HistorySimulator(),
         graph_file,
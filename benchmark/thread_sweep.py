@@ -0,0 +1,72 @@
+#!/usr/bin/python
+
+import json
+import os
+import sys
+
+from main import MODE_LABELS, create_simulator_input
+from nsp_solver.batch.batch_runner import BatchJob, BatchRunner
+from nsp_solver.solver.nsp_solver import SolverResources
+from nsp_solver.utils import utils
+
+if __name__ == "__main__":
+    original_stdout = sys.stdout
+
+    try:
+        output_file = 'outputs\\logs\\output_thread_sweep.txt'
+
+        if not os.path.exists("outputs"):
+            os.makedirs("outputs")
+        if not os.path.exists("outputs\\logs"):
+            os.makedirs("outputs\\logs")
+        if not os.path.exists("outputs\\schedules"):
+            os.makedirs("outputs\\schedules")
+
+        time_limit = 0
+        config_file_id = 0
+        history_id = 0
+        week_ids = [1, 7, 1, 8]
+        number_weeks = 4
+        instances = [35, 70]
+        solver_ids = [0, 1, 2]
+        max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+        thread_counts = [threads for threads in [1, 2, 4, 8, 16, 32] if threads <= max_threads]
+
+        # list of input for benchmark
+        jobs = []
+        for number_of_nurses in instances:
+            for solver_id in solver_ids:
+                for threads in thread_counts:
+                    input = create_simulator_input(
+                        time_limit, solver_id, number_of_nurses, number_weeks, history_id, week_ids, config_file_id,
+                        path="data", resources=SolverResources(threads=threads),
+                    )
+                    jobs.append(BatchJob(f'{number_of_nurses} {solver_id} {threads}', input))
+
+        # the jobs are computed one after another, so that each of them can use all of its threads
+        records = {}
+        with utils.redirect_stdout_to_file(output_file):
+            with open('outputs/thread_sweep.jsonl', 'w') as records_file:
+                for record in BatchRunner(1).run(jobs):
+                    print(record)
+                    records_file.write(json.dumps(record.to_dict()) + "\n")
+                    records[tuple(map(int, record.name.split(' ')))] = record
+
+        with open('outputs/thread_sweep.txt', 'w') as file:
+            file.write("solver   | instance | threads | value | time    | speedup\n")
+            file.write("-----------------------------------------------------------\n")
+            for number_of_nurses in instances:
+                for solver_id in solver_ids:
+                    base_time = records[(number_of_nurses, solver_id, thread_counts[0])].total_time
+                    for threads in thread_counts:
+                        record = records[(number_of_nurses, solver_id, threads)]
+                        file.write(MODE_LABELS[solver_id].ljust(8))
+                        file.write(f" | n0{number_of_nurses}w{number_weeks}".ljust(12))
+                        file.write(f" | {threads}".ljust(10))
+                        file.write(f" | {record.objective}".ljust(8))
+                        file.write(f" | {record.total_time:.1f} s".ljust(10))
+                        file.write(f" | {base_time / record.total_time:.2f}\n")
+
+    except Exception as e:
+        sys.stdout = original_stdout
+        print(f"An error occurred: {e}")
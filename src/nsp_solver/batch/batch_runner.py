@@ -0,0 +1,156 @@
+from dataclasses import asdict, dataclass, field
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from typing import Iterable, Iterator
+
+from nsp_solver.simulator.simulator import Simulator, SimulatorInput
+from nsp_solver.utils import utils
+
+STATUS_STOPPED = "stopped"
+STATUS_ERROR = "error"
+
+# parsed input files kept by each worker process for the following jobs
+_file_cache: dict = {}
+
+
+@dataclass
+class BatchJob:
+    """Data class describing one computation of a schedule in a batch.
+    It contains the name of the job, the input of the Simulator and
+    the number of the repetition of the same input.
+    """
+    name: str
+    input: SimulatorInput
+    repetition: int = 0
+
+
+@dataclass
+class BatchRecord:
+    """Data class holding the outcome of one BatchJob.
+    The status is utils.STATUS_OK if all weeks were computed, utils.STATUS_FAIL if the solver failed in some week,
+    STATUS_STOPPED if the computation was stopped after the configuration evaluation
+    and STATUS_ERROR if an exception was raised.
+    """
+    name: str
+    repetition: int
+    solver: str
+    status: str
+    objective: int = None
+    week_statuses: list = field(default_factory=list)
+    week_times: list = field(default_factory=list)
+    week_time_limits: list = field(default_factory=list)
+    week_gaps: list = field(default_factory=list)
+    total_time: float = 0.0
+    worker: int = 0
+    error: str = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class _CachingSimulator(Simulator):
+    """Simulator that keeps the parsed input files in the worker process, so that
+    the jobs sharing the scenario, history or week files do not parse them again.
+    """
+
+    def _read_json_file(self, file_path: str):
+        if file_path not in _file_cache:
+            _file_cache[file_path] = super()._read_json_file(file_path)
+        return _file_cache[file_path]
+
+
+def _initialize_worker(quiet: bool):
+    if quiet:
+        sys.stdout = open(os.devnull, "w")
+
+
+def _run_job(job: BatchJob) -> BatchRecord:
+    """Runs one job in the worker process.
+
+    Args:
+        job (BatchJob): job to be computed
+
+    Returns:
+        BatchRecord: outcome of the job
+    """
+    record = BatchRecord(
+        name=job.name,
+        repetition=job.repetition,
+        solver=job.input.solver.name,
+        status=STATUS_ERROR,
+        worker=os.getpid(),
+    )
+    simulator = _CachingSimulator()
+    start = time.time()
+    try:
+        output = simulator.simulate_computation(job.input)
+    except Exception:
+        record.error = traceback.format_exc()
+        output = None
+    record.total_time = time.time() - start
+    record.week_times = list(simulator.week_times)
+    record.week_time_limits = list(simulator.week_time_limits)
+    record.week_gaps = list(simulator.week_gaps)
+
+    if record.error is not None:
+        return record
+    if output is None:
+        record.status = STATUS_STOPPED
+        return record
+
+    total_value, results = output
+    record.week_statuses = [results.get((w, "status")) for w in range(len(job.input.week_files_paths))]
+    record.status = utils.STATUS_FAIL if utils.STATUS_FAIL in record.week_statuses else utils.STATUS_OK
+    record.objective = int(total_value)
+    return record
+
+
+class BatchRunner:
+    """Class responsible for computing many schedules in parallel.
+    The jobs are distributed to a pool of worker processes that stay alive for the whole batch,
+    so the solver libraries are imported and the input files are parsed only once per worker.
+    """
+
+    def __init__(self, workers: int = None, quiet: bool = True):
+        """
+        Args:
+            workers (int, optional): number of worker processes. Defaults to the number of CPUs.
+            quiet (bool, optional): whether to discard the output printed by the workers. Defaults to True.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.quiet = quiet
+
+    def run(self, jobs: Iterable[BatchJob]) -> Iterator[BatchRecord]:
+        """Computes all jobs and yields their records as soon as they are finished.
+
+        Args:
+            jobs (Iterable[BatchJob]): jobs to be computed
+
+        Yields:
+            BatchRecord: outcome of each job in the order of completion
+        """
+        with multiprocessing.Pool(self.workers, initializer=_initialize_worker, initargs=(self.quiet,)) as pool:
+            for record in pool.imap_unordered(_run_job, jobs):
+                yield record
+
+    def run_to_file(self, jobs: Iterable[BatchJob], output_path: str) -> list[BatchRecord]:
+        """Computes all jobs and appends each record as one JSON line to the output file as soon as it is finished.
+
+        Args:
+            jobs (Iterable[BatchJob]): jobs to be computed
+            output_path (str): path to the JSON lines file
+
+        Returns:
+            list[BatchRecord]: outcomes of all jobs in the order of completion
+        """
+        records = []
+        with open(output_path, "a") as output_file:
+            for record in self.run(jobs):
+                output_file.write(json.dumps(record.to_dict()) + "\n")
+                output_file.flush()
+                records.append(record)
+        return records
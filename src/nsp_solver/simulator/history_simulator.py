@@ -1,15 +1,18 @@
 from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import as_assignments
+from nsp_solver.utils.streak_index import StreakIndex
+import numpy as np
 
 
 class HistorySimulator:
     """Class responsible for updating the history data for computation of the next week.
     """
 
-    def update_history_for_next_week(self, results: dict, data: dict):
+    def update_history_for_next_week(self, results, data: dict):
         """Updates the value of data["h0_data"] with new data derived from the newly computed week.
 
         Args:
-            results (dict): partially computed schedule
+            results (ScheduleTensor | dict): partially computed schedule
             data (dict): data from input files
         """
 
@@ -25,49 +28,28 @@ class HistorySimulator:
         the number of consecutive days off at the end of the week,
         the number of consecutive working days,
         the number of consecutive assignment of the same shift type.
+        The streaks are counted from the start of the computed week.
         """
+        streaks = StreakIndex(working_days, (shifts == 1).astype(np.int64))
+        working_day_streaks = streaks.last_working_day_streaks()
+        day_off_streaks = streaks.last_day_off_streaks()
+        shift_streaks = streaks.last_shift_streaks()
+        shift_names = {shift_id: shift_name for shift_name, shift_id in utils.shift_to_int.items()}
+
         for n in range(data["num_nurses"]):
+            nurse_history = data["h0_data"]["nurseHistory"][n]
             if working_days[n][6] == 0:
-                consecutive_free_days = 1
-                d = 5
-                while d >= 0 and working_days[n][d] == 0:
-                    consecutive_free_days += 1
-                    d -= 1
-                data["h0_data"]["nurseHistory"][n][
-                    "numberOfConsecutiveDaysOff"
-                ] = consecutive_free_days
-                data["h0_data"]["nurseHistory"][n]["numberOfConsecutiveWorkingDays"] = 0
-                data["h0_data"]["nurseHistory"][n]["numberOfConsecutiveAssignments"] = 0
-                data["h0_data"]["nurseHistory"][n]["lastAssignedShiftType"] = "None"
+                nurse_history["numberOfConsecutiveDaysOff"] = int(day_off_streaks[n])
+                nurse_history["numberOfConsecutiveWorkingDays"] = 0
+                nurse_history["numberOfConsecutiveAssignments"] = 0
+                nurse_history["lastAssignedShiftType"] = "None"
             else:
-                consecutive_work_days = 1
-                d = 5
-                while d >= 0 and working_days[n][d] == 1:
-                    consecutive_work_days += 1
-                    d -= 1
-                data["h0_data"]["nurseHistory"][n][
-                    "numberOfConsecutiveWorkingDays"
-                ] = consecutive_work_days
-                data["h0_data"]["nurseHistory"][n]["numberOfConsecutiveDaysOff"] = 0
-
-                consecutive_shift = 0
-                for s in range(data["num_shifts"]):
-                    if shifts[n][6][s] == 1:
-                        consecutive_shift = s
-                consecutive_shifts = 1
-                for shift_name, shift_id in utils.shift_to_int.items():
-                    if shift_id == consecutive_shift:
-                        data["h0_data"]["nurseHistory"][n][
-                            "lastAssignedShiftType"
-                        ] = shift_name
-
-                d = 5
-                while d >= 0 and shifts[n][d][consecutive_shift] == 1:
-                    consecutive_shifts += 1
-                    d -= 1
-                data["h0_data"]["nurseHistory"][n][
-                    "numberOfConsecutiveAssignments"
-                ] = consecutive_shifts
+                nurse_history["numberOfConsecutiveWorkingDays"] = int(working_day_streaks[n])
+                nurse_history["numberOfConsecutiveDaysOff"] = 0
+
+                last_shift = int(np.flatnonzero(shifts[n][6] == 1)[-1])
+                nurse_history["lastAssignedShiftType"] = shift_names[last_shift]
+                nurse_history["numberOfConsecutiveAssignments"] = int(shift_streaks[n][last_shift])
 
     def _update_cumulative_data(self, data, working_days, shifts):
         """Updated the cumulative data containing info accumulated over all computed weeks, namely:
@@ -75,32 +57,24 @@ class HistorySimulator:
         the number of working weekends,
         the number of incomplete weekends.
         """
+        assignments_per_nurse = shifts.sum(axis=(1, 2))
         for n in range(data["num_nurses"]):
-            for d in range(data["num_days"]):
-                for s in range(data["num_shifts"]):
-                    data["h0_data"]["nurseHistory"][n]["numberOfAssignments"] += shifts[n][d][s]
+            data["h0_data"]["nurseHistory"][n]["numberOfAssignments"] += int(assignments_per_nurse[n])
 
-            weekend_working_days = sum(working_days[n][5:7])
+            weekend_working_days = int(working_days[n][5:7].sum())
             data["h0_data"]["nurseHistory"][n]["numberOfWorkingWeekends"] += self.__isPositiveNumber(weekend_working_days)
             if data["configuration"]["h7"] and weekend_working_days == 1:
                 data["h0_data"]["nurseHistory"][n]["numberOfIncompleteWeekends"] += weekend_working_days
 
     def _compute_helpful_values(self, results, data, week_number):
-        """Computes helpful values from the computed schedule and return them as 2 dictionaries.
+        """Computes helpful values from the computed schedule and return them as 2 arrays:
+        working days of shape (nurses, days) and shifts of shape (nurses, days, shifts).
         """
         num_days = data["num_days"]
-        num_nurses = data["num_nurses"]
-        num_skills = data["num_skills"]
-        num_shifts = data["num_shifts"]
-        working_days = [[0 for _ in range(num_days)] for _ in range(num_nurses)]
-        shifts = [[[0 for _ in range(num_shifts)] for _ in range(num_days)] for _ in range(num_nurses)]
-
-        for n in range(num_nurses):
-            for d in range(num_days):
-                for s in range(num_shifts):
-                    shifts[n][d][s] = sum(results[(n, d + 7 * week_number, s, sk)] for sk in range(num_skills))
-                    if shifts[n][d][s] == 1:
-                        working_days[n][d] = 1
+        week_assignments = as_assignments(results, data)[:, num_days * week_number: num_days * (week_number + 1)]
+        shifts = week_assignments.sum(axis=3, dtype=np.int64)
+        working_days = (shifts == 1).any(axis=2).astype(np.int64)
+
         if data["configuration"]["h12"]:
             data["wd_data"]["vacations_with_ids"] = list(
                 map(lambda x: int(x.split("_")[1]), data["wd_data"]["vacations"])
@@ -0,0 +1,130 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import json
+import os
+
+import numpy as np
+
+
+@dataclass
+class WeekRecord:
+    """Data class holding the outcome of one computed week.
+    It contains the number of the week, the path to its week file, the status of the solution,
+    the objective value of the week reported by the solver (None if the solver does not report it),
+    the time of the computation of the week,
+    the assignments of the week of shape (nurses, days in week, shifts, skills) (None if the week failed),
+    the history after the week (the h0_data used for the next week, None if the week failed),
+    the time limit of the week and the relative gap of the solution (None if the solver does not report it),
+    the content hash of the input files the week was computed from (the configuration, the history, the scenario
+    and the week files up to this week).
+    """
+    week: int
+    week_file_path: str
+    status: str
+    objective: float
+    solve_time: float
+    assignments: np.ndarray = None
+    history: dict = None
+    time_limit: float = None
+    gap: float = None
+    input_key: str = None
+
+    def to_dict(self) -> dict:
+        """Returns the record as a JSON serializable dictionary. Only the indices of the assignments equal to 1 are stored."""
+        return {
+            "week": self.week,
+            "week_file_path": self.week_file_path,
+            "status": self.status,
+            "objective": self.objective,
+            "solve_time": self.solve_time,
+            "shape": None if self.assignments is None else list(self.assignments.shape),
+            "assignments": None if self.assignments is None else np.argwhere(self.assignments == 1).tolist(),
+            "history": self.history,
+            "time_limit": self.time_limit,
+            "gap": self.gap,
+            "input_key": self.input_key,
+        }
+
+    @classmethod
+    def from_dict(cls, record: dict) -> "WeekRecord":
+        """Creates the record from the dictionary created by to_dict."""
+        assignments = None
+        if record["assignments"] is not None:
+            assignments = np.zeros(record["shape"], dtype=np.uint8)
+            if record["assignments"]:
+                assignments[tuple(np.array(record["assignments"]).T)] = 1
+        return cls(
+            week=record["week"],
+            week_file_path=record["week_file_path"],
+            status=record["status"],
+            objective=record["objective"],
+            solve_time=record["solve_time"],
+            assignments=assignments,
+            history=record["history"],
+            time_limit=record.get("time_limit"),
+            gap=record.get("gap"),
+            input_key=record.get("input_key"),
+        )
+
+
+class ResultSink(ABC):
+    """Abstract class that serves as the interface for storing the outcome of each week as soon as it is computed,
+    so that an interrupted computation can be resumed from the last stored week.
+    """
+
+    @abstractmethod
+    def write_week(self, record: WeekRecord):
+        """Stores the outcome of one week.
+
+        Args:
+            record (WeekRecord): outcome of the week
+        """
+        pass
+
+    @abstractmethod
+    def read_weeks(self) -> list[WeekRecord]:
+        """Reads all stored weeks in the order in which they were written.
+
+        Returns:
+            list[WeekRecord]: the stored weeks
+        """
+        pass
+
+    def clear(self):
+        """Removes all stored weeks."""
+        pass
+
+
+class JsonlResultSink(ResultSink):
+    """ResultSink that appends each week as one JSON line to a file.
+    Each line is flushed to the disk before the next week is computed. A line cut off by a crash is ignored on reading.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): path to the JSON lines file
+        """
+        self.path = path
+
+    def write_week(self, record: WeekRecord):
+        with open(self.path, "a") as file:
+            file.write(json.dumps(record.to_dict()) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def read_weeks(self) -> list[WeekRecord]:
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path) as file:
+            for line in file:
+                try:
+                    records.append(WeekRecord.from_dict(json.loads(line)))
+                except (json.JSONDecodeError, KeyError):
+                    break
+        return records
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -4,9 +4,19 @@ import json
 import time
 from matplotlib import pyplot as plt, ticker
 from nsp_solver.simulator.history_simulator import HistorySimulator
-from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.simulator.result_sink import ResultSink, WeekRecord
+from nsp_solver.simulator.solution_cache import SolutionCache, solution_key
+from nsp_solver.simulator.time_budget import TimeBudget
+from nsp_solver.solver.cp_sat_profiles import get_profile
+from nsp_solver.solver.nsp_solver import NSP_solver, SolverResources
+from nsp_solver.solver.stopping import StoppingCriteria
+from nsp_solver.solver.warm_start import WarmStart
 from nsp_solver.utils import utils
+from nsp_solver.utils.scenario_cache import ScenarioCache, compile_scenario, content_key
+from nsp_solver.utils.schedule_tensor import ScheduleTensor, as_assignments, store_week
+from nsp_solver.utils.week_instance import WeekInstance
 from nsp_solver.validator.conf_validator import CONF_EVAL, ConfigValidator
+from nsp_solver.validator.decision_policy import DecisionPolicy
 from nsp_solver.validator.validator import ScheduleValidator
 import numpy as np
 
@@ -19,7 +29,18 @@ class SimulatorInput():
     the time limit for computation of 1 week,
     the chosen NSP_solver that will be used for the computation,
     the ScheduleValidator, ConfigValidator, HistorySimulator that will be used during the process of the schedule computation,
-    the paths to the output files.
+    the paths to the output files,
+    optionally the WarmStart that provides the solver with an initial schedule for each week,
+    optionally the SolverResources that override the resources of the solver,
+    optionally the ScenarioCache that loads the input files from the pre-compiled artifacts instead of parsing the JSON files,
+    optionally the ResultSink that stores each week as soon as it is computed,
+    the ResultSink with the weeks of an interrupted computation that is resumed after its last successful week
+    the SolutionCache with the weeks computed by earlier runs that are reused instead of calling the solver
+    the DecisionPolicy that overrides the policy of the ConfigValidator (e.g. AlwaysContinuePolicy for runs without a display),
+    optionally whether the solver computes each week together with the relaxed next week (overrides the lookahead of the solver),
+    optionally the TimeBudget that splits its total time among the weeks instead of the same time limit for each week,
+    optionally the StoppingCriteria that stop the computation of each week before its time limit
+    and optionally the name of the profile of the parameters of CP-SAT (overrides the cp_sat_profile of the solver).
     """
     config_file_path: str
     history_file_path: str
@@ -32,54 +53,119 @@ class SimulatorInput():
     historySimulator: HistorySimulator
     graph_output_path: str
     validator_output_path: str
+    warm_start: WarmStart = None
+    resources: SolverResources = None
+    scenario_cache: ScenarioCache = None
+    result_sink: ResultSink = None
+    resume_from: ResultSink = None
+    solution_cache: SolutionCache = None
+    config_policy: DecisionPolicy = None
+    lookahead: bool = None
+    time_budget: TimeBudget = None
+    stopping_criteria: StoppingCriteria = None
+    cp_sat_profile: str = None
 
 
 class Simulator:
     """Class responsible for the management of the whole process of computation of a schedule.
     """
     data: dict = {}
+    week_times: list = []
+    week_time_limits: list = []
+    week_gaps: list = []
+    input_keys: list = []
 
     def simulate_computation(self, input: SimulatorInput):
         """Simulate the whole process of computation of a schedule.
         1. Loads the data from the input files.
         2. Evaluates the configuration.
-        3. For each week it calls the solver for compuatation of the week and then calls the HistorySimulator to update the history.
-        4. Calls the ScheduleValidator to evaluate the computed schedule.
+        3. Restores the weeks stored in input.resume_from (if given).
+        4. For each remaining week it calls the solver for compuatation of the week (unless the week is in input.solution_cache)
+           with the time limit given by input.time_budget (if given) and then calls the HistorySimulator to update the history.
+           The outcome of each week is stored into input.result_sink (if given).
+        5. Calls the ScheduleValidator to evaluate the computed schedule.
 
         Args:
             input (SimulatorInput): object containg all inputs
 
         Returns:
             None: if the process is stopped by the user after the configuration evaluation
-            (int, dict): the objective value of the computed schedule and the computed schedule as dictionary.
+            (int, ScheduleTensor): the objective value of the computed schedule and the computed schedule.
         """
         self._load_data(input)
 
-        if input.config_validator.evaluate_configuration(self.data) is CONF_EVAL.STOP:
+        if input.config_validator.evaluate_configuration(self.data, input.config_policy) is CONF_EVAL.STOP:
             return None
 
         time_limit_for_week = input.timelimit
         if time_limit_for_week == 0:
             time_limit_for_week = 10 + 10 * (self.data["num_nurses"] - 20)
 
+        if input.resources is not None:
+            input.solver.resources = input.resources
+        if input.lookahead is not None:
+            input.solver.lookahead = input.lookahead
+        if input.cp_sat_profile is not None:
+            input.solver.cp_sat_profile = get_profile(input.cp_sat_profile).name
+
         results = self._get_empty_results()
 
+        if input.time_budget is not None:
+            input.time_budget.start(self.data)
+
         fail = False
+        self.week_times = []
+        self.week_time_limits = []
+        self.week_gaps = []
+        self.input_keys = self._get_input_keys(input)
+        resumed_records = []
+        if input.resume_from is not None:
+            resumed_records = self._resume(input, results)
+        if input.result_sink is not None:
+            input.result_sink.clear()
+            for record in resumed_records:
+                input.result_sink.write_week(record)
+
         # accumulate results over weeks
         start = time.time()
-        for week_number in range(self.data["number_weeks"]):
+        for week_number in range(len(resumed_records), self.data["number_weeks"]):
             self.data["wd_data"] = self.data["all_wd_data"][week_number]
-            input.solver.compute_one_week(time_limit_for_week, self.data, results)
+            week_start = time.time()
+            self.data["week_instance"] = WeekInstance.from_data(self.data)
+            self.data["warm_start"] = None
+            if input.warm_start is not None:
+                self.data["warm_start"] = input.warm_start.get_week_start(self.data)
+            self.data["stopping_criteria"] = input.stopping_criteria
+            if input.time_budget is not None:
+                time_limit_for_week = input.time_budget.allocate(week_number, sum(self.week_times))
+                self.data["stopping_criteria"] = input.time_budget.stopping_criteria(time_limit_for_week, input.stopping_criteria)
+            self.week_time_limits.append(time_limit_for_week)
+            key = None
+            if input.solution_cache is not None:
+                key = solution_key(self.data, input.solver, time_limit_for_week, input.time_budget)
+            reused = self._reuse_week(input, results, week_number, key)
+            if not reused:
+                input.solver.compute_one_week(time_limit_for_week, self.data, results)
+            self.week_times.append(time.time() - week_start)
+            self.week_gaps.append(results.get((week_number, "gap")))
             if results[(week_number, "status")] == utils.STATUS_FAIL:
                 fail = True
+                self._write_week(input, results, week_number, None)
                 break
+            days = slice(week_number * self.data["num_days"], (week_number + 1) * self.data["num_days"])
+            week_assignments = as_assignments(results, self.data)[:, days]
+            if input.warm_start is not None:
+                input.warm_start.record_week(self.data, week_assignments)
+            if key is not None and not reused:
+                input.solution_cache.put(key, self._get_week_record(input, results, week_number, week_assignments))
             input.historySimulator.update_history_for_next_week(results, self.data)
+            self._write_week(input, results, week_number, week_assignments)
         end = time.time()
         print(f"time: {end-start}s")
         if fail:
             total_value = 99999
         else:
-            validator = ScheduleValidator()
+            validator = input.schedule_validator
             # total_value = validator.evaluate_schedule(results, self.data, 'outputs/validator_result.txt')
             total_value = validator.evaluate_schedule(results, self.data, input.validator_output_path)
 
@@ -88,22 +174,118 @@ class Simulator:
 
         return total_value, results
 
-    def _load_data(self, input: SimulatorInput):
-        """Loads the data from the input files.
+    def _reuse_week(self, input: SimulatorInput, results, week_number: int, key: str) -> bool:
+        """Stores the week from input.solution_cache into the results if it is there.
+
+        Args:
+            input (SimulatorInput): object containg all inputs
+            results (ScheduleTensor | dict): partially computed schedule
+            week_number (int): number of the week
+            key (str): solution_key of the week (None if there is no cache)
+
+        Returns:
+            bool: whether the week was reused
+        """
+        if key is None:
+            return False
+        record = input.solution_cache.get(key)
+        if record is None:
+            return False
+        store_week(results, week_number, record.assignments)
+        results[(week_number, "status")] = record.status
+        results[(week_number, "objective")] = record.objective
+        print(f"week {week_number} reused from the solution cache")
+        return True
+
+    def _write_week(self, input: SimulatorInput, results, week_number: int, week_assignments):
+        """Stores the outcome of the computed week into input.result_sink (if given).
+
+        Args:
+            input (SimulatorInput): object containg all inputs
+            results (ScheduleTensor | dict): partially computed schedule
+            week_number (int): number of the computed week
+            week_assignments (np.ndarray): assignments of the week (None if the week failed)
         """
-        with open(input.config_file_path) as config_file:
-            config_data = json.load(config_file)
+        if input.result_sink is None:
+            return
+        record = self._get_week_record(input, results, week_number, week_assignments)
+        record.history = None if week_assignments is None else copy.deepcopy(self.data["h0_data"])
+        input.result_sink.write_week(record)
+
+    def _get_week_record(self, input: SimulatorInput, results, week_number: int, week_assignments) -> WeekRecord:
+        """Returns the outcome of the computed week without the history."""
+        return WeekRecord(
+            week=week_number,
+            week_file_path=input.week_files_paths[week_number],
+            status=results[(week_number, "status")],
+            objective=results.get((week_number, "objective")),
+            solve_time=self.week_times[week_number],
+            time_limit=self.week_time_limits[week_number],
+            gap=self.week_gaps[week_number],
+            input_key=self.input_keys[week_number],
+            assignments=None if week_assignments is None else np.array(week_assignments, dtype=np.uint8),
+        )
 
-        with open(input.history_file_path) as history_file:
-            history_data = json.load(history_file)
+    def _get_input_keys(self, input: SimulatorInput) -> list[str]:
+        """Returns the content hash of the input files each week is computed from
+        (the configuration, the history, the scenario and the week files up to the week)."""
+        common_files = [input.config_file_path, input.history_file_path, input.scenario_file_path]
+        return [
+            content_key(common_files + input.week_files_paths[: week_number + 1])
+            for week_number in range(len(input.week_files_paths))
+        ]
 
-        with open(input.scenario_file_path) as scenario_file:
-            sc_data = json.load(scenario_file)
+    def _resume(self, input: SimulatorInput, results) -> list[WeekRecord]:
+        """Restores the successfully computed weeks stored in input.resume_from into the results and the history.
+        The weeks are restored from the first one up to the first week that failed or that was computed from other input files
+        (compared by the content of the files, see _get_input_keys).
 
-        wd_data = []
-        for week_file_path in input.week_files_paths:
-            with open(week_file_path) as week_file:
-                wd_data.append(json.load(week_file))
+        Args:
+            input (SimulatorInput): object containg all inputs
+            results (ScheduleTensor | dict): schedule for storing the restored weeks
+
+        Returns:
+            list[WeekRecord]: the restored weeks
+        """
+        restored = []
+        for week_number, record in enumerate(input.resume_from.read_weeks()):
+            if (
+                week_number >= self.data["number_weeks"]
+                or record.week != week_number
+                or record.status != utils.STATUS_OK
+                or record.input_key != self.input_keys[week_number]
+            ):
+                break
+            self.data["wd_data"] = self.data["all_wd_data"][week_number]
+            store_week(results, week_number, record.assignments)
+            results[(week_number, "status")] = record.status
+            results[(week_number, "objective")] = record.objective
+            if input.warm_start is not None:
+                input.warm_start.record_week(self.data, record.assignments)
+            self.data["h0_data"] = copy.deepcopy(record.history)
+            self.week_times.append(record.solve_time)
+            self.week_time_limits.append(record.time_limit)
+            self.week_gaps.append(record.gap)
+            restored.append(record)
+        if restored:
+            print(f"resumed after week {len(restored) - 1}")
+        return restored
+
+    def _load_data(self, input: SimulatorInput):
+        """Loads the data from the input files (from the ScenarioCache if the input has one).
+        """
+        if input.scenario_cache is not None:
+            config_data, history_data, history_data_original, sc_data, wd_data, compiled_scenario = input.scenario_cache.load(
+                input.config_file_path, input.history_file_path, input.scenario_file_path, input.week_files_paths
+            )
+        else:
+            config_data = self._read_json_file(input.config_file_path)
+            history_data = self._read_json_file(input.history_file_path)
+            sc_data = self._read_json_file(input.scenario_file_path)
+            wd_data = [self._read_json_file(week_file_path) for week_file_path in input.week_files_paths]
+            compiled_scenario = compile_scenario(config_data, history_data, sc_data, wd_data)
+            history_data_original = copy.deepcopy(history_data)
+            history_data = copy.deepcopy(history_data)
 
         # initialize self.data
         number_weeks = len(input.week_files_paths)
@@ -119,7 +301,7 @@ class Simulator:
 
         self.data["configuration"] = config_data
         self.data["h0_data"] = history_data
-        self.data["h0_data_original"] = copy.deepcopy(history_data)
+        self.data["h0_data_original"] = history_data_original
         self.data["sc_data"] = sc_data
         self.data["wd_data"] = wd_data[0]
         self.data["all_wd_data"] = wd_data
@@ -134,21 +316,27 @@ class Simulator:
         self.data["all_days"] = all_days
         self.data["all_skills"] = all_skills
         self.data["all_weeks"] = all_weeks
+        self.data["compiled_scenario"] = compiled_scenario
+
+    def _read_json_file(self, file_path: str):
+        """Reads and parses one input file.
+
+        Args:
+            file_path (str): path to the JSON file
+
+        Returns:
+            dict: parsed content of the file
+        """
+        with open(file_path) as file:
+            return json.load(file)
 
-    def _get_empty_results(self) -> dict:
-        """Return a dictionary for storing the results of compuations of all weeks.
+    def _get_empty_results(self) -> ScheduleTensor:
+        """Return a schedule for storing the results of compuations of all weeks.
 
         Returns:
-            dict: results with only zeroes.
+            ScheduleTensor: results with only zeroes.
         """
-        results = {}
-        for w in self.data["all_weeks"]:
-            for n in self.data["all_nurses"]:
-                for d in self.data["all_days"]:
-                    for s in self.data["all_shifts"]:
-                        for sk in self.data["all_skills"]:
-                            results[(n, d + 7 * w, s, sk)] = 0
-        return results
+        return ScheduleTensor.from_data(self.data)
 
     def _display_schedule(self, results, filename):
         """
@@ -164,12 +352,12 @@ class Simulator:
         schedule_table = np.zeros([num_nurses, num_days * num_shifts])
         legend = np.zeros([1, num_skills + 2])
 
-        for d in range(num_days):
-            for n in range(num_nurses):
-                for s in range(num_shifts):
-                    for sk in range(num_skills):
-                        if results[(n, d, s, sk)] == 1:
-                            schedule_table[n][d * num_shifts + s] = 0.85 - (0.175 * sk)
+        # the color of an assignment is given by its skill, the last assigned skill wins
+        skill_colors = 0.85 - (0.175 * np.arange(num_skills))
+        assigned = as_assignments(results, self.data)[:, :num_days] == 1
+        has_skill = assigned.any(axis=3)
+        last_skill = num_skills - 1 - np.argmax(assigned[..., ::-1], axis=3)
+        schedule_table[:, :] = np.where(has_skill, skill_colors[last_skill], 0).reshape(num_nurses, num_days * num_shifts)
 
         if self.data["configuration"]["h12"]:
             for w in self.data["all_weeks"]:
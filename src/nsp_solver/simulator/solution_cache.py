@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import replace
+
+import numpy as np
+
+from nsp_solver.simulator.result_sink import WeekRecord
+from nsp_solver.simulator.time_budget import TimeBudget
+from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.utils.week_key import week_model_key
+
+SIMPLE_TYPES = (bool, int, float, str, type(None))
+
+
+def _describe(value):
+    if isinstance(value, NSP_solver):
+        return solver_signature(value)
+    if isinstance(value, SIMPLE_TYPES):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_describe(item) for item in value)
+    return type(value).__qualname__
+
+
+def solver_signature(solver: NSP_solver) -> str:
+    """Returns the description of the solver that determines its solutions:
+    its class, name, resources and its public attributes (the parameters of the solver and its member solvers).
+    Attributes of other than simple types, solvers and their lists are described by their class.
+
+    Args:
+        solver (NSP_solver): the solver
+
+    Returns:
+        str: the description
+    """
+    parameters = sorted(
+        (name, _describe(value)) for name, value in vars(solver).items() if not name.startswith("_")
+    )
+    return repr((type(solver).__module__, type(solver).__qualname__, solver.name, solver.resources, parameters))
+
+
+def solution_key(data: dict, solver: NSP_solver, time_limit_for_week, time_budget: TimeBudget = None) -> str:
+    """Returns the hash of everything the solution of the week depends on: the data of the week (including
+    the history, so the weeks computed before), the warm start of the week, the solver and the time limit.
+    The data of the next week is included for the solvers with the lookahead
+    and the criteria that stop the week early if there are any.
+    If the time limit is given by the time budget, it depends on the time measured in the previous weeks,
+    so the week is keyed by the parameters of the budget instead of the time limit and the time without an improvement.
+
+    Args:
+        data (dict): dictionary that contains data from input files
+        solver (NSP_solver): the solver
+        time_limit_for_week (int): time limit for the computation of the week
+        time_budget (TimeBudget, optional): the budget that gave the time limit. Defaults to None.
+
+    Returns:
+        str: hexadecimal digest
+    """
+    digest = hashlib.sha256(week_model_key(data).encode())
+    digest.update(solver_signature(solver).encode())
+    stopping_criteria = data.get("stopping_criteria")
+    if time_budget is None:
+        digest.update(repr(time_limit_for_week).encode())
+    else:
+        digest.update(repr((time_budget.total_time, time_budget.stagnation, time_budget.minimum_time)).encode())
+        if stopping_criteria is not None and time_budget.stagnation is not None:
+            stopping_criteria = replace(stopping_criteria, no_improvement_time=None)
+    if stopping_criteria is not None:
+        digest.update(repr(stopping_criteria).encode())
+    warm_start = data.get("warm_start")
+    if warm_start is not None:
+        warm_start = np.asarray(warm_start, dtype=np.uint8)
+        digest.update(repr(warm_start.shape).encode())
+        digest.update(warm_start.tobytes())
+    week_number = data["h0_data"]["week"]
+    if solver.lookahead and week_number + 1 < data["number_weeks"]:
+        next_wd_data = data["all_wd_data"][week_number + 1]
+        digest.update(json.dumps(next_wd_data, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class SolutionCache:
+    """Cache of the successfully computed weeks keyed by solution_key.
+
+    The Simulator reuses a cached week instead of calling the solver, so the runs that share a prefix of weeks
+    (the same history file and the same first week files) compute only the weeks that differ.
+    This is exact only for deterministic solvers (SolverResources.deterministic and no dependency on the elapsed time),
+    otherwise it returns one of the solutions the solver could find.
+    If cache_dir is given, each week is also stored there as one JSON file shared by other processes and later runs.
+    """
+
+    def __init__(self, cache_dir: str = None):
+        """
+        Args:
+            cache_dir (str, optional): directory with the stored weeks. Defaults to None (memory only).
+        """
+        self.cache_dir = cache_dir
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> WeekRecord:
+        """Returns the week stored under the key or None."""
+        record = self.entries.get(key)
+        if record is None and self.cache_dir is not None:
+            record = self._read(key)
+            if record is not None:
+                self.entries[key] = record
+        if record is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return record
+
+    def put(self, key: str, record: WeekRecord):
+        """Stores the week under the key."""
+        self.entries[key] = record
+        if self.cache_dir is not None:
+            self._write(key, record)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _write(self, key: str, record: WeekRecord):
+        """Writes the week into a temporary file that is then renamed,
+        so that the processes sharing the cache never see a partially written week.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".json")
+        with os.fdopen(file_descriptor, "w") as file:
+            json.dump(record.to_dict(), file)
+        os.replace(tmp_path, self._path(key))
+
+    def _read(self, key: str) -> WeekRecord:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as file:
+                return WeekRecord.from_dict(json.load(file))
+        except (OSError, ValueError, KeyError):
+            logging.warning(f"Week {path} cannot be read, it is computed again")
+            os.remove(path)
+            return None
@@ -0,0 +1,95 @@
+from dataclasses import replace
+
+import numpy as np
+
+from nsp_solver.solver.stopping import StoppingCriteria
+
+
+def week_weights(data: dict) -> np.ndarray:
+    """Returns the size of the model of each week multiplied by its difficulty.
+    The size is the number of the nurses times the number of the required pairs of shift and skill on each day,
+    the difficulty is 1 plus the share of the working days of the nurses that are not on vacation
+    needed for the minimal coverage of the week.
+
+    Args:
+        data (dict): dictionary that contains data from input files
+
+    Returns:
+        np.ndarray: weight of each week
+    """
+    compiled = data["compiled_scenario"]
+    number_weeks = data["number_weeks"]
+    requirements = compiled.requirements[:number_weeks]
+    size = data["num_nurses"] * np.count_nonzero(requirements[..., 1], axis=(1, 2, 3))
+    available_days = (data["num_nurses"] - compiled.vacations[:number_weeks].sum(axis=1)) * data["num_days"]
+    tightness = requirements[..., 0].sum(axis=(1, 2, 3)) / np.maximum(available_days, 1)
+    return size * (1 + tightness)
+
+
+class TimeBudget:
+    """Class that splits the total time for the computation of all weeks among the weeks.
+    Each week gets the share of the remaining time given by its weight (see week_weights) among the weights
+    of the remaining weeks, so the time not used by the computed weeks is carried forward to the following weeks.
+    If the stagnation is given, the computation of a week stops early when its solution and its gap
+    have not improved for the given share of the time limit of the week (see StoppingCriteria).
+    """
+
+    def __init__(self, total_time: float, stagnation: float = None, minimum_time: float = 1.0):
+        """
+        Args:
+            total_time (float): time for the computation of all weeks in seconds
+            stagnation (float, optional): share of the time limit of a week after which the computation of the week
+                stops if it has not improved. Defaults to None (no early stop).
+            minimum_time (float, optional): the smallest time limit of a week in seconds. Defaults to 1.0.
+
+        Raises:
+            ValueError: if the total time or the minimum time is not positive or the stagnation is not in (0, 1]
+        """
+        if total_time <= 0 or minimum_time <= 0:
+            raise ValueError("the total time and the minimum time must be positive")
+        if stagnation is not None and not 0 < stagnation <= 1:
+            raise ValueError("the stagnation must be a share of the time limit of the week")
+        self.total_time = total_time
+        self.stagnation = stagnation
+        self.minimum_time = minimum_time
+        self._weights = None
+
+    def start(self, data: dict):
+        """Computes the weights of the weeks of the computation.
+
+        Args:
+            data (dict): dictionary that contains data from input files
+        """
+        self._weights = week_weights(data)
+
+    def allocate(self, week_number: int, spent: float) -> float:
+        """Returns the time limit of the week.
+
+        Args:
+            week_number (int): number of the week
+            spent (float): time spent by the computation of the previous weeks in seconds
+
+        Returns:
+            float: time limit of the week in seconds
+        """
+        remaining_weights = self._weights[week_number:]
+        if remaining_weights.sum() > 0:
+            share = remaining_weights[0] / remaining_weights.sum()
+        else:
+            share = 1 / len(remaining_weights)
+        return max(self.minimum_time, float((self.total_time - spent) * share))
+
+    def stopping_criteria(self, time_limit_for_week: float, criteria: StoppingCriteria = None) -> StoppingCriteria:
+        """Returns the criteria of the week: the given criteria with the time without an improvement
+        given by the stagnation (the given criteria if there is no stagnation).
+
+        Args:
+            time_limit_for_week (float): time limit of the week in seconds
+            criteria (StoppingCriteria, optional): the criteria of all weeks. Defaults to None.
+
+        Returns:
+            StoppingCriteria: the criteria of the week (None if there are no criteria)
+        """
+        if self.stagnation is None:
+            return criteria
+        return replace(criteria or StoppingCriteria(), no_improvement_time=self.stagnation * time_limit_for_week)
@@ -0,0 +1,274 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+import time
+
+import numpy as np
+
+# variable 0 of each model is the constant 0 that stands for the assignments that cannot be made
+ZERO = 0
+
+
+@dataclass
+class ConstraintIR:
+    """Solver-independent model of one week (or of the weeks of a window): integer variables, linear rows
+    and a linear objective to be minimized.
+    The rows are stored in the compressed sparse row format: the coefficients of row r are
+    coefficients[row_starts[r]: row_starts[r + 1]] of the variables columns[row_starts[r]: row_starts[r + 1]].
+    The senses are "L" (<=), "G" (>=) and "E" (==).
+    The variable ZERO is the constant 0, the assignments that cannot be made refer to it in shifts_with_skills.
+    The first skeleton[0] variables and skeleton[1] rows do not depend on the week data and the history.
+    """
+    lb: np.ndarray
+    ub: np.ndarray
+    names: list
+    row_starts: np.ndarray
+    columns: np.ndarray
+    coefficients: np.ndarray
+    senses: np.ndarray
+    rhs: np.ndarray
+    objective_columns: np.ndarray
+    objective_coefficients: np.ndarray
+    shifts_with_skills: np.ndarray
+    skeleton: np.ndarray
+
+    @property
+    def num_variables(self) -> int:
+        return len(self.lb)
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.rhs)
+
+    @property
+    def assignment_mask(self) -> np.ndarray:
+        """Returns True for each assignment that is a variable (not the constant ZERO), shape (nurses, days, shifts, skills)."""
+        return self.shifts_with_skills != ZERO
+
+    def rows(self, integer: bool = False, first_row: int = 0, last_row: int = None):
+        """Yields the rows as tuples (columns, coefficients, sense, rhs) of Python lists and numbers.
+
+        Args:
+            integer (bool, optional): whether to return the coefficients and rhs as integers
+                (raises ValueError if some coefficient is not an integer). As all variables are integers,
+                a fractional rhs is rounded down in "L" rows and up in "G" rows. Defaults to False.
+            first_row (int, optional): the first yielded row. Defaults to 0.
+            last_row (int, optional): the row after the last yielded row. Defaults to all rows.
+        """
+        coefficients, rhs = self.coefficients, self.rhs
+        if integer:
+            coefficients = _as_integers(coefficients)
+            rhs = np.where(self.senses == "L", np.floor(rhs), np.where(self.senses == "G", np.ceil(rhs), rhs))
+            rhs = _as_integers(rhs)
+        columns, coefficients, rhs = self.columns.tolist(), coefficients.tolist(), rhs.tolist()
+        row_starts = self.row_starts.tolist()
+        senses = self.senses.tolist()
+        for r in range(first_row, self.num_rows if last_row is None else last_row):
+            start, end = row_starts[r], row_starts[r + 1]
+            yield columns[start:end], coefficients[start:end], senses[r], rhs[r]
+
+    def objective(self, integer: bool = False) -> tuple:
+        """Returns the objective as a tuple (columns, coefficients) of Python lists.
+
+        Args:
+            integer (bool, optional): whether to return the coefficients as integers
+                (raises ValueError if some coefficient is not an integer). Defaults to False.
+        """
+        coefficients = _as_integers(self.objective_coefficients) if integer else self.objective_coefficients
+        return self.objective_columns.tolist(), coefficients.tolist()
+
+
+def _as_integers(values: np.ndarray) -> np.ndarray:
+    integers = np.rint(values)
+    if not np.array_equal(integers, values):
+        raise ValueError("CP solvers need integer coefficients")
+    return integers.astype(np.int64)
+
+
+class IRBuilder:
+    """Collects the variables, rows and objective terms of a model and returns them as the ConstraintIR.
+
+    The variables and rows are added in blocks of NumPy arrays (or one by one for irregular rows),
+    the terms of the constant ZERO are left out of the rows and the objective and the coefficients
+    of a variable repeated in the objective are summed. The time spent on each family of constraints
+    and the number of its rows are recorded in build_times.
+    """
+
+    def __init__(self, debug_names: bool = False):
+        """
+        Args:
+            debug_names (bool, optional): gives the variables readable names (e.g. shift_with_skill_n0_d1_s2_sk3,
+                x<index> for the auxiliary variables), which is useful for writing out the model. Defaults to False.
+        """
+        self.debug_names = debug_names
+        self.build_times = {}
+        self._lb = [0]
+        self._ub = [0]
+        self._names = ["zero" if debug_names else None]
+        self._lengths = []
+        self._columns = []
+        self._coefficients = []
+        self._senses = []
+        self._rhs = []
+        self._num_rows = 0
+        self._pending = ([], [], [], [], [])
+        self._objective_columns = []
+        self._objective_coefficients = []
+        self._skeleton = (1, 0)
+
+    @property
+    def num_variables(self) -> int:
+        return len(self._lb)
+
+    @property
+    def num_rows(self) -> int:
+        return self._num_rows
+
+    @staticmethod
+    def _name(name: str, index: int) -> str:
+        """Returns the given name or the name of the unnamed variable of the index."""
+        return f"x{index}" if name is None else name
+
+    def add_variable(self, lb: int = 0, ub: int = 1, name: str = None) -> int:
+        """Adds one integer variable and returns its index."""
+        self._lb.append(lb)
+        self._ub.append(ub)
+        self._names.append(self._name(name, len(self._names)) if self.debug_names else None)
+        return len(self._lb) - 1
+
+    def add_variables(self, shape, lb=0, ub=1, name: str = None) -> np.ndarray:
+        """Adds a block of integer variables indexed by all combinations of the indices in the given shape.
+
+        Args:
+            shape (int | tuple): shape of the block
+            lb (int | np.ndarray, optional): lower bounds broadcast to the shape. Defaults to 0.
+            ub (int | np.ndarray, optional): upper bounds broadcast to the shape. Defaults to 1.
+            name (str, optional): format of the name of a variable filled with its position in the block,
+                used only with debug_names. Defaults to None.
+
+        Returns:
+            np.ndarray: indices of the variables of the given shape
+        """
+        first = len(self._lb)
+        indices = np.arange(first, first + int(np.prod(shape)), dtype=np.int64).reshape(shape)
+        self._lb.extend(np.broadcast_to(lb, indices.shape).ravel().tolist())
+        self._ub.extend(np.broadcast_to(ub, indices.shape).ravel().astype(np.int64).tolist())
+        if self.debug_names and name is not None:
+            self._names.extend(name.format(*position) for position in np.ndindex(*indices.shape))
+        elif self.debug_names:
+            self._names.extend(self._name(None, index) for index in indices.ravel().tolist())
+        else:
+            self._names.extend([None] * indices.size)
+        return indices
+
+    def add_masked_variables(self, mask: np.ndarray, ub=1, name: str = None) -> np.ndarray:
+        """Adds a binary variable for each True of the mask, the other positions are the constant ZERO.
+
+        Args:
+            mask (np.ndarray): positions of the variables
+            ub (int | np.ndarray, optional): upper bounds of the variables broadcast to the mask. Defaults to 1.
+            name (str, optional): format of the name of a variable filled with its position, used only with debug_names.
+
+        Returns:
+            np.ndarray: indices of the variables of the shape of the mask
+        """
+        positions = np.argwhere(mask)
+        indices = np.full(mask.shape, ZERO, dtype=np.int64)
+        indices[mask] = self.add_variables(len(positions), ub=np.broadcast_to(ub, mask.shape)[mask])
+        if self.debug_names and name is not None:
+            self._names[len(self._names) - len(positions):] = [name.format(*position) for position in positions.tolist()]
+        return indices
+
+    def add_row(self, columns: list, coefficients: list, sense: str, rhs):
+        """Adds one row sum(coefficients * columns) sense rhs."""
+        lengths, all_columns, all_coefficients, senses, all_rhs = self._pending
+        lengths.append(len(columns))
+        all_columns.extend(columns)
+        all_coefficients.extend(coefficients)
+        senses.append(sense)
+        all_rhs.append(rhs)
+        self._num_rows += 1
+
+    def add_rows(self, columns: np.ndarray, coefficients, sense: str, rhs):
+        """Adds one row for each row of the columns.
+
+        Args:
+            columns (np.ndarray): variables of the rows, shape (rows, terms)
+            coefficients (np.ndarray | int): coefficients broadcast to the shape of the columns
+            sense (str): sense of all rows
+            rhs (np.ndarray | int): right-hand sides broadcast to the number of rows
+        """
+        columns = np.asarray(columns, dtype=np.int64)
+        if len(columns) == 0:
+            return
+        self._flush()
+        count, terms = columns.shape
+        self._lengths.append(np.full(count, terms, dtype=np.int64))
+        self._columns.append(columns.ravel())
+        self._coefficients.append(np.broadcast_to(coefficients, columns.shape).ravel().astype(np.float64))
+        self._senses.append(np.full(count, sense, dtype="<U1"))
+        self._rhs.append(np.broadcast_to(rhs, (count,)).astype(np.float64))
+        self._num_rows += count
+
+    def add_objective(self, columns, coefficients):
+        """Adds the terms sum(coefficients * columns) to the objective, the coefficients are broadcast to the columns."""
+        columns = np.asarray(columns, dtype=np.int64).ravel()
+        self._objective_columns.extend(columns.tolist())
+        self._objective_coefficients.extend(np.broadcast_to(coefficients, columns.shape).tolist())
+
+    def mark_skeleton(self):
+        """Records that the variables and rows added so far do not depend on the week data and the history."""
+        self._skeleton = (len(self._lb), self._num_rows)
+
+    @contextmanager
+    def family(self, name: str):
+        """Records the time spent on adding the family of constraints of the given name and the number of its rows."""
+        start, rows = time.perf_counter(), self._num_rows
+        yield
+        seconds, count = self.build_times.get(name, (0.0, 0))
+        self.build_times[name] = (seconds + time.perf_counter() - start, count + self._num_rows - rows)
+
+    def _flush(self):
+        lengths, columns, coefficients, senses, rhs = self._pending
+        if not lengths:
+            return
+        self._lengths.append(np.array(lengths, dtype=np.int64))
+        self._columns.append(np.array(columns, dtype=np.int64))
+        self._coefficients.append(np.array(coefficients, dtype=np.float64))
+        self._senses.append(np.array(senses, dtype="<U1"))
+        self._rhs.append(np.array(rhs, dtype=np.float64))
+        self._pending = ([], [], [], [], [])
+
+    def to_ir(self, shifts_with_skills: np.ndarray) -> ConstraintIR:
+        """Returns the collected model as the ConstraintIR.
+
+        Args:
+            shifts_with_skills (np.ndarray): indices of the assignment variables of shape (nurses, days, shifts, skills)
+        """
+        self._flush()
+        lengths = np.concatenate(self._lengths + [np.zeros(0, dtype=np.int64)])
+        columns = np.concatenate(self._columns + [np.zeros(0, dtype=np.int64)])
+        coefficients = np.concatenate(self._coefficients + [np.zeros(0)])
+        # the terms of the constant are 0
+        kept = columns != ZERO
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        lengths = np.bincount(rows[kept], minlength=len(lengths))
+
+        objective_columns = np.array(self._objective_columns, dtype=np.int64)
+        objective_coefficients = np.array(self._objective_coefficients, dtype=np.float64)
+        objective_columns, positions = np.unique(objective_columns, return_inverse=True)
+        objective_coefficients = np.bincount(positions, objective_coefficients, minlength=len(objective_columns))
+        objective_kept = (objective_columns != ZERO) & (objective_coefficients != 0)
+        return ConstraintIR(
+            lb=np.array(self._lb, dtype=np.int64),
+            ub=np.array(self._ub, dtype=np.int64),
+            names=list(self._names),
+            row_starts=np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+            columns=columns[kept],
+            coefficients=coefficients[kept],
+            senses=np.concatenate(self._senses + [np.zeros(0, dtype="<U1")]),
+            rhs=np.concatenate(self._rhs + [np.zeros(0)]),
+            objective_columns=objective_columns[objective_kept],
+            objective_coefficients=objective_coefficients[objective_kept],
+            shifts_with_skills=shifts_with_skills,
+            skeleton=np.array(self._skeleton, dtype=np.int64),
+        )
@@ -0,0 +1,99 @@
+from dataclasses import dataclass, field
+import os
+
+DEFAULT_PROFILE = "default"
+
+
+@dataclass(frozen=True)
+class CpSatProfile:
+    """Data class describing a named set of parameters of CP-SAT.
+    It contains:
+    the name of the profile,
+    the values of the fields of SatParameters that are set after the parameters given by the SolverResources,
+    whether the time limit is the deterministic time of CP-SAT instead of the wall time
+    (the wall time is then limited only by a multiple of the time limit).
+    """
+    name: str
+    parameters: dict = field(default_factory=dict)
+    deterministic_time: bool = False
+
+    def apply(self, solver, time_limit: float):
+        """Sets the parameters and the time limit of the solver.
+
+        Args:
+            solver (CpSolver): the CP-SAT solver
+            time_limit (float): time limit in seconds
+        """
+        for name, value in self.parameters.items():
+            setattr(solver.parameters, name, value)
+        if self.deterministic_time:
+            solver.parameters.max_deterministic_time = time_limit
+            solver.parameters.max_time_in_seconds = 10 * time_limit
+        else:
+            solver.parameters.max_time_in_seconds = time_limit
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in [
+        # the defaults of CP-SAT (with the full presolve)
+        CpSatProfile(DEFAULT_PROFILE),
+        # a good schedule quickly: no LP relaxation, no symmetries and a short presolve
+        CpSatProfile(
+            "fast-feasible",
+            {"linearization_level": 0, "symmetry_level": 0, "cp_model_probing_level": 0, "max_presolve_iterations": 1},
+        ),
+        # better schedules for time limits of at least 10 s per week: the full LP relaxation without the probing
+        # of the presolve, with the probing the first solution of some weeks is not found within the time limit
+        CpSatProfile("quality", {"linearization_level": 2, "cp_model_probing_level": 0}),
+        # the same schedules in repeated runs: a fixed seed, interleaved workers and the deterministic time
+        CpSatProfile("deterministic-benchmark", {"random_seed": 0, "interleave_search": True}, deterministic_time=True),
+        # all cores of the machine for the portfolio of the workers
+        CpSatProfile("multi-core", {"num_search_workers": os.cpu_count() or 1, "interleave_search": False}),
+    ]
+}
+
+
+def get_profile(name: str) -> CpSatProfile:
+    """Returns the profile of the given name.
+
+    Args:
+        name (str): name of the profile, one of PROFILES
+
+    Raises:
+        ValueError: if there is no profile of the name
+
+    Returns:
+        CpSatProfile: the profile
+    """
+    if name not in PROFILES:
+        raise ValueError(f"Unknown CP-SAT profile {name}, expected one of {tuple(PROFILES)}")
+    return PROFILES[name]
+
+
+def set_cp_sat_resources(resources, solver):
+    """Maps the resources of a solver to the parameters of CP-SAT.
+    With more workers the deterministic search interleaves the workers.
+
+    Args:
+        resources (SolverResources): the resources of the solver
+        solver (CpSolver): the CP-SAT solver
+    """
+    solver.parameters.num_search_workers = resources.threads
+    if resources.threads > 1:
+        solver.parameters.interleave_search = resources.deterministic
+    if resources.memory_limit is not None:
+        solver.parameters.max_memory_in_mb = resources.memory_limit
+
+
+def set_cp_sat_parameters(resources, profile: str, solver, time_limit: float):
+    """Sets the resources, the parameters of the profile and the time limit of CP-SAT.
+
+    Args:
+        resources (SolverResources): the resources of the solver
+        profile (str): name of the profile, one of PROFILES
+        solver (CpSolver): the CP-SAT solver
+        time_limit (float): time limit in seconds
+    """
+    set_cp_sat_resources(resources, solver)
+    get_profile(profile).apply(solver, time_limit)
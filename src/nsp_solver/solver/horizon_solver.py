@@ -0,0 +1,141 @@
+import numpy as np
+from ortools.sat.python import cp_model
+
+from nsp_solver.solver.cp_sat_profiles import set_cp_sat_parameters
+from nsp_solver.solver.ir_compilers import compile_to_cp_sat
+from nsp_solver.solver.model_generator import HorizonWindow, build_horizon_ir
+from nsp_solver.solver.nsp_or_tools import StoppingCallback
+from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import as_assignments, store_week
+
+
+class HorizonSolver(NSP_solver):
+    """Child Class from NSP_solver that computes the schedule of several weeks at once with one CP-SAT model
+    whose days are indexed from the start of the window instead of the start of the week.
+
+    By default the window covers all weeks, otherwise the schedule is computed in rolling windows of the given
+    number of weeks: the window starts at the first week that has not been computed yet and the weeks
+    of its overlap with the next window are computed again in the next window.
+    The window is computed when the Simulator asks for its first week, the other weeks are stored into the results
+    when the Simulator asks for them, so the history is still updated after each week.
+    The model is generated by the same model generator as the models of one week (see model_generator.py),
+    so it contains the constraints enabled by the configuration with the weights and the counting of the ScheduleValidator
+    and the objective value of the model of all weeks is the value of the schedule. The limits of the totals
+    of the whole horizon are scaled down to the weeks up to the end of the window for windows before the last one.
+    """
+    name = 'HORIZON'
+
+    def __init__(self, window: int = None, overlap: int = 0):
+        """
+        Args:
+            window (int, optional): the number of weeks computed together. Defaults to None (all weeks).
+            overlap (int, optional): the number of the last weeks of a window that are computed again
+                in the next window. Defaults to 0.
+        """
+        if window is not None and window < 1:
+            raise ValueError(f"The window must have at least one week, got {window}")
+        if overlap < 0 or (window is not None and overlap >= window):
+            raise ValueError(f"The overlap must be smaller than the window, got {overlap}")
+        self.window = window
+        self.overlap = overlap
+        self._planned = None
+
+    def get_window_weeks(self, first_week: int, number_weeks: int) -> tuple[range, range]:
+        """Returns the weeks of the window that starts with the given week and the weeks whose schedule is kept.
+
+        Args:
+            first_week (int): the first week of the window
+            number_weeks (int): the number of weeks of the whole horizon
+
+        Returns:
+            (range, range): the weeks of the window and the weeks that are not computed again by the next window
+        """
+        last_week = number_weeks if self.window is None else min(first_week + self.window, number_weeks)
+        weeks = range(first_week, last_week)
+        if weeks.stop == number_weeks:
+            return weeks, weeks
+        return weeks, weeks[: len(weeks) - self.overlap]
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        """Computes a schedule for a week given a time limit and data.
+        The schedule of the week is computed together with the other weeks of its window,
+        which gets the time limit of each of its kept weeks.
+
+        Args:
+            time_limit_for_week (int): time limit for finding a schedule as optimal as possible
+            data (dict): dictionary that contains data from input files
+            results (dict): dictionary used to store partially computed schedule
+        """
+        week_number = data["h0_data"]["week"]
+        if self.restore_planned_week(data, results, week_number):
+            return
+
+        weeks, kept_weeks = self.get_window_weeks(week_number, data["number_weeks"])
+        window = HorizonWindow.from_data(data, results, weeks)
+        model, ir = self.build_model(data, window)
+
+        solver = cp_model.CpSolver()
+        solver.parameters.log_search_progress = False
+        solver.parameters.log_to_stdout = False
+        set_cp_sat_parameters(self.resources, self.cp_sat_profile, solver, time_limit_for_week * len(kept_weeks))
+        with StoppingCallback(solver, data.get("stopping_criteria")) as stopping:
+            status = solver.Solve(model, stopping)
+
+        self._planned = None
+        if status != cp_model.FEASIBLE and status != cp_model.OPTIMAL:
+            results[(week_number, "status")] = utils.STATUS_FAIL
+            return
+        print(f"obj. value of weeks {weeks.start}-{weeks.stop - 1}: {solver.ObjectiveValue()}")
+        solution = np.asarray(solver.response_proto.solution)
+        self._planned = {
+            "sc_data": data["sc_data"],
+            "weeks": list(kept_weeks),
+            "first_week": week_number,
+            "values": solution[ir.shifts_with_skills].astype(np.uint8),
+            "optimal": status == cp_model.OPTIMAL,
+            "objective": solver.ObjectiveValue(),
+        }
+        self.restore_planned_week(data, results, week_number)
+
+    def restore_planned_week(self, data, results, week_number: int) -> bool:
+        """Stores the week computed by the last window into the results, if the week belongs to the window
+        and the weeks before it are still those computed by the window.
+
+        Args:
+            data (dict): dictionary that contains data from input files
+            results (ScheduleTensor | dict): partially computed schedule
+            week_number (int): number of the week
+
+        Returns:
+            bool: whether the week was stored
+        """
+        planned = self._planned
+        if planned is None or planned["sc_data"] is not data["sc_data"] or week_number not in planned["weeks"]:
+            return False
+        num_days = data["num_days"]
+        first_day = num_days * planned["first_week"]
+        offset = num_days * week_number - first_day
+        previous_days = as_assignments(results, data)[:, first_day: first_day + offset]
+        if not np.array_equal(previous_days, planned["values"][:, :offset]):
+            return False
+
+        planned["weeks"].remove(week_number)
+        results[(week_number, "status")] = utils.STATUS_OK
+        results[(week_number, "optimal")] = planned["optimal"]
+        results[(week_number, "objective")] = planned["objective"]
+        store_week(results, week_number, planned["values"][:, offset: offset + num_days])
+        return True
+
+    def build_model(self, data, window: HorizonWindow):
+        """Builds the model of the weeks of the window with the model generator (see model_generator.py).
+
+        Args:
+            data (dict): dictionary that contains data from input files
+            window (HorizonWindow): the weeks of the model
+
+        Returns:
+            (CpModel, ConstraintIR): the model and the model it was compiled from
+        """
+        ir = build_horizon_ir(data, window)
+        return compile_to_cp_sat(ir), ir
@@ -0,0 +1,126 @@
+import cplex
+from docplex.cp.model import CpoModel
+from docplex.cp.modeler import scal_prod
+from ortools.sat.python import cp_model
+
+from nsp_solver.solver.constraint_ir import ConstraintIR
+
+
+def compile_to_cplex(ir: ConstraintIR, model=None):
+    """Adds the model to a CPLEX model with one call per part of the model.
+
+    Args:
+        ir (ConstraintIR): the model of the week
+        model (optional): CPLEX model. Defaults to a new one.
+
+    Returns:
+        CPLEX model whose variables have the indices of the IR
+    """
+    if model is None:
+        model = cplex.Cplex()
+    names = ir.names if all(name is not None for name in ir.names) else None
+    model.variables.add(
+        names=names, lb=ir.lb.tolist(), ub=ir.ub.tolist(), types=["I"] * ir.num_variables
+    )
+    model.linear_constraints.add(
+        lin_expr=[cplex.SparsePair(columns, coefficients) for columns, coefficients, _, _ in ir.rows()],
+        senses=ir.senses.tolist(),
+        rhs=ir.rhs.tolist(),
+    )
+    model.objective.set_sense(model.objective.sense.minimize)
+    model.objective.set_linear(zip(*ir.objective()))
+    return model
+
+
+def _add_cp_sat_variables(proto, ir: ConstraintIR, first: int, last: int):
+    for lb, ub, name in zip(ir.lb[first:last].tolist(), ir.ub[first:last].tolist(), ir.names[first:last]):
+        variable = proto.variables.add()
+        variable.domain.extend([lb, ub])
+        if name is not None:
+            variable.name = name
+
+
+def _add_cp_sat_rows(proto, ir: ConstraintIR, first_row: int, last_row: int):
+    for columns, coefficients, sense, rhs in ir.rows(integer=True, first_row=first_row, last_row=last_row):
+        linear = proto.constraints.add().linear
+        linear.vars.extend(columns)
+        linear.coeffs.extend(coefficients)
+        if sense == "L":
+            linear.domain.extend([cp_model.INT_MIN, rhs])
+        elif sense == "G":
+            linear.domain.extend([rhs, cp_model.INT_MAX])
+        else:
+            linear.domain.extend([rhs, rhs])
+
+
+def compile_skeleton_to_cp_sat(ir: ConstraintIR) -> cp_model.CpModel:
+    """Writes only the variables and rows of the skeleton (see ConstraintIR) into a CP-SAT model,
+    which can be cloned and completed by compile_to_cp_sat for each week with the same skeleton.
+
+    Args:
+        ir (ConstraintIR): the model of the week
+
+    Returns:
+        cp_model.CpModel: model of the skeleton without an objective
+    """
+    model = cp_model.CpModel()
+    num_variables, num_rows = ir.skeleton.tolist()
+    _add_cp_sat_variables(model.Proto(), ir, 0, num_variables)
+    _add_cp_sat_rows(model.Proto(), ir, 0, num_rows)
+    return model
+
+
+def compile_to_cp_sat(ir: ConstraintIR, model: cp_model.CpModel = None) -> cp_model.CpModel:
+    """Writes the model directly into the protocol buffer of a CP-SAT model.
+
+    Args:
+        ir (ConstraintIR): the model of the week
+        model (cp_model.CpModel, optional): a clone of the model compiled by compile_skeleton_to_cp_sat
+            from a model with the same skeleton, whose variable bounds are replaced by those of the IR
+            and which gets the rest of the model. Defaults to a new model.
+
+    Returns:
+        cp_model.CpModel: model whose variables have the indices of the IR
+    """
+    first_variable, first_row = 0, 0
+    if model is None:
+        model = cp_model.CpModel()
+    else:
+        first_variable, first_row = ir.skeleton.tolist()
+        for variable, lb, ub in zip(model.Proto().variables, ir.lb[:first_variable].tolist(), ir.ub[:first_variable].tolist()):
+            variable.domain.clear()
+            variable.domain.extend([lb, ub])
+    proto = model.Proto()
+    _add_cp_sat_variables(proto, ir, first_variable, ir.num_variables)
+    _add_cp_sat_rows(proto, ir, first_row, ir.num_rows)
+    columns, coefficients = ir.objective(integer=True)
+    proto.objective.vars.extend(columns)
+    proto.objective.coeffs.extend(coefficients)
+    return model
+
+
+def compile_to_docplex(ir: ConstraintIR):
+    """Adds the model to a docplex CP model.
+
+    Args:
+        ir (ConstraintIR): the model of the week
+
+    Returns:
+        (CpoModel, list): the model and its variables in the order of the IR
+    """
+    model = CpoModel()
+    variables = [
+        model.integer_var(min=lb, max=ub, name=name)
+        for lb, ub, name in zip(ir.lb.tolist(), ir.ub.tolist(), ir.names)
+    ]
+    for columns, coefficients, sense, rhs in ir.rows(integer=True):
+        expression = scal_prod([variables[column] for column in columns], coefficients)
+        if sense == "L":
+            model.add(expression <= rhs)
+        elif sense == "G":
+            model.add(expression >= rhs)
+        else:
+            model.add(expression == rhs)
+    columns, coefficients = ir.objective(integer=True)
+    model.add(model.minimize(scal_prod([variables[column] for column in columns], coefficients)))
+    return model, variables
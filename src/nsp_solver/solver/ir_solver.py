@@ -0,0 +1,136 @@
+import cplex
+from docplex.cp.solution import CpoModelSolution
+import numpy as np
+from ortools.sat.python import cp_model
+
+from nsp_solver.solver.constraint_ir import ConstraintIR
+from nsp_solver.solver.cp_sat_profiles import set_cp_sat_parameters
+from nsp_solver.solver.ir_compilers import compile_to_cp_sat, compile_to_cplex, compile_to_docplex
+from nsp_solver.solver.model_cache import ModelCache
+from nsp_solver.solver.model_generator import build_week_ir
+from nsp_solver.solver.nsp_cplex import StoppingInfoCallback, set_cplex_resources
+from nsp_solver.solver.nsp_docplex import StoppingCpoCallback, docplex_resources_parameters
+from nsp_solver.solver.nsp_or_tools import StoppingCallback
+from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.solver.stopping import StoppingCriteria
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import store_week
+
+BACKENDS = ("cp-sat", "cplex", "docplex")
+
+
+class IR_Solver(NSP_solver):
+    """Child Class from NSP_solver that generates the model of each week once as the solver-independent ConstraintIR
+    and compiles it into the model of the chosen engine: CP-SAT, CPLEX or CP Optimizer (docplex).
+    Unlike the solvers of the engines, it can take the generated models from a ModelCache.
+    """
+
+    def __init__(self, backend: str = "cp-sat", model_cache: ModelCache = None):
+        """
+        Args:
+            backend (str, optional): engine that solves the compiled model, one of BACKENDS. Defaults to "cp-sat".
+            model_cache (ModelCache, optional): cache of the models of weeks that were already generated.
+                Defaults to None (each model is generated).
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend}, expected one of {BACKENDS}")
+        self.backend = backend
+        self.model_cache = model_cache
+        self.name = f"IR_{backend.replace('-', '_').upper()}"
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        """Computes a schedule for a week given a time limit and data.
+
+        Args:
+            time_limit_for_week (int): time limit for finding a schedule as optimal as possible
+            data (dict): dictionary that contains data from input files
+            results (dict): dictionary used to store partially computed schedule
+        """
+        week_number = data["h0_data"]["week"]
+        ir = build_week_ir(data) if self.model_cache is None else self.model_cache.get_or_build(data)
+        solve = {"cp-sat": self.solve_cp_sat, "cplex": self.solve_cplex, "docplex": self.solve_docplex}[self.backend]
+        week_values, objective, optimal = solve(ir, time_limit_for_week, data.get("warm_start"), data.get("stopping_criteria"))
+
+        if week_values is None:
+            results[(week_number, "status")] = utils.STATUS_FAIL
+            return
+        results[(week_number, "status")] = utils.STATUS_OK
+        results[(week_number, "optimal")] = optimal
+        results[(week_number, "objective")] = objective
+        print(f"obj. value: {objective}")
+        store_week(results, week_number, week_values)
+
+    def solve_cp_sat(self, ir: ConstraintIR, time_limit_for_week, warm_start, stopping_criteria: StoppingCriteria = None):
+        """Solves the model by CP-SAT.
+
+        Returns:
+            (np.ndarray, float, bool): the assignments of the week (None if no solution was found),
+            the objective value and whether the solution is optimal
+        """
+        model = compile_to_cp_sat(ir)
+        mask = ir.assignment_mask
+        if warm_start is not None:
+            model.Proto().solution_hint.vars.extend(ir.shifts_with_skills[mask].tolist())
+            model.Proto().solution_hint.values.extend(np.asarray(warm_start, dtype=np.int64)[mask].tolist())
+        solver = cp_model.CpSolver()
+        set_cp_sat_parameters(self.resources, self.cp_sat_profile, solver, time_limit_for_week)
+        with StoppingCallback(solver, stopping_criteria) as stopping:
+            status = solver.Solve(model, stopping)
+        if status != cp_model.FEASIBLE and status != cp_model.OPTIMAL:
+            return None, None, False
+        solution = np.asarray(solver.response_proto.solution)
+        return solution[ir.shifts_with_skills].astype(np.uint8), solver.ObjectiveValue(), status == cp_model.OPTIMAL
+
+    def solve_cplex(self, ir: ConstraintIR, time_limit_for_week, warm_start, stopping_criteria: StoppingCriteria = None):
+        """Solves the model by CPLEX.
+
+        Returns:
+            (np.ndarray, float, bool): the assignments of the week (None if no solution was found),
+            the objective value and whether the solution is optimal
+        """
+        model = cplex.Cplex()
+        model.set_results_stream(None)
+        model.set_log_stream(None)
+        set_cplex_resources(self.resources, model)
+        model.parameters.timelimit.set(time_limit_for_week)
+        model.parameters.mip.tolerances.absmipgap.set(0.0)
+        model.parameters.emphasis.mip.set(model.parameters.emphasis.mip.values.optimality)
+        compile_to_cplex(ir, model)
+        mask = ir.assignment_mask
+        if warm_start is not None:
+            model.MIP_starts.add(
+                cplex.SparsePair(ir.shifts_with_skills[mask].tolist(), np.asarray(warm_start, dtype=np.int64)[mask].tolist()),
+                model.MIP_starts.effort_level.repair,
+                "warm_start",
+            )
+        StoppingInfoCallback.register(model, stopping_criteria)
+        model.solve()
+        sol = model.solution
+        if not sol.is_primal_feasible():
+            return None, None, False
+        values = np.rint(sol.get_values(ir.shifts_with_skills.ravel().tolist())).astype(np.uint8)
+        optimal = sol.get_status() in (sol.status.MIP_optimal, sol.status.optimal_tolerance)
+        return values.reshape(ir.shifts_with_skills.shape), sol.get_objective_value(), optimal
+
+    def solve_docplex(self, ir: ConstraintIR, time_limit_for_week, warm_start, stopping_criteria: StoppingCriteria = None):
+        """Solves the model by CP Optimizer.
+
+        Returns:
+            (np.ndarray, float, bool): the assignments of the week (None if no solution was found),
+            the objective value and whether the solution is optimal
+        """
+        model, variables = compile_to_docplex(ir)
+        assignment_variables = [variables[column] for column in ir.shifts_with_skills.ravel().tolist()]
+        mask = ir.assignment_mask
+        if warm_start is not None:
+            starting_point = CpoModelSolution()
+            for column, value in zip(ir.shifts_with_skills[mask].tolist(), np.asarray(warm_start, dtype=np.int64)[mask].tolist()):
+                starting_point.add_integer_var_solution(variables[column], value)
+            model.set_starting_point(starting_point)
+        StoppingCpoCallback.register(model, stopping_criteria)
+        sol = model.solve(TimeLimit=time_limit_for_week, LogVerbosity='Quiet', **docplex_resources_parameters(self.resources))
+        if not sol:
+            return None, None, False
+        var_solutions = sol.get_solution().var_solutions_dict
+        values = np.array([var_solutions[id(var)].get_value() for var in assignment_variables], dtype=np.uint8)
+        return values.reshape(ir.shifts_with_skills.shape), sol.get_objective_value(), sol.is_solution_optimal()
@@ -0,0 +1,212 @@
+from abc import ABC, abstractmethod
+import random
+import time
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+from nsp_solver.solver.constraint_ir import ConstraintIR
+from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver, StoppingCallback
+from nsp_solver.solver.stopping import StoppingCriteria, StoppingTracker
+from nsp_solver.utils import utils
+
+
+class NeighbourhoodSelector(ABC):
+    """Abstract class that serves as the interface for the choice of the part of the week that is freed in one LNS step.
+    """
+    name: str
+
+    @abstractmethod
+    def select(self, data: dict, rng: random.Random) -> np.ndarray:
+        """Chooses the neighbourhood.
+
+        Args:
+            data (dict): dictionary that contains data from input files
+            rng (random.Random): source of randomness
+
+        Returns:
+            np.ndarray: True for each freed pair of nurse and day, shape (nurses, days)
+        """
+        pass
+
+
+class RandomNursesNeighbourhood(NeighbourhoodSelector):
+    """Frees the whole week of a random subset of nurses."""
+    name = "nurses"
+
+    def __init__(self, fraction: float = 0.2):
+        self.fraction = fraction
+
+    def select(self, data: dict, rng: random.Random) -> np.ndarray:
+        freed = np.zeros((data["num_nurses"], data["num_days"]), dtype=bool)
+        count = max(1, round(self.fraction * data["num_nurses"]))
+        freed[rng.sample(range(data["num_nurses"]), count)] = True
+        return freed
+
+
+class DayBlockNeighbourhood(NeighbourhoodSelector):
+    """Frees a block of consecutive days of all nurses."""
+    name = "days"
+
+    def __init__(self, length: int = 2):
+        self.length = length
+
+    def select(self, data: dict, rng: random.Random) -> np.ndarray:
+        freed = np.zeros((data["num_nurses"], data["num_days"]), dtype=bool)
+        first_day = rng.randrange(data["num_days"] - self.length + 1)
+        freed[:, first_day: first_day + self.length] = True
+        return freed
+
+
+class SkillGroupNeighbourhood(NeighbourhoodSelector):
+    """Frees the whole week of all nurses with a random skill."""
+    name = "skill"
+
+    def select(self, data: dict, rng: random.Random) -> np.ndarray:
+        skill = rng.choice(data["sc_data"]["skills"])
+        freed = np.zeros((data["num_nurses"], data["num_days"]), dtype=bool)
+        for n, nurse in enumerate(data["sc_data"]["nurses"]):
+            if skill in nurse["skills"]:
+                freed[n] = True
+        return freed
+
+
+class LNS_Solver(ORTOOLS_Solver):
+    """Child Class from ORTOOLS_Solver that improves the schedule of a week by Large Neighbourhood Search.
+
+    The first solution is found by CP-SAT in a part of the time limit. Then in each step a neighbourhood
+    is chosen by one of the selectors, the assignments outside of it are fixed to the incumbent
+    and the rest of the week is solved again with a short time limit. Only improving solutions are accepted.
+    The selectors are chosen with the probability given by their success rate so far.
+    """
+    name = 'LNS'
+
+    def __init__(
+        self,
+        selectors: list[NeighbourhoodSelector] = None,
+        initial_time_fraction: float = 0.3,
+        step_time_limit: float = 2,
+        seed: int = 0,
+        reuse_model: bool = False,
+    ):
+        """
+        Args:
+            selectors (list[NeighbourhoodSelector], optional): selectors of the neighbourhoods.
+                Defaults to random nurses, a block of days and a skill group.
+            initial_time_fraction (float, optional): part of the time limit for finding the first solution. Defaults to 0.3.
+            step_time_limit (float, optional): time limit for one neighbourhood in seconds. Defaults to 2.
+            seed (int, optional): seed of the random choices. Defaults to 0.
+            reuse_model (bool, optional): see ORTOOLS_Solver. Defaults to False.
+        """
+        super().__init__(reuse_model)
+        if selectors is None:
+            selectors = [RandomNursesNeighbourhood(), DayBlockNeighbourhood(), SkillGroupNeighbourhood()]
+        self.selectors = selectors
+        self.initial_time_fraction = initial_time_fraction
+        self.step_time_limit = step_time_limit
+        self.rng = random.Random(seed)
+        self.statistics = {selector.name: {"attempts": 0, "improvements": 0} for selector in selectors}
+
+    def success_rates(self) -> dict:
+        """Returns the share of the steps that improved the incumbent for each selector.
+
+        Returns:
+            dict: success rate for each selector name
+        """
+        return {
+            name: statistics["improvements"] / statistics["attempts"] if statistics["attempts"] else 0.0
+            for name, statistics in self.statistics.items()
+        }
+
+    def choose_selector(self) -> NeighbourhoodSelector:
+        """Chooses a selector with the probability given by its (smoothed) success rate."""
+        weights = [
+            (self.statistics[selector.name]["improvements"] + 1) / (self.statistics[selector.name]["attempts"] + 2)
+            for selector in self.selectors
+        ]
+        return self.rng.choices(self.selectors, weights)[0]
+
+    def solve(self, model, time_limit, stopping_criteria: StoppingCriteria = None):
+        """Solves the model with the given time limit, stopping early if the criteria are met.
+
+        Returns:
+            (CpSolver, status): the solver holding the solution and the status of the solution
+        """
+        solver = cp_model.CpSolver()
+        solver.parameters.log_search_progress = False
+        solver.parameters.log_to_stdout = False
+        self.set_parameters(solver, time_limit)
+        with StoppingCallback(solver, stopping_criteria) as stopping:
+            status = solver.Solve(model, stopping)
+        return solver, status
+
+    def build_neighbourhood(self, model, ir: ConstraintIR, incumbent: np.ndarray, freed: np.ndarray):
+        """Returns a copy of the model with the assignments outside of the neighbourhood fixed to the incumbent
+        and the assignments inside of it hinted by the incumbent.
+
+        Args:
+            model (CpModel): the model of the week
+            ir (ConstraintIR): the model of the week as the IR
+            incumbent (np.ndarray): the best assignments so far of shape (nurses, days, shifts, skills)
+            freed (np.ndarray): True for each freed pair of nurse and day, shape (nurses, days)
+
+        Returns:
+            CpModel: the model of the neighbourhood
+        """
+        neighbourhood = model.Clone()
+        neighbourhood.ClearHints()
+        proto = neighbourhood.Proto()
+        # the impossible assignments are the constant ZERO, which is neither hinted nor fixed
+        mask = ir.assignment_mask
+        hinted = mask & freed[:, :, None, None]
+        proto.solution_hint.vars.extend(ir.shifts_with_skills[hinted].tolist())
+        proto.solution_hint.values.extend(incumbent[hinted].astype(np.int64).tolist())
+        fixed = mask & ~freed[:, :, None, None]
+        for column, value in zip(ir.shifts_with_skills[fixed].tolist(), incumbent[fixed].astype(np.int64).tolist()):
+            domain = proto.variables[column].domain
+            domain.clear()
+            domain.extend([value, value])
+        return neighbourhood
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        """Computes a schedule for a week given a time limit and data.
+
+        Args:
+            time_limit_for_week (int): time limit for finding a schedule as optimal as possible
+            data (dict): dictionary that contains data from input files
+            results (dict): dictionary used to store partially computed schedule
+        """
+        deadline = time.time() + time_limit_for_week
+        week_number = data["h0_data"]["week"]
+        model, ir = self.build_model(data)
+        self.add_warm_start(model, ir, data)
+
+        # the week stops early if its data["stopping_criteria"] are met, the neighbourhoods are checked between the steps
+        stopping_criteria = data.get("stopping_criteria")
+        best_solver, best_status = self.solve(model, self.initial_time_fraction * time_limit_for_week, stopping_criteria)
+        if best_status not in (cp_model.FEASIBLE, cp_model.OPTIMAL):
+            best_solver, best_status = self.solve(model, max(deadline - time.time(), 0), stopping_criteria)
+        # the bounds of the neighbourhoods are the bounds of the restricted models, not of the week
+        week_bound = best_solver.BestObjectiveBound()
+        tracker = StoppingTracker(stopping_criteria)
+        if best_status in (cp_model.FEASIBLE, cp_model.OPTIMAL):
+            tracker.update(best_solver.ObjectiveValue(), week_bound)
+
+        while best_status == cp_model.FEASIBLE and time.time() < deadline and not tracker.should_stop():
+            incumbent = self.get_week_values(best_solver, ir)
+            selector = self.choose_selector()
+            freed = selector.select(data, self.rng)
+
+            neighbourhood = self.build_neighbourhood(model, ir, incumbent, freed)
+            solver, status = self.solve(neighbourhood, min(self.step_time_limit, max(deadline - time.time(), 0)))
+            self.statistics[selector.name]["attempts"] += 1
+            if status in (cp_model.FEASIBLE, cp_model.OPTIMAL) and solver.ObjectiveValue() < best_solver.ObjectiveValue():
+                self.statistics[selector.name]["improvements"] += 1
+                best_solver = solver
+                tracker.update(best_solver.ObjectiveValue(), None)
+
+        if best_status in (cp_model.FEASIBLE, cp_model.OPTIMAL):
+            print(f"LNS week {week_number}: {best_solver.ObjectiveValue()}, success rates: {self.success_rates()}")
+        self.save_tmp_results(results, best_solver, best_status, ir, week_number)
+        if best_status in (cp_model.FEASIBLE, cp_model.OPTIMAL):
+            results[(week_number, "gap")] = utils.relative_gap(best_solver.ObjectiveValue(), week_bound)
@@ -0,0 +1,106 @@
+from collections import OrderedDict
+from dataclasses import fields
+import logging
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+from nsp_solver.solver.constraint_ir import ConstraintIR
+from nsp_solver.solver.model_generator import build_week_ir
+from nsp_solver.utils.week_key import week_model_key
+
+
+class ModelCache:
+    """Cache of the models of weeks (ConstraintIR) keyed by week_model_key.
+
+    The models are kept in memory with the least recently used one evicted first.
+    If cache_dir is given, each model is also stored there as one .npz file, so that other processes and later runs
+    generate each model only once. A file that cannot be read is generated again.
+    """
+
+    def __init__(self, max_entries: int = 16, cache_dir: str = None):
+        """
+        Args:
+            max_entries (int, optional): maximal number of models kept in memory. Defaults to 16.
+            cache_dir (str, optional): directory with the stored models. Defaults to None (memory only).
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, data: dict) -> ConstraintIR:
+        """Returns the model of the week given by data, generating it only if it is not in the cache.
+
+        Args:
+            data (dict): dictionary that contains data from input files
+
+        Returns:
+            ConstraintIR: the model of the week
+        """
+        key = week_model_key(data)
+        ir = self.get(key)
+        if ir is None:
+            self.misses += 1
+            ir = build_week_ir(data)
+            self.put(key, ir)
+        else:
+            self.hits += 1
+        return ir
+
+    def get(self, key: str) -> ConstraintIR:
+        """Returns the model stored under the key or None."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if self.cache_dir is None:
+            return None
+        ir = self._read(key)
+        if ir is not None:
+            self._remember(key, ir)
+        return ir
+
+    def put(self, key: str, ir: ConstraintIR):
+        """Stores the model under the key."""
+        self._remember(key, ir)
+        if self.cache_dir is not None:
+            self._write(key, ir)
+
+    def _remember(self, key: str, ir: ConstraintIR):
+        self.entries[key] = ir
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def _write(self, key: str, ir: ConstraintIR):
+        """Writes the model into a temporary file that is then renamed,
+        so that the processes sharing the cache never see a partially written model.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        arrays = {field.name: getattr(ir, field.name) for field in fields(ConstraintIR) if field.name != "names"}
+        if all(name is not None for name in ir.names):
+            arrays["names"] = np.array(ir.names, dtype=str)
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".npz")
+        with os.fdopen(file_descriptor, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(tmp_path, self._path(key))
+
+    def _read(self, key: str) -> ConstraintIR:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                values = {name: arrays[name] for name in arrays.files}
+            names = values.pop("names").tolist() if "names" in values else [None] * len(values["lb"])
+            return ConstraintIR(names=names, **values)
+        except (OSError, ValueError, TypeError, KeyError, zipfile.BadZipFile):
+            logging.warning(f"Model {path} cannot be read, it is generated again")
+            os.remove(path)
+            return None
@@ -0,0 +1,652 @@
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import numpy as np
+
+from nsp_solver.solver.constraint_ir import ZERO, ConstraintIR, IRBuilder
+from nsp_solver.solver.presolve import assignment_mask
+from nsp_solver.utils import utils
+from nsp_solver.utils.scenario_cache import CONTRACT_FIELDS, SHIFT_TYPE_FIELDS, CompiledScenario
+from nsp_solver.utils.schedule_tensor import as_assignments
+from nsp_solver.utils.streak_index import StreakIndex, long_streaks, short_streaks
+from nsp_solver.utils.week_instance import WeekInstance, get_week_instance
+
+
+def _last_streaks(index: StreakIndex) -> tuple:
+    """Returns the streaks of working days, days off and shift types (of shape (nurses, shifts)) after the last day of the index
+    (the streaks carried in if the index has no days)."""
+    if index.working_days.shape[1] == 0:
+        return index.carry_working_days, index.carry_days_off, index.carry_shifts
+    return index.last_working_day_streaks(), index.last_day_off_streaks(), index.last_shift_streaks()
+
+
+@dataclass
+class HorizonWindow:
+    """Weeks generated together into one model and the state of the schedule before them.
+
+    The days of the window are numbered from 0 (Monday of its first week). The streaks carried into the window
+    and the totals of the previous weeks are computed either from the original history and the already computed weeks
+    (from_data), so that the model counts them in the same way as the ScheduleValidator counts the whole schedule,
+    or from the current history of a single week (from_week).
+    The streaks are given for the uninterrupted schedule ("plain"), for the schedule interrupted
+    by the vacation of the nurse ("vacation") and by any vacation in the week ("any_vacation").
+    The scenario arrays are indexed by the nurses, skills and shift types as the variables.
+    """
+    weeks: range
+    final: bool
+    number_weeks: int
+    week_data: list
+    skills: np.ndarray
+    skills_if_needed: np.ndarray
+    limits: np.ndarray
+    shift_types: np.ndarray
+    forbidden_successions: np.ndarray
+    wanted_overtime: np.ndarray
+    vacations: np.ndarray
+    any_vacations: np.ndarray
+    on_vacation: np.ndarray
+    last_shifts: np.ndarray
+    carries: dict
+    previous_assignments: np.ndarray
+    previous_working_weekends: np.ndarray
+    previous_incomplete_weekends: np.ndarray
+    previous_shifts: np.ndarray
+
+    @property
+    def num_days(self) -> int:
+        return 7 * len(self.weeks)
+
+    @classmethod
+    def from_data(cls, data: dict, results, weeks: range) -> "HorizonWindow":
+        """Computes the state of the schedule before the first week of the window.
+
+        Args:
+            data (dict): dictionary that contains data from input files
+            results (ScheduleTensor | dict): partially computed schedule (all weeks before the window)
+            weeks (range): weeks of the window
+
+        Returns:
+            HorizonWindow: the window
+        """
+        scenario: CompiledScenario = data["compiled_scenario"]
+        num_nurses = data["num_nurses"]
+        num_days = data["num_days"]
+        first_day = num_days * weeks.start
+
+        vacation_weeks = np.zeros((data["number_weeks"], num_nurses), dtype=bool)
+        if data["configuration"]["h12"]:
+            vacation_weeks = scenario.vacations[: data["number_weeks"]].astype(bool)
+        vacation_days = np.repeat(vacation_weeks.T, num_days, axis=1)
+        any_vacation_days = np.repeat(vacation_weeks.any(axis=1), num_days)
+
+        previous = as_assignments(results, data)[:, :first_day].astype(np.int64)
+        shifts = previous.sum(axis=3)
+        working_days = (shifts.sum(axis=2) > 0).astype(np.int64)
+        index = StreakIndex.from_history(working_days, shifts, data["h0_data_original"]["nurseHistory"])
+        carries = {
+            "plain": _last_streaks(index),
+            "vacation": _last_streaks(index.interrupted(vacation_days[:, :first_day])),
+            "any_vacation": _last_streaks(
+                index.interrupted(np.broadcast_to(any_vacation_days[None, :first_day], working_days.shape))
+            ),
+        }
+
+        last_shifts = scenario.last_shift_types.copy()
+        if first_day > 0:
+            last_day = shifts[:, -1]
+            last_shifts = np.where(last_day.any(axis=1), data["num_shifts"] - 1 - np.argmax(last_day[:, ::-1], axis=1), -1)
+
+        weekends = working_days.reshape(num_nurses, weeks.start, num_days)[:, :, 5:7].sum(axis=2)
+        return cls(
+            weeks=weeks,
+            final=weeks.stop == data["number_weeks"],
+            number_weeks=data["number_weeks"],
+            week_data=[data["all_wd_data"][w] for w in weeks],
+            skills=scenario.nurse_skills,
+            skills_if_needed=scenario.nurse_skills_if_needed,
+            limits=scenario.contracts[scenario.nurse_contracts],
+            shift_types=scenario.shift_types,
+            forbidden_successions=scenario.forbidden_successions,
+            wanted_overtime=scenario.wanted_overtime,
+            vacations=vacation_days[:, first_day: num_days * weeks.stop],
+            any_vacations=any_vacation_days[first_day: num_days * weeks.stop],
+            on_vacation=vacation_weeks.any(axis=0),
+            last_shifts=last_shifts,
+            carries=carries,
+            previous_assignments=shifts.sum(axis=(1, 2)),
+            previous_working_weekends=(weekends > 0).sum(axis=1),
+            previous_incomplete_weekends=(weekends == 1).sum(axis=1),
+            previous_shifts=shifts.sum(axis=1),
+        )
+
+    @classmethod
+    def from_week(cls, data: dict) -> "HorizonWindow":
+        """Returns the window of the week given by data["wd_data"] with the state given by the current history
+        data["h0_data"]. The history does not tell which streaks were interrupted by vacations,
+        so all streaks are carried in as the plain streaks and only the vacations of the week are known.
+
+        Args:
+            data (dict): dictionary that contains data from input files
+
+        Returns:
+            HorizonWindow: the window
+        """
+        instance = get_week_instance(data)
+        num_nurses = data["num_nurses"]
+        num_days = data["num_days"]
+        week_number = data["h0_data"]["week"]
+        nurse_history = data["h0_data"]["nurseHistory"]
+
+        vacations = np.zeros(num_nurses, dtype=bool)
+        if data["configuration"]["h12"]:
+            vacations = instance.vacations.astype(bool)
+        index = StreakIndex.from_history(
+            np.zeros((num_nurses, 0), dtype=np.int64), np.zeros((num_nurses, 0, data["num_shifts"]), dtype=np.int64), nurse_history
+        )
+        carry = _last_streaks(index)
+        previous_shifts = np.zeros((num_nurses, data["num_shifts"]), dtype=np.int64)
+        for n, history in enumerate(nurse_history):
+            for s, restricted in enumerate(history["numbersOfAssignedRestrictedShiftTypes"][: data["num_shifts"]]):
+                previous_shifts[n, s] = restricted["numberOfAssignments"]
+        return cls(
+            weeks=range(week_number, week_number + 1),
+            final=week_number + 1 == data["num_weeks"],
+            number_weeks=data["num_weeks"],
+            week_data=[data["wd_data"]],
+            skills=instance.skills,
+            skills_if_needed=instance.skills_if_needed,
+            limits=instance.nurse_limits,
+            shift_types=instance.shift_types,
+            forbidden_successions=instance.forbidden_successions,
+            wanted_overtime=instance.wanted_overtime,
+            vacations=np.repeat(vacations[:, None], num_days, axis=1),
+            any_vacations=np.repeat(vacations.any(), num_days),
+            on_vacation=vacations,
+            last_shifts=instance.last_shift_types,
+            carries={"plain": carry, "vacation": carry, "any_vacation": carry},
+            previous_assignments=np.array(instance.history_values("numberOfAssignments")),
+            previous_working_weekends=np.array(instance.history_values("numberOfWorkingWeekends")),
+            previous_incomplete_weekends=np.array(instance.history_values("numberOfIncompleteWeekends")),
+            previous_shifts=previous_shifts,
+        )
+
+    def scaled(self, limit: int) -> int:
+        """Returns the part of the limit of the whole horizon that belongs to the weeks up to the end of the window.
+        The last window gets the whole limit.
+        """
+        if self.final:
+            return limit
+        return round(limit * self.weeks.stop / self.number_weeks)
+
+    def contract(self, name: str) -> list[int]:
+        """Returns the value of the field of the contract of each nurse."""
+        return self.limits[:, CONTRACT_FIELDS.index(name)].tolist()
+
+    def shift_type(self, name: str) -> list[int]:
+        """Returns the value of the field of each shift type."""
+        return self.shift_types[:, SHIFT_TYPE_FIELDS.index(name)].tolist()
+
+
+class _Literal(NamedTuple):
+    """Variable of the model or its negation (1 - variable) in a pattern of streak_index.py."""
+    column: int
+    negated: bool = False
+
+    def __rsub__(self, other):
+        if other != 1:
+            return NotImplemented
+        return _Literal(self.column, not self.negated)
+
+
+def _literals(columns: np.ndarray) -> list:
+    return [_Literal(column) for column in columns.tolist()]
+
+
+def _pattern_row(pattern: list) -> tuple:
+    """Returns the columns and coefficients of the sum of the pattern and the constant part of the sum."""
+    columns = [literal.column for literal in pattern]
+    coefficients = [-1 if literal.negated else 1 for literal in pattern]
+    return columns, coefficients, sum(literal.negated for literal in pattern)
+
+
+def _forbid(builder: IRBuilder, pattern: list):
+    """Adds the row that forbids all literals of the pattern to be 1."""
+    columns, coefficients, constant = _pattern_row(pattern)
+    builder.add_row(columns, coefficients, "L", len(pattern) - 1 - constant)
+
+
+def _penalize(builder: IRBuilder, pattern: list, weight: int):
+    """Adds the weight to the objective if all literals of the pattern are 1."""
+    violated = builder.add_variable()
+    columns, coefficients, constant = _pattern_row(pattern)
+    builder.add_row(columns + [violated], coefficients + [-1], "L", len(pattern) - 1 - constant)
+    builder.add_objective([violated], weight)
+
+
+def _requirements(window: HorizonWindow):
+    """Yields the requirements of each day of the window as tuples (day, shift, skill, minimum, optimum)."""
+    for w, wd_data in enumerate(window.week_data):
+        for req in wd_data["requirements"]:
+            s = utils.shift_to_int[req["shiftType"]]
+            sk = utils.skill_to_int[req["skill"]]
+            for day, d in utils.day_to_int.items():
+                requirement = req[f"requirementOn{day}"]
+                yield 7 * w + d, s, sk, requirement["minimum"], requirement["optimal"]
+
+
+def add_variables(builder: IRBuilder, data: dict, window: HorizonWindow, skeleton: bool = False) -> dict:
+    """Adds the variables of the assignments, the shifts and the working days of each day of the window.
+    The impossible assignments are the constant ZERO, or with skeleton only the assignments without the skill,
+    so that the variables do not depend on the week data and the history, and the others are fixed by their bounds.
+
+    Returns:
+        dict: the indices of the variables
+    """
+    config = data["configuration"]
+    mask = assignment_mask(data, window, config["h4"], config["h3"], config["h12"], config["h11"])
+    created = assignment_mask(data, window, config["h4"], history=False) if skeleton else mask
+    with builder.family("variables"):
+        variables = {
+            "shifts_with_skills": builder.add_masked_variables(created, mask, "shift_with_skill_n{}_d{}_s{}_sk{}"),
+            "shifts": builder.add_masked_variables(created.any(axis=3), mask.any(axis=3), "shift_n{}_d{}_s{}"),
+            "working_days": builder.add_masked_variables(created.any(axis=(2, 3)), mask.any(axis=(2, 3)), "working_day_n{}_d{}"),
+        }
+    return variables
+
+
+def add_structure(builder: IRBuilder, variables: dict, data: dict, window: HorizonWindow):
+    """Adds the rows that do not depend on the week data and the history: a shift is worked with one skill,
+    a working day has a shift, and with h1 one shift per day (with h10 only the early and the night shift
+    can be worked on one day), the successions of the shift types within the window (h3)
+    and the working and incomplete weekends.
+    """
+    config = data["configuration"]
+    shifts_with_skills = variables["shifts_with_skills"]
+    shifts = variables["shifts"]
+    working_days = variables["working_days"]
+    num_shifts = shifts.shape[2]
+
+    with builder.family("shifts"):
+        created = shifts != ZERO
+        builder.add_rows(
+            np.concatenate([shifts[created][:, None], shifts_with_skills[created]], axis=1),
+            [-1] + [1] * shifts_with_skills.shape[3], "E", 0,
+        )
+
+    with builder.family("h1"):
+        created = working_days != ZERO
+        days = working_days[created][:, None]
+        if config["h1"]:
+            builder.add_rows(np.concatenate([days, shifts[created]], axis=1), [-1] + [1] * num_shifts, "E", 0)
+        else:
+            builder.add_rows(np.concatenate([days, shifts[created]], axis=1), [1] + [-1] * num_shifts, "L", 0)
+            builder.add_rows(
+                np.stack([shifts[created].ravel(), np.repeat(days.ravel(), num_shifts)], axis=1), [1, -1], "L", 0
+            )
+            if config["h10"]:
+                builder.add_rows(shifts[created][:, :-1], 1, "L", 1)
+                builder.add_rows(shifts[created][:, 1:], 1, "L", 1)
+
+    if config["h3"]:
+        with builder.family("h3"):
+            for s1, s2 in np.argwhere(window.forbidden_successions).tolist():
+                builder.add_rows(np.stack([shifts[:, :-1, s1].ravel(), shifts[:, 1:, s2].ravel()], axis=1), 1, "L", 1)
+
+    if config["h7"] or config["s5"] or config["s7"]:
+        with builder.family("weekends"):
+            saturdays, sundays = working_days[:, 5::7].ravel(), working_days[:, 6::7].ravel()
+            shape = working_days[:, 5::7].shape
+            working = builder.add_variables(shape, name="working_weekend_n{}_w{}")
+            incomplete = builder.add_variables(shape, name="incomplete_weekend_n{}_w{}")
+            for day in (saturdays, sundays):
+                builder.add_rows(np.stack([day, working.ravel()], axis=1), [1, -1], "L", 0)
+            for first, second in ((saturdays, sundays), (sundays, saturdays)):
+                builder.add_rows(np.stack([first, second, incomplete.ravel()], axis=1), [1, -1, -1], "L", 0)
+        variables["working_weekends"] = working
+        variables["incomplete_weekends"] = incomplete
+
+
+def add_hard_constraints(builder: IRBuilder, variables: dict, data: dict, window: HorizonWindow):
+    """Adds the hard constraints enabled by the configuration that depend on the week data and the history."""
+    config = data["configuration"]
+    shifts_with_skills = variables["shifts_with_skills"]
+    shifts = variables["shifts"]
+    working_days = variables["working_days"]
+    num_nurses = working_days.shape[0]
+
+    if config["h2"]:
+        with builder.family("h2"):
+            for t, s, sk, minimum, _ in _requirements(window):
+                if minimum > 0:
+                    builder.add_row(shifts_with_skills[:, t, s, sk].tolist(), [1] * num_nurses, "G", minimum)
+
+    no_breaks = np.zeros(window.num_days, dtype=bool)
+    for n in data["all_nurses"]:
+        days = _literals(working_days[n])
+        days_off = [1 - day for day in days]
+        plain_work, plain_off, plain_shifts = (carry[n] for carry in window.carries["plain"])
+        any_work, any_off, _ = (carry[n] for carry in window.carries["any_vacation"])
+        vacation_shifts = window.carries["vacation"][2][n]
+        any_breaks = window.any_vacations
+
+        if config["h5"]:
+            with builder.family("h5"):
+                for pattern in long_streaks(days, window.contract("maximumNumberOfConsecutiveWorkingDaysHard")[n], plain_work, no_breaks):
+                    _forbid(builder, pattern)
+                minimum = window.contract("minimumNumberOfConsecutiveWorkingDaysHard")[n]
+                for pattern, _ in short_streaks(days, minimum, any_work, any_breaks):
+                    _forbid(builder, pattern)
+                for s in data["all_shifts"]:
+                    shift_days = _literals(shifts[n, :, s])
+                    maximum = window.shift_type("maximumNumberOfConsecutiveAssignmentsHard")[s]
+                    for pattern in long_streaks(shift_days, maximum, plain_shifts[s], no_breaks):
+                        _forbid(builder, pattern)
+                    minimum = window.shift_type("minimumNumberOfConsecutiveAssignmentsHard")[s]
+                    for pattern, _ in short_streaks(shift_days, minimum, vacation_shifts[s], window.vacations[n]):
+                        _forbid(builder, pattern)
+
+        if config["h6"]:
+            with builder.family("h6"):
+                maximum = window.contract("maximumNumberOfConsecutiveDaysOffHard")[n]
+                for pattern in long_streaks(days_off, maximum, any_off, any_breaks):
+                    _forbid(builder, pattern)
+                minimum = window.contract("minimumNumberOfConsecutiveDaysOffHard")[n]
+                for pattern, _ in short_streaks(days_off, minimum, plain_off, no_breaks):
+                    _forbid(builder, pattern)
+
+        if config["h9"]:
+            with builder.family("h9"):
+                add_min_free_period_constraint(builder, working_days[n], window.contract("minimalFreePeriod")[n])
+
+    if config["h7"]:
+        with builder.family("h7"):
+            for n, maximum in enumerate(window.contract("maximumNumberOfIncompleteWeekendsHard")):
+                incomplete_weekends = variables["incomplete_weekends"][n].tolist()
+                previous = int(window.previous_incomplete_weekends[n])
+                builder.add_row(incomplete_weekends, [1] * len(incomplete_weekends), "L", maximum - previous)
+
+    if config["h8"]:
+        with builder.family("h8"):
+            for n in data["all_nurses"]:
+                days = working_days[n].tolist()
+                previous = int(window.previous_assignments[n])
+                builder.add_row(days, [1] * len(days), "L", window.contract("maximumNumberOfAssignmentsHard")[n] - previous)
+                # the minimum can be reached in the later weeks
+                if window.final and not window.on_vacation[n]:
+                    builder.add_row(days, [1] * len(days), "G", window.contract("minimumNumberOfAssignmentsHard")[n] - previous)
+
+    if config["h11"]:
+        with builder.family("h11"):
+            for n, nurse in enumerate(data["sc_data"]["nurses"]):
+                for restriction in nurse["restrictions"]:
+                    s = utils.shift_to_int[restriction["type"]]
+                    previous = int(window.previous_shifts[n, s])
+                    builder.add_row(shifts[n, :, s].tolist(), [1] * window.num_days, "L", restriction["limit"] - previous)
+
+
+def add_min_free_period_constraint(builder: IRBuilder, working_days: np.ndarray, minimal_free_period: int):
+    """Adds the constraint that each week of the window has at least minimal_free_period consecutive days off (h9)."""
+    if minimal_free_period <= 0:
+        return
+    days = working_days.tolist()
+    for first_day in range(0, len(days), 7):
+        starts = []
+        for start in range(first_day, first_day + 7 - minimal_free_period + 1):
+            free_period = builder.add_variable()
+            for day in days[start: start + minimal_free_period]:
+                builder.add_row([free_period, day], [1, 1], "L", 1)
+            starts.append(free_period)
+        builder.add_row(starts, [1] * len(starts), "G", 1)
+
+
+def add_soft_constraints(builder: IRBuilder, variables: dict, data: dict, window: HorizonWindow):
+    """Adds the soft constraints enabled by the configuration as the weighted penalties of the objective function,
+    with the weights and the counting of the ScheduleValidator. The limits of the totals of the whole horizon
+    are scaled down to the weeks up to the end of the window for windows before the last one.
+    """
+    config = data["configuration"]
+    shifts_with_skills = variables["shifts_with_skills"]
+    shifts = variables["shifts"]
+    working_days = variables["working_days"]
+    num_nurses = working_days.shape[0]
+
+    if config["s1"]:
+        with builder.family("s1"):
+            for t, s, sk, _, optimum in _requirements(window):
+                if optimum > 0:
+                    under_optimum = builder.add_variable()
+                    builder.add_row(shifts_with_skills[:, t, s, sk].tolist() + [under_optimum], [1] * num_nurses + [optimum], "G", optimum)
+                    builder.add_objective([under_optimum], utils.OPT_CAPACITY_WEIGHT)
+
+    no_breaks = np.zeros(window.num_days, dtype=bool)
+    for n in data["all_nurses"]:
+        days = _literals(working_days[n])
+        days_off = [1 - day for day in days]
+        plain_work, plain_off, plain_shifts = (carry[n] for carry in window.carries["plain"])
+        vacation_work, _, vacation_shifts = (carry[n] for carry in window.carries["vacation"])
+
+        if config["s2"]:
+            with builder.family("s2"):
+                maximum = window.contract("maximumNumberOfConsecutiveWorkingDays")[n]
+                for pattern in long_streaks(days, maximum, plain_work, no_breaks):
+                    _penalize(builder, pattern, utils.CONS_WORK_DAY_WEIGHT)
+                minimum = window.contract("minimumNumberOfConsecutiveWorkingDays")[n]
+                for pattern, length in short_streaks(days, minimum, vacation_work, window.vacations[n]):
+                    _penalize(builder, pattern, utils.CONS_WORK_DAY_WEIGHT * (minimum - length))
+                for s in data["all_shifts"]:
+                    shift_days = _literals(shifts[n, :, s])
+                    maximum = window.shift_type("maximumNumberOfConsecutiveAssignments")[s]
+                    for pattern in long_streaks(shift_days, maximum, plain_shifts[s], no_breaks):
+                        _penalize(builder, pattern, utils.CONS_SHIFT_WEIGHT)
+                    minimum = window.shift_type("minimumNumberOfConsecutiveAssignments")[s]
+                    for pattern, length in short_streaks(shift_days, minimum, vacation_shifts[s], window.vacations[n]):
+                        _penalize(builder, pattern, utils.CONS_SHIFT_WEIGHT * (minimum - length))
+
+        if config["s3"]:
+            with builder.family("s3"):
+                maximum = window.contract("maximumNumberOfConsecutiveDaysOff")[n]
+                for pattern in long_streaks(days_off, maximum, plain_off, no_breaks):
+                    _penalize(builder, pattern, utils.CONS_DAY_OFF_WEIGHT)
+                minimum = window.contract("minimumNumberOfConsecutiveDaysOff")[n]
+                for pattern, length in short_streaks(days_off, minimum, plain_off, no_breaks):
+                    _penalize(builder, pattern, utils.CONS_DAY_OFF_WEIGHT * (minimum - length))
+
+    if config["s4"]:
+        with builder.family("s4"):
+            nurse_index = {nurse["id"]: n for n, nurse in enumerate(data["sc_data"]["nurses"])}
+            for w, wd_data in enumerate(window.week_data):
+                for preference in wd_data["shiftOffRequests"]:
+                    n = nurse_index[preference["nurse"]]
+                    d = 7 * w + utils.day_to_int[preference["day"]]
+                    if preference["shiftType"] == "Any":
+                        builder.add_objective([working_days[n, d]], utils.UNSATISFIED_PREFERENCE_WEIGHT)
+                    else:
+                        builder.add_objective([shifts[n, d, utils.shift_to_int[preference["shiftType"]]]], utils.UNSATISFIED_PREFERENCE_WEIGHT)
+
+    if config["s5"]:
+        with builder.family("s5"):
+            complete_weekends = np.array(window.contract("completeWeekends")) == 1
+            builder.add_objective(variables["incomplete_weekends"][complete_weekends], utils.INCOMPLETE_WEEKEND_WEIGHT)
+
+    # the bounds of the deviations are the largest deviations of the totals that the window can make
+    if config["s6"]:
+        with builder.family("s6"):
+            for n in data["all_nurses"]:
+                days = working_days[n].tolist()
+                previous = int(window.previous_assignments[n])
+                maximum = window.scaled(window.contract("maximumNumberOfAssignments")[n])
+                over_limit = builder.add_variable(ub=max(previous + len(days) - maximum, 0))
+                builder.add_row(days + [over_limit], [1] * len(days) + [-1], "L", maximum - previous)
+                builder.add_objective([over_limit], utils.TOTAL_ASSIGNMENTS_WEIGHT)
+                if not window.on_vacation[n]:
+                    minimum = window.scaled(window.contract("minimumNumberOfAssignments")[n])
+                    under_limit = builder.add_variable(ub=max(minimum - previous, 0))
+                    builder.add_row(days + [under_limit], [-1] * len(days) + [-1], "L", previous - minimum)
+                    builder.add_objective([under_limit], utils.TOTAL_ASSIGNMENTS_WEIGHT)
+
+    if config["s7"]:
+        with builder.family("s7"):
+            for n in data["all_nurses"]:
+                working_weekends = variables["working_weekends"][n].tolist()
+                previous = int(window.previous_working_weekends[n])
+                maximum = window.scaled(window.contract("maximumNumberOfWorkingWeekends")[n])
+                over_limit = builder.add_variable(ub=max(previous + len(working_weekends) - maximum, 0))
+                builder.add_row(working_weekends + [over_limit], [1] * len(working_weekends) + [-1], "L", maximum - previous)
+                builder.add_objective([over_limit], utils.TOTAL_WORKING_WEEKENDS_WEIGHT)
+
+    if config["s8"]:
+        with builder.family("s8"):
+            # the shift types are iterated over the range of skills as by the ScheduleValidator
+            for n, sk in np.argwhere(window.skills_if_needed[:, : data["num_skills"]]).tolist():
+                builder.add_objective(shifts_with_skills[n, :, : data["num_skills"], sk], utils.TOTAL_IFNEEDED_SKILL_WEIGHT)
+
+    if config["s9"]:
+        with builder.family("s9"):
+            for n, wanted_overtime in enumerate(window.wanted_overtime.tolist()):
+                if wanted_overtime == 0 or window.on_vacation[n]:
+                    continue
+                days = working_days[n].tolist()
+                previous = int(window.previous_assignments[n])
+                ideal_total = window.scaled(window.contract("maximumNumberOfAssignments")[n] + wanted_overtime)
+                missing = builder.add_variable(ub=max(ideal_total - previous, 0))
+                extra = builder.add_variable(ub=max(previous + len(days) - ideal_total, 0))
+                builder.add_row(days + [missing], [-1] * len(days) + [-1], "L", previous - ideal_total)
+                builder.add_row(days + [extra], [1] * len(days) + [-1], "L", ideal_total - previous)
+                builder.add_objective([missing], utils.UNSATISFIED_OVERTIME_PREFERENCE_WEIGHT)
+                builder.add_objective([extra], utils.TOTAL_ASSIGNMENTS_WEIGHT)
+
+
+def add_relaxed_next_week(builder: IRBuilder, variables: dict, data: dict, window: HorizonWindow) -> np.ndarray:
+    """Adds the relaxed copy of the week after the window. In the next week only the working days of the nurses
+    are decided, except for its first day whose shifts must follow the last shifts of the window. The coverage
+    of each day is aggregated over the shift types: the nurses with each skill must be able to cover the minimal
+    requirements of the skill and the missing nurses to the optimal requirements are penalized. The streaks of working
+    days and days off that continue from the window into the next week, the days off requested in the next week
+    and its incomplete weekends are penalized as in the window, so that the window does not end in a state
+    that is expensive to continue. The next week itself is computed by the next model.
+
+    Returns:
+        np.ndarray: indices of the working days of the next week, shape (nurses, days)
+    """
+    next_week = WeekInstance.from_data(dict(data, wd_data=data["all_wd_data"][window.weeks.stop]))
+    num_days = data["num_days"]
+    num_skills = data["num_skills"]
+    working_days = variables["working_days"]
+    last_shifts = variables["shifts"][:, -1]
+    num_nurses = working_days.shape[0]
+
+    with builder.family("lookahead"):
+        next_working_days = builder.add_variables((num_nurses, num_days), name="next_week_n{}_d{}")
+        # the successions of the shift types tie the first day of the next week to the last day of the window,
+        # so its shifts and skills are decided as in the window
+        skills = np.broadcast_to(next_week.skills[:, None, :num_skills], (num_nurses, data["num_shifts"], num_skills))
+        first_day = builder.add_masked_variables(skills, name="next_week_n{}_d0_s{}_sk{}")
+        first_day_columns = first_day.reshape(num_nurses, -1)
+        builder.add_rows(
+            np.concatenate([next_working_days[:, :1], first_day_columns], axis=1),
+            [-1] + [1] * first_day_columns.shape[1], "E", 0,
+        )
+        for s1, s2 in np.argwhere(window.forbidden_successions).tolist():
+            builder.add_rows(np.concatenate([last_shifts[:, s1: s1 + 1], first_day[:, s2]], axis=1), 1, "L", 1)
+        for (s, sk), minimum in np.ndenumerate(next_week.coverage_minimum[0]):
+            builder.add_row(first_day[:, s, sk].tolist(), [1] * num_nurses, "G", int(minimum))
+
+        minimal_coverage = next_week.coverage_minimum.sum(axis=1).tolist()
+        optimal_coverage = next_week.coverage_optimal.sum(axis=1).tolist()
+        for d in range(num_days):
+            for sk in data["all_skills"]:
+                # a nurse with more skills is counted for each of them
+                nurses_with_skill = next_working_days[window.skills[:, sk], d].tolist()
+                builder.add_row(nurses_with_skill, [1] * len(nurses_with_skill), "G", minimal_coverage[d][sk])
+                missing_nurses = builder.add_variable(ub=optimal_coverage[d][sk], name=f"next_week_missing_d{d}_sk{sk}")
+                builder.add_row(nurses_with_skill + [missing_nurses], [-1] * len(nurses_with_skill) + [-1], "L", -optimal_coverage[d][sk])
+                builder.add_objective([missing_nurses], utils.OPT_CAPACITY_WEIGHT)
+
+        window_days = working_days.shape[1]
+        for n in data["all_nurses"]:
+            days = _literals(np.concatenate([working_days[n], next_working_days[n]]))
+            days_off = [1 - day for day in days]
+            working_carry, day_off_carry, _ = (carry[n] for carry in window.carries["plain"])
+            # the streaks are checked from the first day of the next week, the window penalizes its own streaks
+            maximum = window.contract("maximumNumberOfConsecutiveWorkingDays")[n]
+            for pattern in long_streaks(days, maximum, working_carry, from_day=window_days):
+                _penalize(builder, pattern, utils.CONS_WORK_DAY_WEIGHT)
+            minimum = window.contract("minimumNumberOfConsecutiveWorkingDays")[n]
+            for pattern, length in short_streaks(days, minimum, working_carry, from_day=window_days):
+                _penalize(builder, pattern, utils.CONS_WORK_DAY_WEIGHT * (minimum - length))
+            maximum = window.contract("maximumNumberOfConsecutiveDaysOff")[n]
+            for pattern in long_streaks(days_off, maximum, day_off_carry, from_day=window_days):
+                _penalize(builder, pattern, utils.CONS_DAY_OFF_WEIGHT)
+            minimum = window.contract("minimumNumberOfConsecutiveDaysOff")[n]
+            for pattern, length in short_streaks(days_off, minimum, day_off_carry, from_day=window_days):
+                _penalize(builder, pattern, utils.CONS_DAY_OFF_WEIGHT * (minimum - length))
+
+            if window.contract("completeWeekends")[n] == 1:
+                saturday, sunday = _literals(next_working_days[n, 5:7])
+                _penalize(builder, [saturday, 1 - sunday], utils.INCOMPLETE_WEEKEND_WEIGHT)
+                _penalize(builder, [sunday, 1 - saturday], utils.INCOMPLETE_WEEKEND_WEIGHT)
+
+        # the requests for a shift type cannot be checked without the shift types of the next week,
+        # so only the requests for all shift types (a day off) are penalized
+        requested_days_off = next_week.preferences.all(axis=2)
+        builder.add_objective(next_working_days[requested_days_off], utils.UNSATISFIED_PREFERENCE_WEIGHT)
+    return next_working_days
+
+
+def generate_window(builder: IRBuilder, data: dict, window: HorizonWindow, lookahead: bool = False, skeleton: bool = False) -> dict:
+    """Generates the model of the weeks of the window: the variables and the rows that do not depend on the week data
+    and the history (the skeleton), the hard constraints enabled by the configuration and the soft constraints
+    as the objective function. The assignments of one day are limited to one shift only by h1 (and h10).
+
+    Args:
+        builder (IRBuilder): collects the model
+        data (dict): dictionary that contains data from input files
+        window (HorizonWindow): the weeks of the model
+        lookahead (bool, optional): whether to add the relaxed week after the window (see add_relaxed_next_week),
+            if there is any. Defaults to False.
+        skeleton (bool, optional): whether the variables of the skeleton must not depend on the week data
+            and the history (see add_variables). Defaults to False.
+
+    Returns:
+        dict: the indices of the variables
+    """
+    variables = add_variables(builder, data, window, skeleton)
+    add_structure(builder, variables, data, window)
+    builder.mark_skeleton()
+    add_hard_constraints(builder, variables, data, window)
+    add_soft_constraints(builder, variables, data, window)
+    if lookahead and window.weeks.stop < window.number_weeks:
+        variables["next_working_days"] = add_relaxed_next_week(builder, variables, data, window)
+    return variables
+
+
+def build_week_ir(data: dict, lookahead: bool = False, skeleton: bool = False, builder: IRBuilder = None) -> ConstraintIR:
+    """Generates the model of the week given by data (including its configuration).
+
+    Args:
+        data (dict): dictionary that contains data from input files
+        lookahead (bool, optional): whether to add the relaxed next week. Defaults to False.
+        skeleton (bool, optional): whether the skeleton must not depend on the week data and the history. Defaults to False.
+        builder (IRBuilder, optional): collects the model (e.g. with debug names). Defaults to a new one.
+
+    Returns:
+        ConstraintIR: the model of the week
+    """
+    builder = IRBuilder() if builder is None else builder
+    variables = generate_window(builder, data, HorizonWindow.from_week(data), lookahead, skeleton)
+    return builder.to_ir(variables["shifts_with_skills"])
+
+
+def build_horizon_ir(data: dict, window: HorizonWindow) -> ConstraintIR:
+    """Generates the model of the weeks of the window, whose days are indexed from the start of the window.
+
+    Args:
+        data (dict): dictionary that contains data from input files
+        window (HorizonWindow): the weeks of the model
+
+    Returns:
+        ConstraintIR: the model of the window
+    """
+    builder = IRBuilder()
+    variables = generate_window(builder, data, window)
+    return builder.to_ir(variables["shifts_with_skills"])
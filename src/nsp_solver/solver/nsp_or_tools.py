@@ -1,10 +1,17 @@
 #!/usr/bin/python
 
+from nsp_solver.solver.constraint_ir import ConstraintIR
+from nsp_solver.solver.cp_sat_profiles import DEFAULT_PROFILE, get_profile, set_cp_sat_parameters, set_cp_sat_resources
+from nsp_solver.solver.ir_compilers import compile_skeleton_to_cp_sat, compile_to_cp_sat
+from nsp_solver.solver.model_generator import build_week_ir
 from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.solver.stopping import StoppingCriteria, StoppingTracker
 from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import store_week
 from ortools.sat.python import cp_model
 
-import math
+import threading
+import numpy as np
 
 shift_to_int = {"Early": 0, "Day": 1, "Late": 2, "Night": 3, "Any": 4, "None": 5}
 skill_to_int = {"HeadNurse": 0, "Nurse": 1, "Caretaker": 2, "Trainee": 3}
@@ -20,1151 +27,174 @@ day_to_int = {
 }
 
 
-class ORTOOLS_Solver(NSP_solver):
-    """Child Class from NSP_solver that uses CP SAT solver from OR-TOOLS to compute a schedule per week.
+class StoppingCallback(cp_model.CpSolverSolutionCallback):
+    """Solution callback of CP-SAT that stops the search when the StoppingCriteria are met.
+    The criteria are checked on each solution and each improvement of the bound, and periodically by a watching thread
+    if the time without an improvement is used (the time passes without any callback).
+    It is used as a context manager around the call of Solve.
     """
-    name = 'ORTOOLS'
 
-    def init_cp_vars(self, model, data):
-        """
-        Initializes basic variables for primarly for hard contraints.
-        Returns a dictionary 'basic_cp_vars' containing the names of those variables for further manipulation.
+    def __init__(self, solver, criteria: StoppingCriteria = None):
         """
-        all_nurses = data["all_nurses"]
-        all_shifts = data["all_shifts"]
-        all_days = data["all_days"]
-        all_skills = data["all_skills"]
-
-        # shifts[(n, d, s)]: nurse 'n' works shift 's' on day 'd'.
-        shifts = {}
-        for n in all_nurses:
-            for d in all_days:
-                for s in all_shifts:
-                    shifts[(n, d, s)] = model.NewBoolVar(f"shift_n{n}_d{d}_s{s}")
-
-        working_days = {}
-        for n in all_nurses:
-            for d in all_days:
-                working_days[(n, d)] = model.NewBoolVar(f"shift_n{n}_d{d}")
-
-        # Creates shifts_with_skills variables.
-        # shifts_with_skills[(n, d, s, sk)]: nurse 'n' works shift 's' on day 'd' with skill 'sk'.
-        shifts_with_skills = {}
-        for n in all_nurses:
-            for d in all_days:
-                for s in all_shifts:
-                    for sk in all_skills:
-                        shifts_with_skills[(n, d, s, sk)] = model.NewBoolVar(
-                            f"shift_n{n}_d{d}_s{s}_sk{sk}"
-                        )
-
-        insufficient_staffing = {}
-        for d in all_days:
-            for s in all_shifts:
-                for sk in all_skills:
-                    insufficient_staffing[(d, s, sk)] = model.NewIntVar(
-                        0, 10, f"insufficient_staffing_d{d}_s{s}_sk{sk}"
-                    )
-
-        basic_CP_vars = {}
-        basic_CP_vars["working_days"] = working_days
-        basic_CP_vars["shifts"] = shifts
-        basic_CP_vars["shifts_with_skills"] = shifts_with_skills
-        basic_CP_vars["insufficient_staffing"] = insufficient_staffing
-        return basic_CP_vars
-
-    def init_cp_vars_for_soft_constraints(self, model, basic_CP_vars, data):
-        """Adds variables used by the soft constraints.
-
         Args:
-            model: object that represents the mathematical model
-            basic_cp_vars (dict): contains the variables of the mathematical model
-            data (dict): dictionary that contains data from input files
-
-        Returns:
-            dict: the variables added to the mathematical model
-        """
-        all_nurses = data["all_nurses"]
-        all_shifts = data["all_shifts"]
-        all_days = data["all_days"]
-        num_days = data["num_days"]
-        shifts = basic_CP_vars["shifts"]
-        working_days = basic_CP_vars["working_days"]
-        sc_data = data["sc_data"]
-        history_data = data["h0_data"]
-
-        # Preferences for shifts off
-        unsatisfied_preferences = {}
-        for n in all_nurses:
-            for d in all_days:
-                for s in all_shifts:
-                    unsatisfied_preferences[(n, d, s)] = model.NewBoolVar(
-                        f"unsatisfied_preferences_n{n}_d{d}_s{s}"
-                    )
-
-        # Vars for each nurse how many days they worked
-        total_working_days = {}
-        for n in all_nurses:
-            total_working_days[(n)] = model.NewIntVar(
-                0, num_days, f"total_working_days_n{n}"
-            )
-
-        for n in all_nurses:
-            days_worked = []
-            for d in all_days:
-                for s in all_shifts:
-                    days_worked.append(shifts[(n, d, s)])
-            model.Add(sum(days_worked) == total_working_days[(n)])
-
-        # Vars for each nurse n indicationg if they were working on weekend w
-        working_weekends = {}
-        for n in all_nurses:
-            working_weekends[(n)] = model.NewBoolVar(f"working_weekends_n{n}")
-            model.Add(working_days[(n, 5)] + working_days[(n, 6)] >= working_weekends[(n)])
-            model.Add(working_days[(n, 5)] <= working_weekends[(n)])
-            model.Add(working_days[(n, 6)] <= working_weekends[(n)])
-            # model.Add(sum(shifts_worked_on_saturday) + sum(shifts_worked_on_sunday) >= working_weekends[(n, w)])
-
-        total_working_weekends_over_limit = {}
-        for n in all_nurses:
-            total_working_weekends_over_limit[(n)] = model.NewIntVar(
-                0, 4, f"total_working_weekends_over_limit_n{n}"
-            )
-
-        total_incomplete_weekends = {}
-        for n in all_nurses:
-            total_incomplete_weekends[(n)] = model.NewIntVar(
-                0, 4, f"total_incomplete_weekends_n{n}"
-            )
-
-        total_working_days_over_limit = {}
-        total_working_days_under_limit = {}
-        for n in all_nurses:
-            total_working_days_over_limit[(n)] = model.NewIntVar(
-                0, num_days, f"total_working_days_over_limit_n{n}"
-            )
-            total_working_days_under_limit[(n)] = model.NewIntVar(
-                0, num_days, f"total_working_days_under_limit_n{n}"
-            )
-
-        violations_of_max_consecutive_working_days = {}
-        violations_of_max_consecutive_working_days_for_nurse = {}
-        for n in all_nurses:
-            violations_of_max_consecutive_working_days_for_nurse[(n)] = model.NewIntVar(
-                0, num_days, f"violations_of_max_consecutive_working_days_for_nurse{n}"
-            )
-            all_violation_for_nurse = []
-            max_consecutive_working_days = sc_data["contracts"][
-                contract_to_int[sc_data["nurses"][n]["contract"]]
-            ]["maximumNumberOfConsecutiveWorkingDays"]
-            for d in all_days:
-                if d + max_consecutive_working_days >= num_days:
-                    break
-                violations_of_max_consecutive_working_days[
-                    (n, d + max_consecutive_working_days)
-                ] = model.NewBoolVar(
-                    f"violations_of_max_consecutive_working_days_n{n}_d{d + max_consecutive_working_days}"
-                )
-                all_violation_for_nurse.append(
-                    violations_of_max_consecutive_working_days[
-                        (n, d + max_consecutive_working_days)
-                    ]
-                )
-                working_days_to_sum = []
-                for dd in range(max_consecutive_working_days + 1):
-                    for s in all_shifts:
-                        working_days_to_sum.append(shifts[(n, d + dd, s)])
-                model.Add(
-                    violations_of_max_consecutive_working_days[
-                        (n, d + max_consecutive_working_days)
-                    ]
-                    >= (sum(working_days_to_sum) - max_consecutive_working_days)
-                )
-
-            violations_of_max_consecutive_working_days_from_prev_week = {}
-            prev_week_consecutive_working_days = history_data["nurseHistory"][n][
-                "numberOfConsecutiveWorkingDays"
-            ]
-            if prev_week_consecutive_working_days > 0:
-                for d in range(max_consecutive_working_days):
-                    if prev_week_consecutive_working_days - d == 0:
-                        break
-
-                    violations_of_max_consecutive_working_days_from_prev_week[(n, d)] = (
-                        model.NewBoolVar(
-                            f"violations_of_max_consecutive_working_days_from_prev_week{n}_d{d}"
-                        )
-                    )
-                    all_violation_for_nurse.append(
-                        violations_of_max_consecutive_working_days_from_prev_week[(n, d)]
-                    )
-
-                    working_days_to_sum = []
-                    for dd in range(max_consecutive_working_days - d):
-                        working_days_to_sum.append(working_days[(n, d)])
-                    model.Add(
-                        violations_of_max_consecutive_working_days_from_prev_week[(n, d)]
-                        >= (sum(working_days_to_sum) + d + 1 - max_consecutive_working_days)
-                    )
-
-            model.Add(
-                violations_of_max_consecutive_working_days_for_nurse[(n)]
-                == sum(all_violation_for_nurse)
-            )
-
-        violations_of_max_consecutive_working_shifts = {}
-        violations_of_max_consecutive_working_shifts_for_nurse_for_shift_type = {}
-        for n in all_nurses:
-            for s in all_shifts:
-                violations_of_max_consecutive_working_shifts_for_nurse_for_shift_type[
-                    (n, s)
-                ] = model.NewIntVar(
-                    0,
-                    num_days,
-                    f"violations_of_max_consecutive_working_shifts_for_nurse_for_shift_type_n{n}_s{s}",
-                )
-                all_violation_for_nurse_for_shift_type = []
-                max_consecutive_working_shifts = sc_data["shiftTypes"][s][
-                    "maximumNumberOfConsecutiveAssignments"
-                ]
-                for d in all_days:
-                    if d + max_consecutive_working_shifts >= num_days:
-                        break
-                    violations_of_max_consecutive_working_shifts[
-                        (n, s, d + max_consecutive_working_shifts)
-                    ] = model.NewBoolVar(
-                        f"violations_of_max_consecutive_working_shifts_n{n}_s{s}_d{d + max_consecutive_working_shifts}"
-                    )
-                    all_violation_for_nurse_for_shift_type.append(
-                        violations_of_max_consecutive_working_shifts[
-                            (n, s, d + max_consecutive_working_shifts)
-                        ]
-                    )
-                    working_shifts_to_sum = []
-                    for dd in range(max_consecutive_working_shifts + 1):
-                        working_shifts_to_sum.append(shifts[(n, d + dd, s)])
-                    model.Add(
-                        violations_of_max_consecutive_working_shifts[
-                            (n, s, d + max_consecutive_working_shifts)
-                        ]
-                        >= (sum(working_shifts_to_sum) - max_consecutive_working_shifts)
-                    )
-                model.Add(
-                    violations_of_max_consecutive_working_shifts_for_nurse_for_shift_type[
-                        (n, s)
-                    ]
-                    == sum(all_violation_for_nurse_for_shift_type)
-                )
-
-        violations_of_max_consecutive_days_off = {}
-        violations_of_max_consecutive_days_off_for_nurse = {}
-        for n in all_nurses:
-            violations_of_max_consecutive_days_off_for_nurse[(n)] = model.NewIntVar(
-                0, num_days, f"violations_of_max_consecutive_days_off_for_nurse{n}"
-            )
-            all_violation_for_nurse = []
-            max_consecutive_days_off = sc_data["contracts"][
-                contract_to_int[sc_data["nurses"][n]["contract"]]
-            ]["maximumNumberOfConsecutiveDaysOff"]
-            for d in all_days:
-                if d + max_consecutive_days_off >= num_days:
-                    break
-                violations_of_max_consecutive_days_off[
-                    (n, d + max_consecutive_days_off)
-                ] = model.NewBoolVar(
-                    f"violations_of_max_consecutive_days_off_n{n}_d{d + max_consecutive_working_days}"
-                )
-                all_violation_for_nurse.append(
-                    violations_of_max_consecutive_days_off[
-                        (n, d + max_consecutive_days_off)
-                    ]
-                )
-                days_off_to_sum = []
-                for dd in range(max_consecutive_days_off + 1):
-                    for s in all_shifts:
-                        days_off_to_sum.append(shifts[(n, d + dd, s)])
-                model.Add(
-                    violations_of_max_consecutive_days_off[
-                        (n, d + max_consecutive_days_off)
-                    ]
-                    >= 1 - (sum(days_off_to_sum))
-                )
-            model.Add(
-                violations_of_max_consecutive_days_off_for_nurse[(n)]
-                == sum(all_violation_for_nurse)
-            )
-
-        violations_of_min_consecutive_days_off = {}
-        for n in all_nurses:
-            min_consecutive_days_off = sc_data["contracts"][
-                contract_to_int[sc_data["nurses"][n]["contract"]]
-            ]["minimumNumberOfConsecutiveDaysOff"]
-            for d in all_days:
-                for dd in range(1, min_consecutive_days_off):
-                    violations_of_min_consecutive_days_off[(n, d, dd)] = model.NewBoolVar(
-                        f"violations_of_min_consecutive_days_off_n{n}_d{d}_dd{dd}"
-                    )
-
-        violations_of_min_consecutive_working_days = {}
-        for n in all_nurses:
-            min_consecutive_working_days = sc_data["contracts"][
-                contract_to_int[sc_data["nurses"][n]["contract"]]
-            ]["minimumNumberOfConsecutiveWorkingDays"]
-            for d in all_days:
-                for dd in range(1, min_consecutive_working_days):
-                    violations_of_min_consecutive_working_days[(n, d, dd)] = (
-                        model.NewBoolVar(
-                            f"violations_of_min_consecutive_working_days_n{n}_d{d}_dd{dd}"
-                        )
-                    )
+            solver (CpSolver): the CP-SAT solver
+            criteria (StoppingCriteria, optional): the criteria. Defaults to None (the search is never stopped).
+        """
+        cp_model.CpSolverSolutionCallback.__init__(self)
+        self.solver = solver
+        self.tracker = StoppingTracker(criteria)
+        self._done = threading.Event()
+        self._thread = None
+
+    def on_solution_callback(self):
+        self.tracker.update(self.ObjectiveValue(), self.BestObjectiveBound())
+        if self.tracker.should_stop():
+            self.StopSearch()
+
+    def on_bound(self, bound):
+        self.tracker.update(None, bound)
+        if self.tracker.should_stop():
+            self.solver.StopSearch()
+
+    def __enter__(self):
+        self.solver.best_bound_callback = self.on_bound
+        if self.tracker.watches_time:
+            self._thread = threading.Thread(target=self._watch, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._done.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.solver.best_bound_callback = None
+
+    def _watch(self):
+        while not self._done.wait(0.1):
+            if self.tracker.should_stop():
+                self.solver.StopSearch()
+                return
 
-        violations_of_min_consecutive_shifts = {}
-        for n in all_nurses:
-            for d in all_days:
-                for s in all_shifts:
-                    min_consecutive_working_shifts = sc_data["shiftTypes"][s][
-                        "minimumNumberOfConsecutiveAssignments"
-                    ]
-                    for dd in range(1, min_consecutive_working_shifts):
-                        violations_of_min_consecutive_shifts[(n, d, s, dd)] = (
-                            model.NewBoolVar(
-                                f"violations_of_min_consecutive_shifts_n{n}_d{d}_s{s}_dd{dd}"
-                            )
-                        )
 
-        not_working_days = {}
-        for n in all_nurses:
-            for d in all_days:
-                not_working_days[(n, d)] = model.NewBoolVar(f"not_working_day_n{n}_d{d}")
-                model.Add(not_working_days[(n, d)] + working_days[(n, d)] == 1)
-
-        not_working_shifts = {}
-        for n in all_nurses:
-            for d in all_days:
-                for s in all_shifts:
-                    not_working_shifts[(n, d, s)] = model.NewBoolVar(
-                        f"not_working_shift_n{n}_d{d}"
-                    )
-                    model.Add(not_working_shifts[(n, d, s)] + shifts[(n, d, s)] == 1)
-
-        soft_CP_vars = {}
-        soft_CP_vars["unsatisfied_preferences"] = unsatisfied_preferences
-        soft_CP_vars["total_working_days"] = total_working_days
-        soft_CP_vars["working_weekends"] = working_weekends
-        soft_CP_vars["not_working_days"] = not_working_days
-        soft_CP_vars["not_working_shifts"] = not_working_shifts
-        soft_CP_vars["total_working_weekends_over_limit"] = (
-            total_working_weekends_over_limit
-        )
-        soft_CP_vars["total_working_days_over_limit"] = total_working_days_over_limit
-        soft_CP_vars["total_working_days_under_limit"] = total_working_days_under_limit
-        soft_CP_vars["total_incomplete_weekends"] = total_incomplete_weekends
-        soft_CP_vars["violations_of_max_consecutive_working_days_for_nurse"] = (
-            violations_of_max_consecutive_working_days_for_nurse
-        )
-        soft_CP_vars["violations_of_max_consecutive_days_off_for_nurse"] = (
-            violations_of_max_consecutive_days_off_for_nurse
-        )
-        soft_CP_vars[
-            "violations_of_max_consecutive_working_shifts_for_nurse_for_shift_type"
-        ] = violations_of_max_consecutive_working_shifts_for_nurse_for_shift_type
-        soft_CP_vars["violations_of_min_consecutive_days_off"] = (
-            violations_of_min_consecutive_days_off
-        )
-        soft_CP_vars["violations_of_min_consecutive_working_days"] = (
-            violations_of_min_consecutive_working_days
-        )
-        soft_CP_vars["violations_of_min_consecutive_shifts"] = (
-            violations_of_min_consecutive_shifts
-        )
-
-        return soft_CP_vars
+class ORTOOLS_Solver(NSP_solver):
+    """Child Class from NSP_solver that uses CP SAT solver from OR-TOOLS to compute a schedule per week.
+    The model of the week is generated by model_generator.py and compiled into CP-SAT by ir_compilers.py.
+    """
+    name = 'ORTOOLS'
 
-    def add_hard_constrains(self, model, basic_CP_vars, data):
-        """
-        Adds all hard constraints to the model.
+    def __init__(self, reuse_model: bool = False, lookahead: bool = False, cp_sat_profile: str = DEFAULT_PROFILE):
         """
-        all_nurses = data["all_nurses"]
-        all_shifts = data["all_shifts"]
-        all_days = data["all_days"]
-        all_skills = data["all_skills"]
-        num_days = data["num_days"]
-        sc_data = data["sc_data"]
-        shifts = basic_CP_vars["shifts"]
-        working_days = basic_CP_vars["working_days"]
-        shifts_with_skills = basic_CP_vars["shifts_with_skills"]
-        # Each nurse works at most one shift per day.
-        for n in all_nurses:
-            for d in all_days:
-                model.AddAtMostOne(shifts[(n, d, s)] for s in all_shifts)
-
-        # Each nurse works at most one skill per day.
-        for n in all_nurses:
-            for d in all_days:
-                for s in all_shifts:
-                    model.AddAtMostOne(
-                        shifts_with_skills[(n, d, s, sk)] for sk in all_skills
-                    )
-
-        # If nurse is working with skill that shift, she is working that shift.
-        for n in all_nurses:
-            for d in all_days:
-                for s in all_shifts:
-                    skills_worked = []
-                    for sk in all_skills:
-                        skills_worked.append(shifts_with_skills[(n, d, s, sk)])
-                    model.Add(sum(skills_worked) == shifts[(n, d, s)])
-
-        for n in all_nurses:
-            for d in all_days:
-                shifts_worked = []
-                for s in all_shifts:
-                    shifts_worked.append(shifts[(n, d, s)])
-                model.Add(sum(shifts_worked) == working_days[(n, d)])
-
-        self.add_shift_succession_reqs(
-            model, shifts, all_nurses, all_days, all_shifts, num_days, data
-        )
-        self.add_missing_skill_req(
-            model, sc_data["nurses"], shifts_with_skills, all_days, all_shifts, all_skills
-        )
-        return
-
-    def add_soft_constraints(self, model, basic_CP_vars, soft_CP_vars, data):
-        """Adds the soft constraints to the model.
+        Args:
+            reuse_model (bool, optional): whether to compile the week-independent part of the model (its skeleton)
+                only once per scenario and only add the parts given by the week data and the history in each week.
+                Defaults to False.
+            lookahead (bool, optional): whether to add the relaxed next week to the model
+                (see model_generator.add_relaxed_next_week). Defaults to False.
+            cp_sat_profile (str, optional): name of the profile of the parameters of CP-SAT (see cp_sat_profiles.py).
+                Defaults to DEFAULT_PROFILE.
+        """
+        get_profile(cp_sat_profile)
+        self.reuse_model = reuse_model
+        self.lookahead = lookahead
+        self.cp_sat_profile = cp_sat_profile
+        self._skeleton = None
+
+    def save_tmp_results(self, results, solver, status, ir: ConstraintIR, week_number):
+        """Stores the solution into the results.
 
         Args:
-            model : object that represents the mathematical model
-            basic_cp_vars (dict): contains the variables of the mathematical model
-            soft_cp_vars (dict): contains the variables of the mathematical model
-            data (dict): dictionary that contains data from input files
+            results (ScheduleTensor | dict): partially computed schedule
+            solver : object that contains the computed solution
+            status : status of the solution
+            ir (ConstraintIR): the model of the week
             week_number (int): number of the computed week
         """
-        all_nurses = data["all_nurses"]
-        all_days = data["all_days"]
-        all_shifts = data["all_shifts"]
-        all_skills = data["all_skills"]
-        sc_data = data["sc_data"]
-        h0_data = data["h0_data"]
-        wd_data = data["wd_data"]
-        shifts = basic_CP_vars["shifts"]
-        working_days = basic_CP_vars["working_days"]
-        unsatisfied_preferences = soft_CP_vars["unsatisfied_preferences"]
-        total_working_days = soft_CP_vars["total_working_days"]
-        total_working_days_over_limit = soft_CP_vars["total_working_days_over_limit"]
-        total_incomplete_weekends = soft_CP_vars["total_incomplete_weekends"]
-        working_weekends = soft_CP_vars["working_weekends"]
-        total_working_weekends_over_limit = soft_CP_vars[
-            "total_working_weekends_over_limit"
-        ]
-        total_working_days_under_limit = soft_CP_vars["total_working_days_under_limit"]
-        total_incomplete_weekends = soft_CP_vars["total_incomplete_weekends"]
-
-        self.add_insatisfied_preferences_reqs(
-            model,
-            wd_data["shiftOffRequests"],
-            unsatisfied_preferences,
-            shifts,
-            all_nurses,
-            all_days,
-            all_shifts,
-            all_skills,
-        )
-
-        self.add_total_working_days_out_of_bounds_constraint(
-            model,
-            sc_data["nurses"],
-            sc_data["contracts"],
-            h0_data["nurseHistory"],
-            total_working_days,
-            total_working_days_over_limit,
-            total_working_days_under_limit,
-            all_nurses,
-        )
-
-        self.add_total_incomplete_weekends_constraint(
-            model,
-            sc_data["nurses"],
-            sc_data["contracts"],
-            total_incomplete_weekends,
-            working_weekends,
-            shifts,
-            working_days,
-            all_nurses,
-            all_days,
-            all_shifts,
-        )
-
-        self.add_total_working_weekends_soft_constraints(
-            model,
-            sc_data["nurses"],
-            sc_data["contracts"],
-            h0_data["nurseHistory"],
-            total_working_weekends_over_limit,
-            working_weekends,
-            all_nurses,
-        )
-
-        self.add_min_consecutive_days_off_constraint(
-            model, basic_CP_vars, soft_CP_vars, data
-        )
-
-        self.add_min_consecutive_working_days_constraint(
-            model, basic_CP_vars, soft_CP_vars, data
-        )
-
-        self.add_min_consecutive_shifts_constraint(
-            model, basic_CP_vars, soft_CP_vars, data
-        )
+        if status != cp_model.FEASIBLE and status != cp_model.OPTIMAL:
+            results[(week_number, "status")] = utils.STATUS_FAIL
+            return
 
-        return
+        results[(week_number, "status")] = utils.STATUS_OK
+        results[(week_number, "optimal")] = status == cp_model.OPTIMAL
+        results[(week_number, "objective")] = solver.ObjectiveValue()
+        results[(week_number, "gap")] = utils.relative_gap(solver.ObjectiveValue(), solver.BestObjectiveBound())
+        store_week(results, week_number, self.get_week_values(solver, ir))
 
-    def add_min_consecutive_days_off_constraint(
-        self, model, basic_CP_vars, soft_CP_vars, data
-    ):
-        """Adds the soft constraint that penilizes a number of consecutive days off under the minimum specified in the contract of each nurse.
+    def get_week_values(self, solver, ir: ConstraintIR) -> np.ndarray:
+        """Returns the values of all shifts_with_skills variables of the solution at once.
 
         Args:
-            model: object that represents the mathematical model
-            basic_cp_vars (dict): contains the variables of the mathematical model
-            soft_cp_vars (dict): contains the variables of the mathematical model
-            data (dict): dictionary that contains data from input files
-        """
-        violations_of_min_consecutive_days_off = soft_CP_vars[
-            "violations_of_min_consecutive_days_off"
-        ]
-        all_nurses = data["all_nurses"]
-        all_days = data["all_days"]
-        sc_data = data["sc_data"]
-        working_days = basic_CP_vars["working_days"]
-        not_working_days = soft_CP_vars["not_working_days"]
-
-        for n in all_nurses:
-            consecutive_working_days_prev_week = data["h0_data"]["nurseHistory"][n][
-                "numberOfConsecutiveDaysOff"
-            ]
-            min_consecutive_days_off = sc_data["contracts"][
-                contract_to_int[sc_data["nurses"][n]["contract"]]
-            ]["minimumNumberOfConsecutiveDaysOff"]
-            for d in all_days:
-                for dd in range(1, min_consecutive_days_off):
-                    if (d - dd) > 0:
-                        model.Add(
-                            dd + 1
-                            >= sum(
-                                [-violations_of_min_consecutive_days_off[(n, d, dd)]]
-                                + [working_days[(n, d)]]
-                                + list(
-                                    not_working_days[(n, ddd)] for ddd in range(d - dd, d)
-                                )
-                                + [working_days[(n, d - dd - 1)]]
-                            )
-                        )
-                    else:
-                        if consecutive_working_days_prev_week == d - dd:
-                            model.Add(
-                                dd + 1
-                                >= sum(
-                                    [-violations_of_min_consecutive_days_off[(n, d, dd)]]
-                                    + [working_days[(n, d)]]
-                                    + list(
-                                        not_working_days[(n, ddd)] for ddd in range(0, d)
-                                    )
-                                )
-                            )
-
-    def add_min_consecutive_working_days_constraint(
-        self, model, basic_CP_vars, soft_CP_vars, data
-    ):
-        """
-        Adds the soft constraint that penilizes assignment of a number of consecutive working days under the minimum specified in the constract of each nurse.
+            solver : object that contains the computed solution
+            ir (ConstraintIR): the model of the week
 
-        Args:
-            model : object that represents the mathematical model
-            basic_cp_vars (dict): contains the variables of the mathematical model
-            soft_cp_vars (dict): contains the variables of the mathematical model
-            data (dict): dictionary that contains data from input files
+        Returns:
+            np.ndarray: assignments of shape (nurses, days in week, shifts, skills)
         """
-        violations_of_min_consecutive_working_days = soft_CP_vars[
-            "violations_of_min_consecutive_working_days"
-        ]
-        all_nurses = data["all_nurses"]
-        all_days = data["all_days"]
-        sc_data = data["sc_data"]
-        working_days = basic_CP_vars["working_days"]
-        not_working_days = soft_CP_vars["not_working_days"]
+        solution = np.asarray(solver.response_proto.solution)
+        return solution[ir.shifts_with_skills].astype(np.uint8)
 
-        for n in all_nurses:
-            consecutive_working_days_prev_week = data["h0_data"]["nurseHistory"][n][
-                "numberOfConsecutiveDaysOff"
-            ]
-            min_consecutive_working_days = sc_data["contracts"][
-                contract_to_int[sc_data["nurses"][n]["contract"]]
-            ]["minimumNumberOfConsecutiveWorkingDays"]
-            for d in all_days:
-                for dd in range(1, min_consecutive_working_days):
-                    if (d - dd) > 0:
-                        model.Add(
-                            dd + 1
-                            >= sum(
-                                [-violations_of_min_consecutive_working_days[(n, d, dd)]]
-                                + [not_working_days[(n, d)]]
-                                + list(working_days[(n, ddd)] for ddd in range(d - dd, d))
-                                + [not_working_days[(n, d - dd - 1)]]
-                            )
-                        )
-                    else:
-                        if consecutive_working_days_prev_week == d - dd:
-                            model.Add(
-                                dd + 1
-                                >= sum(
-                                    [
-                                        -violations_of_min_consecutive_working_days[
-                                            (n, d, dd)
-                                        ]
-                                    ]
-                                    + [not_working_days[(n, d)]]
-                                    + list(working_days[(n, ddd)] for ddd in range(0, d))
-                                )
-                            )
-
-    def add_min_consecutive_shifts_constraint(
-        self, model, basic_CP_vars, soft_CP_vars, data
-    ):
-        """Adds the soft constraint that penilizes assignment of a number of consecutive shifts of one type under the minimum specified in the scenario.
+    def build_model(self, data):
+        """Builds the model of the week. If the model is reused, the skeleton compiled for the scenario
+        and the configuration (compiling it if needed) is copied and the rest of the model is added to it.
 
         Args:
-            model: object that represents the mathematical model
-            basic_cp_vars (dict): contains the variables of the mathematical model
-            soft_cp_vars (dict): contains the variables of the mathematical model
             data (dict): dictionary that contains data from input files
-        """
-        violations_of_min_consecutive_shifts = soft_CP_vars[
-            "violations_of_min_consecutive_shifts"
-        ]
-        all_nurses = data["all_nurses"]
-        all_days = data["all_days"]
-        all_shifts = data["all_shifts"]
-        sc_data = data["sc_data"]
-        working_days = basic_CP_vars["working_days"]
-        not_working_shifts = soft_CP_vars["not_working_shifts"]
-
-        for n in all_nurses:
-            consecutive_working_shifts_prev_week = data["h0_data"]["nurseHistory"][n][
-                "numberOfConsecutiveWorkingDays"
-            ]
-            lastAssignedShiftType = data["h0_data"]["nurseHistory"][n][
-                "lastAssignedShiftType"
-            ]
-            lastShiftTypeAsInt = shift_to_int[lastAssignedShiftType]
-            for d in all_days:
-                for s in all_shifts:
-                    min_consecutive_shifts = sc_data["shiftTypes"][s][
-                        "minimumNumberOfConsecutiveAssignments"
-                    ]
-                    for dd in range(1, min_consecutive_shifts):
-                        if (d - dd) > 0:
-                            model.Add(
-                                dd + 1
-                                >= sum(
-                                    [-violations_of_min_consecutive_shifts[(n, d, s, dd)]]
-                                    + [not_working_shifts[(n, d, s)]]
-                                    + list(
-                                        working_days[(n, ddd)] for ddd in range(d - dd, d)
-                                    )
-                                    + [not_working_shifts[(n, d - dd - 1, s)]]
-                                )
-                            )
-                        else:
-                            if (consecutive_working_shifts_prev_week == d - dd) and (
-                                lastShiftTypeAsInt == s
-                            ):
-                                model.Add(
-                                    dd + 1
-                                    >= sum(
-                                        [
-                                            -violations_of_min_consecutive_shifts[
-                                                (n, d, s, dd)
-                                            ]
-                                        ]
-                                        + [not_working_shifts[(n, d, s)]]
-                                        + list(
-                                            working_days[(n, ddd)] for ddd in range(0, d)
-                                        )
-                                    )
-                                )
-
-    def add_total_incomplete_weekends_constraint(
-        self,
-        model,
-        nurses_data,
-        contracts_data,
-        total_incomplete_weekends,
-        working_weekends,
-        shifts,
-        working_days,
-        all_nurses,
-        all_days,
-        all_shifts,
-    ):
-        """Adds the soft constraint that penilizes incomplete weekends.
-        """
-        incomplete_weekends = {}
-        for n in all_nurses:
-            isCompleteWeekendRequested = contracts_data[
-                contract_to_int[nurses_data[n]["contract"]]
-            ]["completeWeekends"]
-            if isCompleteWeekendRequested == 1:
-                incomplete_weekends[(n)] = model.NewBoolVar(f"incomplete_weekends_n{n}")
-                model.Add(
-                    incomplete_weekends[(n)]
-                    == 2 * working_weekends[(n)]
-                    - working_days[(n, 5)]
-                    - working_days[(n, 6)]
-                )
-
-        for n in all_nurses:
-            isCompleteWeekendRequested = contracts_data[
-                contract_to_int[nurses_data[n]["contract"]]
-            ]["completeWeekends"]
-            if isCompleteWeekendRequested == 1:
-                incomplete_weekends_n = []
-                incomplete_weekends_n.append(incomplete_weekends[(n)])
-                model.Add(total_incomplete_weekends[(n)] == sum(incomplete_weekends_n))
-        return
-
-    def add_total_working_days_out_of_bounds_constraint(
-        self,
-        model,
-        nurses_data,
-        contracts_data,
-        history,
-        total_working_days,
-        total_working_days_over_limit,
-        total_working_days_under_limit,
-        all_nurses,
-    ):
-        """Adds the soft constraint that penilizes more working weekends than the specified maximum.
-        """
-        for n in all_nurses:
-            upper_limit = (
-                math.ceil(
-                    contracts_data[contract_to_int[nurses_data[n]["contract"]]][
-                        "maximumNumberOfAssignments"
-                    ]
-                    / 4
-                )
-                + 1
-            )
-            lower_limit = (
-                math.ceil(
-                    contracts_data[contract_to_int[nurses_data[n]["contract"]]][
-                        "minimumNumberOfAssignments"
-                    ]
-                    / 4
-                )
-                - 1
-            )
-            model.Add(
-                total_working_days_over_limit[(n)] >= total_working_days[(n)] - upper_limit
-            )
-            model.Add(
-                total_working_days_under_limit[(n)] >= lower_limit - total_working_days[(n)]
-            )
-        return
-
-    def add_shift_skill_req(self, model, req, basic_CP_vars, soft_CP_vars, data):
-        """Adds hard constraint that dictates minimal number of nurses in a shift working with specific skill.
-        """
-        all_nurses = data["all_nurses"]
-        shifts_with_skills = basic_CP_vars["shifts_with_skills"]
-        insufficient_staffing = basic_CP_vars["insufficient_staffing"]
-
-        shift = shift_to_int[req["shiftType"]]
-        skill = skill_to_int[req["skill"]]
-        minimal_capacities_in_week = [
-            req["requirementOnMonday"]["minimum"],
-            req["requirementOnTuesday"]["minimum"],
-            req["requirementOnWednesday"]["minimum"],
-            req["requirementOnThursday"]["minimum"],
-            req["requirementOnFriday"]["minimum"],
-            req["requirementOnSaturday"]["minimum"],
-            req["requirementOnSunday"]["minimum"],
-        ]
-        optimal_capacities_in_week = [
-            req["requirementOnMonday"]["optimal"],
-            req["requirementOnTuesday"]["optimal"],
-            req["requirementOnWednesday"]["optimal"],
-            req["requirementOnThursday"]["optimal"],
-            req["requirementOnFriday"]["optimal"],
-            req["requirementOnSaturday"]["optimal"],
-            req["requirementOnSunday"]["optimal"],
-        ]
-
-        for day, min_capacity in enumerate(minimal_capacities_in_week):
-            skills_worked = []
-            for n in all_nurses:
-                skills_worked.append(shifts_with_skills[(n, day, shift, skill)])
-            model.Add(sum(skills_worked) >= min_capacity)
-
-        for day, opt_capacity in enumerate(optimal_capacities_in_week):
-            skills_worked = []
-            for n in all_nurses:
-                skills_worked.append(shifts_with_skills[(n, day, shift, skill)])
-            model.Add(
-                opt_capacity - sum(skills_worked)
-                <= insufficient_staffing[(day, shift, skill)]
-            )
-        return
-
-    def add_shift_succession_reqs(
-        self, model, shifts, all_nurses, all_days, all_shifts, num_days, data
-    ):
-        """Adds hard constraint that disables invalid pairs of succcessive shift types.
-        """
-        for n in all_nurses:
-            last_shift = shift_to_int[
-                data["h0_data"]["nurseHistory"][n]["lastAssignedShiftType"]
-            ]
-
-            if last_shift == 2:
-                model.Add(
-                    0 == shifts[(n, 0, last_shift - 1)] + shifts[(n, 0, last_shift - 2)]
-                )
-            if last_shift == 3:
-                model.Add(
-                    0
-                    == shifts[(n, 0, last_shift - 1)]
-                    + shifts[(n, 0, last_shift - 2)]
-                    + shifts[(n, 0, last_shift - 3)]
-                )
-
-            for d in range(num_days - 1):
-                for s in all_shifts:
-                    # if(s == 1):
-                    #     model.AddAtMostOne([shifts[(n, d, s)], shifts[(n, d + 1, s - 1)]])
-                    if s == 2:
-                        model.AddAtMostOne(
-                            [
-                                shifts[(n, d, s)],
-                                shifts[(n, d + 1, s - 1)],
-                                shifts[(n, d + 1, s - 2)],
-                            ]
-                        )
-                    if s == 3:
-                        model.AddAtMostOne(
-                            [
-                                shifts[(n, d, s)],
-                                shifts[(n, d + 1, s - 1)],
-                                shifts[(n, d + 1, s - 2)],
-                                shifts[(n, d + 1, s - 3)],
-                            ]
-                        )
-        return
 
-    def add_missing_skill_req(
-        self, model, nurses_data, shifts_with_skills, all_days, all_shifts, all_skills
-    ):
-        """Adds hard constraint that disables nurses working shift with a skill that they do not possess.
-        """
-        for index, nurse_data in enumerate(nurses_data):
-            for sk in all_skills:
-                has_skill = False
-                for skill in nurse_data["skills"]:
-                    if sk == skill_to_int[skill]:
-                        has_skill = True
-                        break
-                if has_skill is False:
-                    # print(f"  Nurse {nurse_data['id']} does not have skill {sk}")
-                    for d in all_days:
-                        for s in all_shifts:
-                            model.Add(shifts_with_skills[(index, d, s, sk)] == 0)
-
-        return
+        Returns:
+            (CpModel, ConstraintIR): the model of the week and its IR
+        """
+        if not self.reuse_model:
+            ir = build_week_ir(data, self.lookahead)
+            return compile_to_cp_sat(ir), ir
+
+        ir = build_week_ir(data, self.lookahead, skeleton=True)
+        skeleton = self._skeleton
+        if (
+            skeleton is None
+            or skeleton["sc_data"] is not data["sc_data"]
+            or skeleton["configuration"] != data["configuration"]
+            or not np.array_equal(skeleton["size"], ir.skeleton)
+        ):
+            skeleton = {
+                "sc_data": data["sc_data"],
+                "configuration": dict(data["configuration"]),
+                "size": ir.skeleton,
+                "model": compile_skeleton_to_cp_sat(ir),
+            }
+            self._skeleton = skeleton
+        return compile_to_cp_sat(ir, skeleton["model"].Clone()), ir
+
+    def set_resources(self, solver):
+        """Maps the resources of the solver to the parameters of CP-SAT (see cp_sat_profiles.set_cp_sat_resources).
 
-    def add_insatisfied_preferences_reqs(
-        self,
-        model,
-        preferences,
-        unsatisfied_preferences,
-        shifts,
-        all_nurses,
-        all_days,
-        all_shifts,
-        all_skills,
-    ):
-        """Adds the soft constraint that introduces the preferences of nurses for specific assignments/non-assignments.
+        Args:
+            solver (CpSolver): the CP-SAT solver
         """
-        for preference in preferences:
-            nurse_id = int(preference["nurse"].split("_")[1])
-            day_id = day_to_int[preference["day"]]
-            shift_id = shift_to_int[preference["shiftType"]]
+        set_cp_sat_resources(self.resources, solver)
 
-            if shift_id != shift_to_int["Any"]:
-                model.Add(
-                    unsatisfied_preferences[(nurse_id, day_id, shift_id)]
-                    == shifts[(nurse_id, day_id, shift_id)]
-                )
-            else:
-                for shift in all_shifts:
-                    model.Add(
-                        unsatisfied_preferences[(nurse_id, day_id, shift)]
-                        == shifts[(nurse_id, day_id, shift)]
-                    )
-        return
+    def set_parameters(self, solver, time_limit):
+        """Sets the resources of the solver, the parameters of its CP-SAT profile and the time limit.
 
-    def add_total_working_weekends_soft_constraints(
-        self,
-        model,
-        nurses_data,
-        contracts_data,
-        history,
-        total_working_weekends_over_limit,
-        working_weekends,
-        all_nurses,
-    ):
-        """Adds the soft constraint that penilizes more working weekends than the specified maximum.
-        """
-        for n in all_nurses:
-            worked_weekends = []
-            worked_weekends_limit = contracts_data[
-                contract_to_int[nurses_data[n]["contract"]]
-            ]["maximumNumberOfWorkingWeekends"]
-            worked_weekends.append(working_weekends[(n)])
-            model.Add(
-                total_working_weekends_over_limit[(n)]
-                >= sum(worked_weekends)
-                - worked_weekends_limit
-                + history[n]["numberOfWorkingWeekends"]
-            )
-            model.Add(
-                total_working_weekends_over_limit[(n)]
-                >= -(
-                    sum(worked_weekends)
-                    - worked_weekends_limit
-                    + history[n]["numberOfWorkingWeekends"]
-                )
-            )
-        return
-
-    def set_objective_function(self, model, basic_CP_vars, soft_CP_vars, data):
-        """Sets the objective function contatining all penalties from all enabled constraints.
+        Args:
+            solver (CpSolver): the CP-SAT solver
+            time_limit (float): time limit in seconds
         """
-        all_nurses = data["all_nurses"]
-        all_days = data["all_days"]
-        all_shifts = data["all_shifts"]
-        all_skills = data["all_skills"]
-
-        sc_data = data["sc_data"]
+        set_cp_sat_parameters(self.resources, self.cp_sat_profile, solver, time_limit)
 
-        insufficient_staffing = basic_CP_vars["insufficient_staffing"]
-
-        unsatisfied_preferences = soft_CP_vars["unsatisfied_preferences"]
-        total_working_days_over_limit = soft_CP_vars["total_working_days_over_limit"]
-        total_incomplete_weekends = soft_CP_vars["total_incomplete_weekends"]
-        total_working_weekends_over_limit = soft_CP_vars[
-            "total_working_weekends_over_limit"
-        ]
-        total_working_days_under_limit = soft_CP_vars["total_working_days_under_limit"]
-        total_incomplete_weekends = soft_CP_vars["total_incomplete_weekends"]
-        violations_of_max_consecutive_working_days_for_nurse = soft_CP_vars[
-            "violations_of_max_consecutive_working_days_for_nurse"
-        ]
-        violations_of_max_consecutive_days_off_for_nurse = soft_CP_vars[
-            "violations_of_max_consecutive_days_off_for_nurse"
-        ]
-        violations_of_max_consecutive_working_shifts_for_nurse_for_shift_type = (
-            soft_CP_vars[
-                "violations_of_max_consecutive_working_shifts_for_nurse_for_shift_type"
-            ]
-        )
-        violations_of_min_consecutive_days_off = soft_CP_vars[
-            "violations_of_min_consecutive_days_off"
-        ]
-        violations_of_min_consecutive_working_days = soft_CP_vars[
-            "violations_of_min_consecutive_working_days"
-        ]
-        violations_of_min_consecutive_shifts = soft_CP_vars[
-            "violations_of_min_consecutive_shifts"
-        ]
-
-        summed_violations_of_min_cons_days_off = []
-        for n in all_nurses:
-            min_consecutive_days_off = sc_data["contracts"][
-                contract_to_int[sc_data["nurses"][n]["contract"]]
-            ]["minimumNumberOfConsecutiveDaysOff"]
-            for d in all_days:
-                for dd in range(1, min_consecutive_days_off):
-                    summed_violations_of_min_cons_days_off.append(
-                        (min_consecutive_days_off - dd) * violations_of_min_consecutive_days_off[(n, d, dd)]
-                    )
-
-        summed_violations_of_min_cons_working_days = []
-        for n in all_nurses:
-            min_consecutive_working_days = sc_data["contracts"][
-                contract_to_int[sc_data["nurses"][n]["contract"]]
-            ]["minimumNumberOfConsecutiveWorkingDays"]
-            for d in all_days:
-                for dd in range(1, min_consecutive_working_days):
-                    summed_violations_of_min_cons_working_days.append(
-                        (min_consecutive_working_days - dd) * violations_of_min_consecutive_working_days[(n, d, dd)]
-                    )
-
-        summed_violations_of_min_cons_shift_type = []
-        for n in all_nurses:
-            for d in all_days:
-                for s in all_shifts:
-                    min_consecutive_shifts = sc_data["shiftTypes"][s][
-                        "minimumNumberOfConsecutiveAssignments"
-                    ]
-                    for dd in range(1, min_consecutive_shifts):
-                        summed_violations_of_min_cons_shift_type.append(
-                            (min_consecutive_shifts - dd) * violations_of_min_consecutive_shifts[(n, d, s, dd)]
-                        )
-
-        model.Minimize(
-            (
-                30
-                * sum(
-                    insufficient_staffing[(d, s, sk)]
-                    for d in all_days
-                    for s in all_shifts
-                    for sk in all_skills
-                )
-            )
-            + (
-                10
-                * sum(
-                    unsatisfied_preferences[(n, d, s)]
-                    for n in all_nurses
-                    for d in all_days
-                    for s in all_shifts
-                )
-            )
-            + (30 * sum(total_working_weekends_over_limit[(n)] for n in all_nurses))
-            + (30 * sum(total_incomplete_weekends[(n)] for n in all_nurses))
-            + (20 * sum(total_working_days_over_limit[(n)] for n in all_nurses))
-            + (20 * sum(total_working_days_under_limit[(n)] for n in all_nurses))
-            + (
-                30
-                * sum(
-                    violations_of_max_consecutive_working_days_for_nurse[(n)]
-                    for n in all_nurses
-                )
-            )
-            + (
-                30
-                * sum(
-                    violations_of_max_consecutive_days_off_for_nurse[(n)]
-                    for n in all_nurses
-                )
-            )
-            + (
-                15
-                * sum(
-                    violations_of_max_consecutive_working_shifts_for_nurse_for_shift_type[
-                        (n, s)
-                    ]
-                    for n in all_nurses
-                    for s in all_shifts
-                )
-            )
-            + (30 * sum(summed_violations_of_min_cons_days_off))
-            + (30 * sum(summed_violations_of_min_cons_working_days))
-            + (15 * sum(summed_violations_of_min_cons_shift_type))
-        )
-        return
-
-    def save_tmp_results(
-        self, results, solver, status, data, basic_CP_vars, soft_CP_vars, week_number
-    ):
-        """Stores the solution into the results dictionary.
+    def add_warm_start(self, model, ir: ConstraintIR, data):
+        """Adds the initial schedule of the week from data["warm_start"] (if there is any) as a hint for the solver.
 
         Args:
-            results (dict): dictionary used to store partially computed schedule
-            solver : object that contains the computed solution
-            status : status of the solution
+            model: object that represents the mathematical model
+            ir (ConstraintIR): the model of the week
             data (dict): dictionary that contains data from input files
-            basic_cp_vars (dict): contains the variables of the mathematical model
-            soft_cp_vars (dict): contains the variables of the mathematical model
-            week_number (int): number of the computed week
         """
-        num_days = data["num_days"]
-        num_nurses = data["num_nurses"]
-        num_skills = data["num_skills"]
-        num_shifts = data["num_shifts"]
-        history_data = data["h0_data"]
-        working_weekends = soft_CP_vars["working_weekends"]
-
-        shifts_with_skills = basic_CP_vars["shifts_with_skills"]
-        working_days = basic_CP_vars["working_days"]
-        shifts = basic_CP_vars["shifts"]
-
-        if status != cp_model.FEASIBLE and status != cp_model.OPTIMAL:
-            results[(week_number, "status")] = utils.STATUS_FAIL
+        week_values = data.get("warm_start")
+        if week_values is None:
             return
-
-        results[(week_number, "status")] = utils.STATUS_OK
-
-        for n in range(num_nurses):
-            for d in range(num_days):
-                for s in range(num_shifts):
-                    for sk in range(num_skills):
-                        results[(n, d + 7 * week_number, s, sk)] = solver.Value(
-                            shifts_with_skills[(n, d, s, sk)]
-                        )
-                        # if(results[(n, d + 7 * week_number, s, sk)]) == 1:
-                history_data["nurseHistory"][n]["numberOfAssignments"] += solver.Value(
-                    working_days[(n, d)]
-                )
-            history_data["nurseHistory"][n]["numberOfWorkingWeekends"] += solver.Value(
-                working_weekends[(n)]
-            )
-
-            if solver.Value(working_days[(n, 6)]) == 0:
-                consecutive_free_days = 1
-                d = 5
-                while d >= 0 and solver.Value(working_days[(n, d)]) == 0:
-                    consecutive_free_days += 1
-                    d -= 1
-                history_data["nurseHistory"][n][
-                    "numberOfConsecutiveDaysOff"
-                ] = consecutive_free_days
-                history_data["nurseHistory"][n]["numberOfConsecutiveWorkingDays"] = 0
-                history_data["nurseHistory"][n]["numberOfConsecutiveAssignments"] = 0
-                history_data["nurseHistory"][n]["lastAssignedShiftType"] = "None"
-            else:
-                consecutive_work_days = 1
-                d = 5
-                while d >= 0 and solver.Value(working_days[(n, d)]) == 1:
-                    consecutive_work_days += 1
-                    d -= 1
-                history_data["nurseHistory"][n][
-                    "numberOfConsecutiveWorkingDays"
-                ] = consecutive_work_days
-                history_data["nurseHistory"][n]["numberOfConsecutiveDaysOff"] = 0
-
-                consecutive_shift = 0
-                for s in range(num_shifts):
-                    if solver.Value(shifts[(n, 6, s)]) == 1:
-                        consecutive_shift = s
-                        break
-                consecutive_shifts = 1
-                for shift_name, shift_id in shift_to_int.items():
-                    if shift_id == consecutive_shift:
-                        history_data["nurseHistory"][n][
-                            "lastAssignedShiftType"
-                        ] = shift_name
-
-                d = 5
-                while d >= 0 and solver.Value(shifts[(n, d, consecutive_shift)]) == 1:
-                    consecutive_shifts += 1
-                    d -= 1
-                history_data["nurseHistory"][n][
-                    "numberOfConsecutiveAssignments"
-                ] = consecutive_shifts
-
-        return
+        # the impossible assignments are the constant ZERO, which is not hinted
+        mask = ir.assignment_mask
+        model.Proto().solution_hint.vars.extend(ir.shifts_with_skills[mask].tolist())
+        model.Proto().solution_hint.values.extend(np.asarray(week_values, dtype=np.int64)[mask].tolist())
 
     def compute_one_week(self, time_limit_for_week, data, results):
         """Computes a schedule for a week given a time limit and data.
@@ -1174,69 +204,19 @@ class ORTOOLS_Solver(NSP_solver):
             data (dict): dictionary that contains data from input files
             results (dict): dictionary used to store partially computed schedule
         """
-        # Creates the model.
-        model = cp_model.CpModel()
         week_number = data["h0_data"]["week"]
-        # Create ILP variables.
-        # shifts, shifts_with_skills, insufficient_staffing = init_cp_vars(model, all_nurses, all_days, all_shifts, all_skills)
-        basic_CP_vars = self.init_cp_vars(model, data)
-
-        # Add hard constrains to model
-        self.add_hard_constrains(model, basic_CP_vars, data)
-
-        soft_CP_vars = self.init_cp_vars_for_soft_constraints(model, basic_CP_vars, data)
+        model, ir = self.build_model(data)
 
-        for req in data["wd_data"]["requirements"]:
-            self.add_shift_skill_req(model, req, basic_CP_vars, soft_CP_vars, data)
-
-        self.add_soft_constraints(model, basic_CP_vars, soft_CP_vars, data)
-
-        # Sets objective function
-        self.set_objective_function(model, basic_CP_vars, soft_CP_vars, data)
+        self.add_warm_start(model, ir, data)
 
         # Creates the solver and solve.
         solver = cp_model.CpSolver()
-        # solver.parameters.linearization_level = 0
-        solver.parameters.num_search_workers = 1
         solver.parameters.log_search_progress = False  # Turn off search progress logging
         solver.parameters.log_to_stdout = False        # Turn off all logging to stdout
-        # Enumerate all solutions.
-        solver.parameters.enumerate_all_solutions = True
-
-        class NursesPartialSolutionPrinter(cp_model.CpSolverSolutionCallback):
-            """Print intermediate solutions."""
-
-            def __init__(self, basic_CP_vars, soft_CP_vars, data, solution_limit):
-                cp_model.CpSolverSolutionCallback.__init__(self)
-                self._shifts = basic_CP_vars["shifts"]
-                self._shifts_with_skills = basic_CP_vars["shifts_with_skills"]
-                self._num_nurses = data["num_nurses"]
-                self._num_days = data["num_days"]
-                self._num_shifts = data["num_shifts"]
-                self._solution_count = 0
-                self._solution_limit = solution_limit
-
-            def on_solution_callback(self):
-                self._solution_count += 1
-
-                # print(f"Solution {self._solution_count} with value: {self.ObjectiveValue()} and time: {self.WallTime()} s")
-                if self._solution_count >= self._solution_limit:
-                    # print(f"Stop search after {self._solution_limit} solutions")
-                    self.StopSearch()
-
-            def solution_count(self):
-                return self._solution_count
-
-        # Display the first five solutions.
-        solution_limit = 100000
-        solution_printer = NursesPartialSolutionPrinter(
-            basic_CP_vars, soft_CP_vars, data, solution_limit
-        )
+        self.set_parameters(solver, time_limit_for_week)
 
-        solver.parameters.max_time_in_seconds = time_limit_for_week
-        status = solver.Solve(model, solution_printer)
+        # the week stops early if its data["stopping_criteria"] are met
+        with StoppingCallback(solver, data.get("stopping_criteria")) as stopping:
+            status = solver.Solve(model, stopping)
 
-        self.save_tmp_results(
-            results, solver, status, data, basic_CP_vars, soft_CP_vars, week_number
-        )
-        return
+        self.save_tmp_results(results, solver, status, ir, week_number)
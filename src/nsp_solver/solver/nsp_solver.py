@@ -1,10 +1,31 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SolverResources:
+    """Data class describing the computational resources a solver may use for the computation of one week.
+    It contains:
+    the number of threads,
+    the memory limit in megabytes (None for no limit),
+    whether the computation with more threads has to be deterministic.
+    Each solver maps the resources to the native parameters of its engine.
+    """
+    threads: int = 1
+    memory_limit: int = None
+    deterministic: bool = True
 
 
 class NSP_solver(ABC):
     """Abstract class that serves as the interface for solvers used for a compuation of a schedule for a week.
+    The solvers that support the lookahead compute the week together with a relaxed copy of the next week
+    if lookahead is True, but they store only the computed week.
+    The solvers that use CP-SAT set its parameters by the profile named cp_sat_profile (see cp_sat_profiles.py).
     """
     name: str
+    resources: SolverResources = SolverResources()
+    lookahead: bool = False
+    cp_sat_profile: str = "default"
 
     @abstractmethod
     def compute_one_week(self, time_limit_for_week, data, results):
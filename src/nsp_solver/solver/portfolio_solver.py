@@ -0,0 +1,140 @@
+import math
+import multiprocessing
+import queue
+import time
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
+from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import ScheduleTensor, store_week
+
+
+def _run_member(index: int, solver: NSP_solver, time_limit_for_week, data: dict, outcomes):
+    """Computes the week by one member of the portfolio in a separate process and sends back its outcome.
+
+    Args:
+        index (int): index of the member
+        solver (NSP_solver): the member
+        time_limit_for_week (int): time limit for finding a schedule as optimal as possible
+        data (dict): dictionary that contains data from input files
+        outcomes (multiprocessing.Queue): queue for the tuples (index, status, optimal, objective, week_values)
+    """
+    week_number = data["h0_data"]["week"]
+    results = ScheduleTensor.from_data(data)
+    try:
+        solver.compute_one_week(time_limit_for_week, data, results)
+    except Exception as e:
+        print(f"{solver.name} failed: {e}")
+        outcomes.put((index, utils.STATUS_FAIL, False, None, None))
+        return
+    status = results.get((week_number, "status"), utils.STATUS_FAIL)
+    optimal = bool(results.get((week_number, "optimal"), False))
+    objective = results.get((week_number, "objective"))
+    outcomes.put((index, status, optimal, objective, results.week(week_number).copy()))
+
+
+class PortfolioSolver(NSP_solver):
+    """Child Class from NSP_solver that races several solvers on the same week, each in its own process.
+    All members share the time limit of the week. As soon as one of them proves the optimality of its model,
+    the others are stopped. The schedules found by different engines are compared by their objective value
+    in the CP-SAT model of the week and the best one is stored into the results.
+    The members are started as child processes, so the portfolio cannot run inside the daemonic workers of BatchRunner.
+    """
+    name = 'PORTFOLIO'
+
+    def __init__(self, solvers: list[NSP_solver], grace_period: float = 60):
+        """
+        Args:
+            solvers (list[NSP_solver]): members of the portfolio (several backends or differently configured solvers)
+            grace_period (float, optional): seconds given to the members over the time limit for building their models.
+                Defaults to 60.
+        """
+        self.solvers = solvers
+        self.grace_period = grace_period
+        self._reference_solver = ORTOOLS_Solver(reuse_model=True)
+
+    def evaluate_week(self, data, week_values) -> float:
+        """Returns the objective value of the schedule of the week in the CP-SAT model of the week.
+
+        Args:
+            data (dict): dictionary that contains data from input files
+            week_values (np.ndarray): assignments of shape (nurses, days in week, shifts, skills)
+
+        Returns:
+            float: the objective value (math.inf if the schedule violates the model)
+        """
+        model, ir = self._reference_solver.build_model(data)
+        week_values = np.asarray(week_values, dtype=np.int64)
+        # the impossible assignments are the constant ZERO
+        mask = ir.assignment_mask
+        if week_values[~mask].any():
+            return math.inf
+        proto = model.Proto()
+        for column, value in zip(ir.shifts_with_skills[mask].tolist(), week_values[mask].tolist()):
+            domain = proto.variables[column].domain
+            domain.clear()
+            domain.extend([value, value])
+        solver = cp_model.CpSolver()
+        solver.parameters.num_search_workers = 1
+        status = solver.Solve(model)
+        if status != cp_model.FEASIBLE and status != cp_model.OPTIMAL:
+            return math.inf
+        return solver.ObjectiveValue()
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        """Computes a schedule for a week given a time limit and data.
+
+        Args:
+            time_limit_for_week (int): time limit for finding a schedule as optimal as possible
+            data (dict): dictionary that contains data from input files
+            results (dict): dictionary used to store partially computed schedule
+        """
+        week_number = data["h0_data"]["week"]
+        outcomes = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=_run_member, args=(index, solver, time_limit_for_week, data, outcomes))
+            for index, solver in enumerate(self.solvers)
+        ]
+        for process in processes:
+            process.start()
+
+        candidates = {}
+        objectives = {}
+        deadline = time.time() + time_limit_for_week + self.grace_period
+        for _ in processes:
+            try:
+                index, status, optimal, objective, week_values = outcomes.get(timeout=max(deadline - time.time(), 0))
+            except queue.Empty:
+                break
+            if status != utils.STATUS_OK:
+                continue
+            candidates[index] = week_values
+            objectives[index] = objective
+            if optimal:
+                print(f"{self.solvers[index].name} proved optimality")
+                break
+
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+        if not candidates:
+            results[(week_number, "status")] = utils.STATUS_FAIL
+            return
+
+        if len(candidates) == 1:
+            best = next(iter(candidates))
+        else:
+            values = {index: self.evaluate_week(data, week_values) for index, week_values in candidates.items()}
+            best = min(values, key=values.get)
+            objectives[best] = values[best]
+            print("portfolio values: " + ", ".join(f"{self.solvers[index].name}: {value}" for index, value in values.items()))
+
+        results[(week_number, "status")] = utils.STATUS_OK
+        results[(week_number, "solver")] = self.solvers[best].name
+        results[(week_number, "objective")] = objectives[best]
+        store_week(results, week_number, candidates[best])
@@ -0,0 +1,46 @@
+import numpy as np
+
+from nsp_solver.utils import utils
+
+
+def assignment_mask(
+    data: dict, window, skills: bool = True, history: bool = True, vacations: bool = False, restrictions: bool = False
+) -> np.ndarray:
+    """Computes which assignments of the window can be made before the model is built.
+    An assignment is impossible if the nurse lacks the skill, if the shift cannot follow the last shift of the nurse
+    before the window, if the nurse is on vacation or if the nurse has already worked the allowed number
+    of shifts of the restricted type. The model generator considers each reason only if the hard constraint
+    that forbids it is enabled.
+
+    Args:
+        data (dict): dictionary that contains data from input files
+        window (HorizonWindow): the weeks of the model (see model_generator.py)
+        skills (bool, optional): whether nurses work only with their skills. Defaults to True.
+        history (bool, optional): whether the first shift of the window must be allowed after the last shift before it.
+            Defaults to True.
+        vacations (bool, optional): whether nurses on vacation do not work. Defaults to False.
+        restrictions (bool, optional): whether the number of shifts of the restricted types is limited. Defaults to False.
+
+    Returns:
+        np.ndarray: boolean array of shape (nurses, days, shifts, skills), False where the assignment is impossible
+    """
+    num_shifts = data["num_shifts"]
+    num_skills = data["num_skills"]
+    mask = np.ones((data["num_nurses"], window.num_days, num_shifts, num_skills), dtype=bool)
+
+    if skills:
+        mask &= window.skills[:, None, None, :num_skills]
+    if history:
+        # the last shift type of a nurse without any shift before the window is None
+        for n, last_shift in enumerate(window.last_shifts.tolist()):
+            if 0 <= last_shift < num_shifts:
+                mask[n, 0, window.forbidden_successions[last_shift]] = False
+    if vacations:
+        mask &= ~window.vacations[:, :, None, None]
+    if restrictions:
+        for n, nurse in enumerate(data["sc_data"]["nurses"]):
+            for restriction in nurse["restrictions"]:
+                s = utils.shift_to_int[restriction["type"]]
+                if restriction["limit"] - window.previous_shifts[n, s] <= 0:
+                    mask[n, :, s] = False
+    return mask
@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+import math
+import time
+
+from nsp_solver.utils import utils
+
+# the smallest decrease of the relative gap that counts as an improvement
+GAP_IMPROVEMENT = 1e-4
+
+
+@dataclass(frozen=True)
+class StoppingCriteria:
+    """Data class describing when the computation of a week stops before its time limit.
+    It contains:
+    the time in seconds without an improvement of the best solution or of the relative gap (counted from the first solution),
+    the relative gap that is small enough,
+    the objective value that is good enough.
+    A criterion is not used if it is None, the computation stops when any of the used criteria is met.
+    Each solver checks the criteria in the callbacks of its engine (see StoppingTracker).
+    """
+    no_improvement_time: float = None
+    relative_gap: float = None
+    objective_target: float = None
+
+    def __post_init__(self):
+        if self.no_improvement_time is not None and self.no_improvement_time <= 0:
+            raise ValueError("the time without an improvement must be positive")
+        if self.relative_gap is not None and self.relative_gap < 0:
+            raise ValueError("the relative gap must not be negative")
+
+
+class StoppingTracker:
+    """Class that follows the best solution and the bound reported by the callbacks of an engine during
+    the computation of one week and decides whether the StoppingCriteria are met.
+    """
+
+    def __init__(self, criteria: StoppingCriteria, clock=time.monotonic):
+        """
+        Args:
+            criteria (StoppingCriteria): the criteria (None for no criteria)
+            clock (callable, optional): returns the current time in seconds. Defaults to time.monotonic.
+        """
+        self.criteria = criteria or StoppingCriteria()
+        self.clock = clock
+        self.objective = None
+        self.bound = None
+        self.gap = math.inf
+        self._last_improvement = None
+
+    @property
+    def watches_time(self) -> bool:
+        """Whether the criteria have to be checked also when the engine does not report any progress."""
+        return self.criteria.no_improvement_time is not None
+
+    def update(self, objective, bound):
+        """Records the objective value of the best solution and the bound of the optimal value.
+
+        Args:
+            objective (float): objective value of the best solution (None if there is no solution yet)
+            bound (float): bound of the optimal value (None if it is not known)
+        """
+        improved = False
+        if objective is not None:
+            improved = self.objective is None or objective < self.objective
+            self.objective = objective
+        if bound is not None:
+            self.bound = bound
+        if self.objective is None:
+            return
+        if self.bound is not None:
+            gap = utils.relative_gap(self.objective, self.bound)
+            improved = improved or gap <= self.gap - GAP_IMPROVEMENT
+            self.gap = min(self.gap, gap)
+        if improved:
+            self._last_improvement = self.clock()
+
+    def should_stop(self) -> bool:
+        """Returns whether any of the criteria is met (never before the first solution)."""
+        if self.objective is None:
+            return False
+        criteria = self.criteria
+        if criteria.objective_target is not None and self.objective <= criteria.objective_target:
+            return True
+        if criteria.relative_gap is not None and self.gap <= criteria.relative_gap:
+            return True
+        return criteria.no_improvement_time is not None and self.clock() - self._last_improvement >= criteria.no_improvement_time
@@ -0,0 +1,233 @@
+from abc import ABC, abstractmethod
+import hashlib
+import json
+import math
+
+import numpy as np
+
+from nsp_solver.utils import utils
+
+
+class WarmStart(ABC):
+    """Abstract class that serves as the interface for providers of an initial schedule for a week.
+    The Simulator stores the initial schedule in data["warm_start"] and the solvers pass it
+    to their engine as a hint (CP-SAT), a MIP start (CPLEX) or a starting point (docplex).
+    """
+
+    @abstractmethod
+    def get_week_start(self, data: dict) -> np.ndarray:
+        """Returns an initial schedule for the week that is being computed.
+
+        Args:
+            data (dict): dictionary that contains data from input files
+
+        Returns:
+            np.ndarray: assignments of shape (nurses, days in week, shifts, skills) or None
+        """
+        pass
+
+    def record_week(self, data: dict, week_values: np.ndarray):
+        """Called with the computed schedule of the week, so that the provider can reuse it later.
+
+        Args:
+            data (dict): dictionary that contains data from input files
+            week_values (np.ndarray): assignments of shape (nurses, days in week, shifts, skills)
+        """
+        pass
+
+
+class GreedyWarmStart(WarmStart):
+    """Constructive heuristic that covers the requirements day by day.
+
+    The minimal capacities are filled first, then the optimal capacities while
+    an assignment costs less than the missing nurse. A nurse is assigned at most once a day,
+    only with her skill, never on a vacation (if h12 is enabled) and never to a shift type
+    that cannot follow her previous shift, including the last shift of the previous week.
+    Among the eligible nurses the one with the lowest penalty for her preferences, used skills if needed,
+    consecutive working days, working weekends and assignments over her share of the contract is chosen.
+    """
+
+    def get_week_start(self, data: dict) -> np.ndarray:
+        sc_data = data["sc_data"]
+        wd_data = data["wd_data"]
+        nurse_history = data["h0_data"]["nurseHistory"]
+        num_nurses = data["num_nurses"]
+        num_days = data["num_days"]
+        num_shifts = data["num_shifts"]
+        num_skills = data["num_skills"]
+        week_number = data["h0_data"]["week"]
+
+        nurses = sc_data["nurses"]
+        contracts = [sc_data["contracts"][utils.contract_to_int[nurse["contract"]]] for nurse in nurses]
+        skills = [{utils.skill_to_int[skill] for skill in nurse["skills"]} for nurse in nurses]
+        skills_if_needed = [{utils.skill_to_int[skill] for skill in nurse.get("skillsIfNeeded", [])} for nurse in nurses]
+        forbidden = self._forbidden_successions(sc_data, num_shifts)
+        off_requests = {
+            (int(request["nurse"].split("_")[1]), utils.day_to_int[request["day"]], utils.shift_to_int[request["shiftType"]])
+            for request in wd_data["shiftOffRequests"]
+        }
+        on_vacation = set()
+        if data["configuration"].get("h12"):
+            on_vacation = {int(nurse_id.split("_")[1]) for nurse_id in wd_data.get("vacations", [])}
+
+        remaining_weeks = max(data["num_weeks"] - week_number, 1)
+        budgets = [
+            math.ceil((contract["maximumNumberOfAssignments"] - history["numberOfAssignments"]) / remaining_weeks)
+            for contract, history in zip(contracts, nurse_history)
+        ]
+        last_shifts = [utils.shift_to_int[history["lastAssignedShiftType"]] for history in nurse_history]
+        consecutive_working_days = [history["numberOfConsecutiveWorkingDays"] for history in nurse_history]
+        working_weekends = [history["numberOfWorkingWeekends"] for history in nurse_history]
+        assignments = [0] * num_nurses
+        works_on_saturday = [False] * num_nurses
+        saturday = utils.day_to_int["Saturday"]
+
+        def penalty(n, d, s, sk):
+            value = 0
+            if (n, d, s) in off_requests or (n, d, utils.shift_to_int["Any"]) in off_requests:
+                value += utils.UNSATISFIED_PREFERENCE_WEIGHT
+            if sk in skills_if_needed[n]:
+                value += utils.TOTAL_IFNEEDED_SKILL_WEIGHT
+            if consecutive_working_days[n] >= contracts[n]["maximumNumberOfConsecutiveWorkingDays"]:
+                value += utils.CONS_WORK_DAY_WEIGHT
+            if assignments[n] >= budgets[n]:
+                value += utils.TOTAL_ASSIGNMENTS_WEIGHT
+            if d >= saturday:
+                if works_on_saturday[n]:
+                    value -= utils.INCOMPLETE_WEEKEND_WEIGHT
+                else:
+                    weekends_over_limit = working_weekends[n] - contracts[n]["maximumNumberOfWorkingWeekends"] + 1
+                    value += utils.TOTAL_WORKING_WEEKENDS_WEIGHT * max(weekends_over_limit, 0)
+            return value
+
+        minimal_capacities, optimal_capacities = self._capacities(wd_data, num_days, num_shifts, num_skills)
+        # the requirements with the fewest skilled nurses are covered first
+        requirement_order = sorted(
+            ((s, sk) for s in range(num_shifts) for sk in range(num_skills)),
+            key=lambda key: sum(key[1] in nurse_skills for nurse_skills in skills),
+        )
+
+        week_values = np.zeros((num_nurses, num_days, num_shifts, num_skills), dtype=np.uint8)
+        for d in range(num_days):
+            shifts_today = [None] * num_nurses
+            coverage = np.zeros((num_shifts, num_skills), dtype=np.int64)
+            for capacities, required in ((minimal_capacities, True), (optimal_capacities, False)):
+                for s, sk in requirement_order:
+                    while coverage[s, sk] < capacities[d, s, sk]:
+                        candidates = [
+                            (penalty(n, d, s, sk), assignments[n] - budgets[n], n)
+                            for n in range(num_nurses)
+                            if shifts_today[n] is None
+                            and n not in on_vacation
+                            and sk in skills[n]
+                            and not forbidden[last_shifts[n], s]
+                        ]
+                        if not candidates:
+                            break
+                        value, _, n = min(candidates)
+                        if not required and value >= utils.OPT_CAPACITY_WEIGHT:
+                            break
+                        week_values[n, d, s, sk] = 1
+                        shifts_today[n] = s
+                        assignments[n] += 1
+                        coverage[s, sk] += 1
+
+            for n in range(num_nurses):
+                if shifts_today[n] is None:
+                    last_shifts[n] = utils.shift_to_int["None"]
+                    consecutive_working_days[n] = 0
+                else:
+                    last_shifts[n] = shifts_today[n]
+                    consecutive_working_days[n] += 1
+                    if d == saturday:
+                        works_on_saturday[n] = True
+
+        return week_values
+
+    @staticmethod
+    def _forbidden_successions(sc_data: dict, num_shifts: int) -> np.ndarray:
+        """Returns True for each pair of the previous shift type (including 'Any' and 'None') and the next shift type
+        that cannot follow each other.
+        """
+        forbidden = np.zeros((len(utils.shift_to_int), num_shifts), dtype=bool)
+        for succession in sc_data["forbiddenShiftTypeSuccessions"]:
+            preceding = utils.shift_to_int[succession["precedingShiftType"]]
+            for succeeding in succession["succeedingShiftTypes"]:
+                forbidden[preceding, utils.shift_to_int[succeeding]] = True
+        return forbidden
+
+    @staticmethod
+    def _capacities(wd_data: dict, num_days: int, num_shifts: int, num_skills: int) -> tuple:
+        """Returns the minimal and the optimal capacities of the week, each of shape (days, shifts, skills).
+        """
+        minimal_capacities = np.zeros((num_days, num_shifts, num_skills), dtype=np.int64)
+        optimal_capacities = np.zeros((num_days, num_shifts, num_skills), dtype=np.int64)
+        for req in wd_data["requirements"]:
+            s = utils.shift_to_int[req["shiftType"]]
+            sk = utils.skill_to_int[req["skill"]]
+            for day_name, d in utils.day_to_int.items():
+                requirement = req[f"requirementOn{day_name}"]
+                minimal_capacities[d, s, sk] = max(minimal_capacities[d, s, sk], requirement["minimum"])
+                optimal_capacities[d, s, sk] = max(optimal_capacities[d, s, sk], requirement["optimal"])
+        return minimal_capacities, optimal_capacities
+
+
+class PreviousRunWarmStart(WarmStart):
+    """Reuses the schedule computed for the same week of the same scenario in a previous run.
+    A schedule is reused only if the week starts from the same history, because a schedule
+    that continued a different history can violate the hard constraints on the successions.
+    The schedules are kept in memory and can be saved to and loaded from a NumPy .npz file.
+    Weeks that were not computed yet are given by the fallback provider.
+    """
+
+    def __init__(self, fallback: WarmStart = None, solutions: dict = None):
+        """
+        Args:
+            fallback (WarmStart, optional): provider used for weeks without a previous schedule. Defaults to None.
+            solutions (dict, optional): previously computed schedules keyed by week_key. Defaults to None.
+        """
+        self.fallback = fallback
+        self.solutions = {} if solutions is None else solutions
+
+    @staticmethod
+    def week_key(data: dict) -> str:
+        """Returns the key identifying the scenario, the number, the data and the history of the computed week.
+        """
+        wd_data = data["wd_data"]
+        week_content = {key: wd_data[key] for key in ("requirements", "shiftOffRequests", "vacations") if key in wd_data}
+        week_content["nurseHistory"] = data["h0_data"]["nurseHistory"]
+        digest = hashlib.sha1(json.dumps(week_content, sort_keys=True).encode()).hexdigest()
+        return f'{data["sc_data"].get("id", "")}_w{data["h0_data"]["week"]}_{digest}'
+
+    def get_week_start(self, data: dict) -> np.ndarray:
+        week_values = self.solutions.get(self.week_key(data))
+        if week_values is None and self.fallback is not None:
+            return self.fallback.get_week_start(data)
+        return week_values
+
+    def record_week(self, data: dict, week_values: np.ndarray):
+        self.solutions[self.week_key(data)] = np.array(week_values, dtype=np.uint8)
+
+    def save(self, file_path: str):
+        """Saves the recorded schedules to a .npz file.
+
+        Args:
+            file_path (str): path to the output file
+        """
+        with open(file_path, "wb") as file:
+            np.savez_compressed(file, **self.solutions)
+
+    @classmethod
+    def load(cls, file_path: str, fallback: WarmStart = None) -> "PreviousRunWarmStart":
+        """Loads the schedules saved by a previous run.
+
+        Args:
+            file_path (str): path to the .npz file
+            fallback (WarmStart, optional): provider used for weeks without a previous schedule. Defaults to None.
+
+        Returns:
+            PreviousRunWarmStart: provider with the loaded schedules
+        """
+        with np.load(file_path) as file:
+            solutions = {key: file[key] for key in file.files}
+        return cls(fallback, solutions)
@@ -0,0 +1,256 @@
+from dataclasses import dataclass, fields
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+
+import numpy as np
+
+from nsp_solver.utils import utils
+
+FORMAT_VERSION = 1
+
+CONTRACT_FIELDS = [
+    "minimumNumberOfAssignments",
+    "maximumNumberOfAssignments",
+    "minimumNumberOfConsecutiveWorkingDays",
+    "maximumNumberOfConsecutiveWorkingDays",
+    "minimumNumberOfConsecutiveDaysOff",
+    "maximumNumberOfConsecutiveDaysOff",
+    "maximumNumberOfWorkingWeekends",
+    "completeWeekends",
+    "minimumNumberOfAssignmentsHard",
+    "maximumNumberOfAssignmentsHard",
+    "minimumNumberOfConsecutiveWorkingDaysHard",
+    "maximumNumberOfConsecutiveWorkingDaysHard",
+    "minimumNumberOfConsecutiveDaysOffHard",
+    "maximumNumberOfConsecutiveDaysOffHard",
+    "maximumNumberOfIncompleteWeekendsHard",
+    "minimalFreePeriod",
+]
+SHIFT_TYPE_FIELDS = [
+    "minimumNumberOfConsecutiveAssignments",
+    "maximumNumberOfConsecutiveAssignments",
+    "minimumNumberOfConsecutiveAssignmentsHard",
+    "maximumNumberOfConsecutiveAssignmentsHard",
+]
+HISTORY_FIELDS = [
+    "numberOfAssignments",
+    "numberOfWorkingWeekends",
+    "numberOfIncompleteWeekends",
+    "numberOfConsecutiveAssignments",
+    "numberOfConsecutiveWorkingDays",
+    "numberOfConsecutiveDaysOff",
+]
+# value of the fields that are missing in the input files
+MISSING = -1
+
+
+@dataclass
+class CompiledScenario:
+    """NumPy arrays compiled from one bundle of the input files (configuration, history, scenario and weeks).
+
+    The arrays are indexed by the integer indices used by the solvers (utils.shift_to_int, utils.skill_to_int,
+    utils.contract_to_int, utils.day_to_int and the order of the nurses in the scenario file).
+    The contract, shift type and history fields are stored in the order of CONTRACT_FIELDS, SHIFT_TYPE_FIELDS
+    and HISTORY_FIELDS (MISSING if a field is not in the files).
+    """
+    key: str
+    nurse_ids: np.ndarray
+    nurse_contracts: np.ndarray
+    nurse_skills: np.ndarray
+    nurse_skills_if_needed: np.ndarray
+    wanted_overtime: np.ndarray
+    contracts: np.ndarray
+    shift_types: np.ndarray
+    forbidden_successions: np.ndarray
+    history: np.ndarray
+    last_shift_types: np.ndarray
+    requirements: np.ndarray
+    preferences: np.ndarray
+    vacations: np.ndarray
+
+    @property
+    def nurse_index(self) -> dict:
+        """Returns the index of each nurse id."""
+        return {str(nurse_id): n for n, nurse_id in enumerate(self.nurse_ids)}
+
+
+def content_key(file_paths: list[str]) -> str:
+    """Returns the hash of the content of the input files (in the given order) and of the format of the artifact.
+
+    Args:
+        file_paths (list[str]): paths to the input files
+
+    Returns:
+        str: hexadecimal digest
+    """
+    digest = hashlib.sha256(f"format {FORMAT_VERSION}".encode())
+    for file_path in file_paths:
+        with open(file_path, "rb") as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+    return digest.hexdigest()
+
+
+def compile_scenario(config_data: dict, history_data: dict, sc_data: dict, wd_data: list, key: str = "") -> CompiledScenario:
+    """Compiles the parsed input files into NumPy arrays.
+
+    Args:
+        config_data (dict): parsed configuration file
+        history_data (dict): parsed history file
+        sc_data (dict): parsed scenario file
+        wd_data (list): parsed week files
+        key (str, optional): content hash of the input files. Defaults to "".
+
+    Returns:
+        CompiledScenario: the compiled arrays
+    """
+    nurses = sc_data["nurses"]
+    num_nurses = len(nurses)
+    num_shifts = len(sc_data["shiftTypes"])
+    num_skills = len(sc_data["skills"])
+    num_days = len(utils.day_to_int)
+    nurse_index = {nurse["id"]: n for n, nurse in enumerate(nurses)}
+
+    nurse_skills = np.zeros((num_nurses, num_skills), dtype=bool)
+    nurse_skills_if_needed = np.zeros((num_nurses, num_skills), dtype=bool)
+    for n, nurse in enumerate(nurses):
+        for skill in nurse["skills"]:
+            nurse_skills[n, utils.skill_to_int[skill]] = True
+        for skill in nurse.get("skillsIfNeeded", []):
+            nurse_skills_if_needed[n, utils.skill_to_int[skill]] = True
+
+    contracts = np.full((len(utils.contract_to_int), len(CONTRACT_FIELDS)), MISSING, dtype=np.int64)
+    for contract in sc_data["contracts"]:
+        contracts[utils.contract_to_int[contract["id"]]] = [contract.get(field, MISSING) for field in CONTRACT_FIELDS]
+
+    shift_types = np.full((num_shifts, len(SHIFT_TYPE_FIELDS)), MISSING, dtype=np.int64)
+    for shift_type in sc_data["shiftTypes"]:
+        shift_types[utils.shift_to_int[shift_type["id"]]] = [shift_type.get(field, MISSING) for field in SHIFT_TYPE_FIELDS]
+
+    forbidden_successions = np.zeros((num_shifts, num_shifts), dtype=bool)
+    for succession in sc_data["forbiddenShiftTypeSuccessions"]:
+        for succeeding in succession["succeedingShiftTypes"]:
+            forbidden_successions[utils.shift_to_int[succession["precedingShiftType"]], utils.shift_to_int[succeeding]] = True
+
+    nurse_history = history_data["nurseHistory"]
+    history = np.array([[record.get(field, MISSING) for field in HISTORY_FIELDS] for record in nurse_history], dtype=np.int64)
+    last_shift_types = np.array([utils.shift_to_int[record["lastAssignedShiftType"]] for record in nurse_history], dtype=np.int64)
+
+    requirements = np.zeros((len(wd_data), num_days, num_shifts, num_skills, 2), dtype=np.int64)
+    preferences = np.zeros((len(wd_data), num_nurses, num_days, num_shifts), dtype=bool)
+    vacations = np.zeros((len(wd_data), num_nurses), dtype=bool)
+    for w, week in enumerate(wd_data):
+        for req in week["requirements"]:
+            s = utils.shift_to_int[req["shiftType"]]
+            sk = utils.skill_to_int[req["skill"]]
+            for day_name, d in utils.day_to_int.items():
+                requirement = req[f"requirementOn{day_name}"]
+                requirements[w, d, s, sk] = np.maximum(requirements[w, d, s, sk], [requirement["minimum"], requirement["optimal"]])
+        for request in week["shiftOffRequests"]:
+            shift = utils.shift_to_int[request["shiftType"]]
+            shifts = slice(None) if shift == utils.shift_to_int["Any"] else shift
+            preferences[w, nurse_index[request["nurse"]], utils.day_to_int[request["day"]], shifts] = True
+        for nurse_id in week.get("vacations", []):
+            vacations[w, nurse_index[nurse_id]] = True
+
+    return CompiledScenario(
+        key=key,
+        nurse_ids=np.array([nurse["id"] for nurse in nurses]),
+        nurse_contracts=np.array([utils.contract_to_int[nurse["contract"]] for nurse in nurses], dtype=np.int64),
+        nurse_skills=nurse_skills,
+        nurse_skills_if_needed=nurse_skills_if_needed,
+        wanted_overtime=np.array([nurse.get("wantedOvertime", 0) for nurse in nurses], dtype=np.int64),
+        contracts=contracts,
+        shift_types=shift_types,
+        forbidden_successions=forbidden_successions,
+        history=history,
+        last_shift_types=last_shift_types,
+        requirements=requirements,
+        preferences=preferences,
+        vacations=vacations,
+    )
+
+
+class ScenarioCache:
+    """Cache of the compiled input files on the disk.
+
+    Each bundle of the input files is stored in a directory named by the content hash of the files.
+    The directory holds one .npy file for each array of the CompiledScenario, which are memory-mapped on load,
+    and the parsed documents pickled, so that the JSON files are parsed only when the bundle is seen for the first time.
+    If the artifact cannot be read, the JSON files are parsed again and the artifact is rewritten.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir (str): directory with the compiled artifacts
+        """
+        self.cache_dir = cache_dir
+
+    def load(self, config_file_path: str, history_file_path: str, scenario_file_path: str, week_files_paths: list[str]):
+        """Loads the input files from the artifact (compiling it first if needed).
+
+        Returns:
+            (dict, dict, dict, dict, list, CompiledScenario): configuration, history, a second copy of the history,
+            scenario, weeks and the compiled arrays
+        """
+        file_paths = [config_file_path, history_file_path, scenario_file_path, *week_files_paths]
+        key = content_key(file_paths)
+        directory = os.path.join(self.cache_dir, key)
+        if os.path.isdir(directory):
+            try:
+                return self._read(directory, key)
+            except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+                logging.warning(f"Scenario artifact {directory} cannot be read, it is compiled again")
+                shutil.rmtree(directory, ignore_errors=True)
+
+        documents = []
+        for file_path in file_paths:
+            with open(file_path) as file:
+                documents.append(json.load(file))
+        config_data, history_data, sc_data, *wd_data = documents
+        compiled = compile_scenario(config_data, history_data, sc_data, wd_data, key)
+        self._write(directory, compiled, config_data, history_data, sc_data, wd_data)
+        return self._read(directory, key)
+
+    def _write(self, directory: str, compiled: CompiledScenario, config_data, history_data, sc_data, wd_data):
+        """Writes the artifact into a temporary directory that is then renamed,
+        so that the processes sharing the cache never see a partially written artifact.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_directory = tempfile.mkdtemp(dir=self.cache_dir)
+        for field in fields(CompiledScenario):
+            if field.name != "key":
+                np.save(os.path.join(tmp_directory, f"{field.name}.npy"), getattr(compiled, field.name))
+        with open(os.path.join(tmp_directory, "documents.pickle"), "wb") as file:
+            pickle.dump((config_data, sc_data, wd_data), file, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(os.path.join(tmp_directory, "history.pickle"), "wb") as file:
+            pickle.dump(history_data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            os.rename(tmp_directory, directory)
+        except OSError:
+            # another process has written the same artifact in the meantime
+            shutil.rmtree(tmp_directory, ignore_errors=True)
+
+    def _read(self, directory: str, key: str):
+        arrays = {
+            field.name: np.load(os.path.join(directory, f"{field.name}.npy"), mmap_mode="r")
+            for field in fields(CompiledScenario)
+            if field.name != "key"
+        }
+        with open(os.path.join(directory, "documents.pickle"), "rb") as file:
+            config_data, sc_data, wd_data = pickle.load(file)
+        with open(os.path.join(directory, "history.pickle"), "rb") as file:
+            history_bytes = file.read()
+        return (
+            config_data,
+            pickle.loads(history_bytes),
+            pickle.loads(history_bytes),
+            sc_data,
+            wd_data,
+            CompiledScenario(key=key, **arrays),
+        )
@@ -0,0 +1,197 @@
+import numpy as np
+
+
+class ScheduleTensor:
+    """Dense storage of a schedule computed over all weeks.
+
+    The assignments are kept in a uint8 array of shape (nurses, days, shifts, skills),
+    where the days are counted over the whole horizon (day d of week w has index d + 7 * w).
+    The status of each computed week is kept in a separate per-week array.
+
+    The class also behaves like the former results dictionary, so that
+    results[(n, d, s, sk)] and results[(week_number, "status")] keep working.
+    """
+
+    def __init__(self, num_nurses: int, num_weeks: int, num_shifts: int, num_skills: int, num_days: int = 7):
+        """
+        Args:
+            num_nurses (int): number of nurses
+            num_weeks (int): number of weeks of the horizon
+            num_shifts (int): number of shift types
+            num_skills (int): number of skills
+            num_days (int, optional): number of days in a week. Defaults to 7.
+        """
+        self.num_days = num_days
+        self.num_weeks = num_weeks
+        self.assignments = np.zeros(
+            (num_nurses, num_days * num_weeks, num_shifts, num_skills), dtype=np.uint8
+        )
+        self.status = np.full(num_weeks, None, dtype=object)
+        self.other_values = {}
+
+    @classmethod
+    def from_data(cls, data: dict) -> "ScheduleTensor":
+        """Creates an empty schedule for the dimensions given by the data.
+
+        Args:
+            data (dict): dictionary that contains data from input files
+
+        Returns:
+            ScheduleTensor: schedule with only zeroes
+        """
+        return cls(
+            data["num_nurses"],
+            data["num_weeks"],
+            data["num_shifts"],
+            data["num_skills"],
+            data["num_days"],
+        )
+
+    @classmethod
+    def from_dict(cls, results: dict, data: dict) -> "ScheduleTensor":
+        """Converts a schedule stored in the tuple-keyed dictionary into a ScheduleTensor.
+
+        Args:
+            results (dict): schedule stored as dictionary
+            data (dict): dictionary that contains data from input files
+
+        Returns:
+            ScheduleTensor: the same schedule stored densely
+        """
+        schedule = cls.from_data(data)
+        for key, value in results.items():
+            schedule[key] = value
+        return schedule
+
+    @property
+    def shape(self) -> tuple:
+        return self.assignments.shape
+
+    def week(self, week_number: int) -> np.ndarray:
+        """Returns a view on the assignments of the given week.
+
+        Args:
+            week_number (int): number of the week
+
+        Returns:
+            np.ndarray: array of shape (nurses, days in week, shifts, skills)
+        """
+        start = week_number * self.num_days
+        return self.assignments[:, start: start + self.num_days]
+
+    def set_week(self, week_number: int, values):
+        """Stores the assignments of the given week.
+
+        Args:
+            week_number (int): number of the week
+            values (array_like): assignments of shape (nurses, days in week, shifts, skills)
+        """
+        self.week(week_number)[...] = np.rint(values)
+
+    def shifts(self) -> np.ndarray:
+        """Returns the number of assignments of each nurse to each shift type on each day.
+
+        Returns:
+            np.ndarray: array of shape (nurses, days, shifts)
+        """
+        return self.assignments.sum(axis=3, dtype=np.int64)
+
+    def working_days(self) -> np.ndarray:
+        """Returns 1 for each day on which a nurse works and 0 otherwise.
+
+        Returns:
+            np.ndarray: array of shape (nurses, days)
+        """
+        return (self.assignments.any(axis=(2, 3))).astype(np.int64)
+
+    def to_dict(self) -> dict:
+        """Converts the schedule to the tuple-keyed dictionary.
+
+        Returns:
+            dict: schedule stored as dictionary
+        """
+        results = {
+            key: int(value) for key, value in np.ndenumerate(self.assignments)
+        }
+        for week_number, status in enumerate(self.status):
+            if status is not None:
+                results[(week_number, "status")] = status
+        results.update(self.other_values)
+        return results
+
+    def _is_assignment_key(self, key) -> bool:
+        return isinstance(key, tuple) and len(key) == 4
+
+    def _is_status_key(self, key) -> bool:
+        return isinstance(key, tuple) and len(key) == 2 and key[1] == "status"
+
+    def __getitem__(self, key):
+        if self._is_assignment_key(key):
+            return int(self.assignments[key])
+        if self._is_status_key(key):
+            status = self.status[key[0]]
+            if status is None:
+                raise KeyError(key)
+            return status
+        return self.other_values[key]
+
+    def __setitem__(self, key, value):
+        if self._is_assignment_key(key):
+            self.assignments[key] = round(value)
+        elif self._is_status_key(key):
+            self.status[key[0]] = value
+        else:
+            self.other_values[key] = value
+
+    def __contains__(self, key) -> bool:
+        try:
+            self[key]
+        except (KeyError, IndexError):
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except (KeyError, IndexError):
+            return default
+
+
+def as_assignments(results, data: dict) -> np.ndarray:
+    """Returns the assignments of the schedule as an array of shape (nurses, days, shifts, skills).
+    The schedule can be stored either in a ScheduleTensor or in the tuple-keyed dictionary.
+
+    Args:
+        results (ScheduleTensor | dict): computed schedule
+        data (dict): dictionary that contains data from input files
+
+    Returns:
+        np.ndarray: assignments of the whole horizon
+    """
+    if isinstance(results, ScheduleTensor):
+        return results.assignments
+    num_days = data["num_days"] * data["num_weeks"]
+    assignments = np.zeros(
+        (data["num_nurses"], num_days, data["num_shifts"], data["num_skills"]), dtype=np.uint8
+    )
+    for key, value in results.items():
+        if isinstance(key, tuple) and len(key) == 4 and key[1] < num_days:
+            assignments[key] = round(value)
+    return assignments
+
+
+def store_week(results, week_number: int, values: np.ndarray):
+    """Stores the assignments of one computed week into the schedule.
+    The schedule can be stored either in a ScheduleTensor or in the tuple-keyed dictionary.
+
+    Args:
+        results (ScheduleTensor | dict): partially computed schedule
+        week_number (int): number of the computed week
+        values (np.ndarray): assignments of shape (nurses, days in week, shifts, skills)
+    """
+    if isinstance(results, ScheduleTensor):
+        results.set_week(week_number, values)
+        return
+    num_days = values.shape[1]
+    for (n, d, s, sk), value in np.ndenumerate(np.rint(values).astype(np.int64)):
+        results[(n, d + num_days * week_number, s, sk)] = int(value)
@@ -0,0 +1,197 @@
+from nsp_solver.utils import utils
+import numpy as np
+
+
+def streak_lengths(values: np.ndarray, carry: np.ndarray) -> np.ndarray:
+    """Computes the length of the current streak after each day (along the last axis).
+    The streak is reset on days with value 0, otherwise the value of the day is added to it.
+    The streak that starts on the first day continues the streak given by carry.
+
+    Args:
+        values (np.ndarray): values for each day in the last axis
+        carry (np.ndarray): streak carried in from the previous week, shape values.shape[:-1]
+
+    Returns:
+        np.ndarray: the length of the streak after each day
+    """
+    cumulative = np.cumsum(values, axis=-1)
+    is_zero = values == 0
+    base = np.maximum.accumulate(np.where(is_zero, cumulative, 0), axis=-1)
+    in_first_streak = ~np.logical_or.accumulate(is_zero, axis=-1)
+    return cumulative - base + np.where(in_first_streak, carry[..., None], 0)
+
+
+def previous_streak_lengths(streaks: np.ndarray, carry: np.ndarray) -> np.ndarray:
+    """Shifts the streak lengths by one day, so that each day holds the length of the streak before it.
+
+    Args:
+        streaks (np.ndarray): the length of the streak after each day in the last axis
+        carry (np.ndarray): streak carried in from the previous week, shape streaks.shape[:-1]
+
+    Returns:
+        np.ndarray: the length of the streak before each day
+    """
+    return np.concatenate([carry[..., None], streaks[..., :-1]], axis=-1)
+
+
+def long_streaks(days: list, maximum: int, carry: int, breaks: np.ndarray = None, from_day: int = 0):
+    """Yields the days that make a streak longer than the maximum if they all have the value 1,
+    one list of days for each day on which the streak is too long.
+
+    Args:
+        days (list): the value (variable or expression) of each day of the window
+        maximum (int): the maximal length of a streak
+        carry (int): the length of the streak before the first day
+        breaks (np.ndarray, optional): True for each day that ends all streaks. Defaults to no breaks.
+        from_day (int, optional): the first day whose streak is checked. Defaults to 0.
+    """
+    if breaks is None:
+        breaks = np.zeros(len(days), dtype=bool)
+    for d in range(from_day, len(days)):
+        if d >= maximum:
+            first = d - maximum
+        elif carry + d + 1 > maximum:
+            first = 0
+        else:
+            continue
+        if not breaks[first: d + 1].any():
+            yield days[first: d + 1]
+
+
+def short_streaks(days: list, minimum: int, carry: int, breaks: np.ndarray = None, from_day: int = 0):
+    """Yields the streaks shorter than the minimum that end in the window as tuples (pattern, length).
+    The streak happens if all expressions of the pattern have the value 1. A streak ends on a day with the value 0
+    which is not a break, the streaks that last until the end of the window do not end.
+
+    Args:
+        days (list): the value (variable or expression) of each day of the window
+        minimum (int): the minimal length of a streak
+        carry (int): the length of the streak before the first day
+        breaks (np.ndarray, optional): True for each day that ends all streaks. Defaults to no breaks.
+        from_day (int, optional): the first day on which a streak can end. Defaults to 0.
+    """
+    if breaks is None:
+        breaks = np.zeros(len(days), dtype=bool)
+    for end in range(from_day, len(days)):
+        if breaks[end]:
+            continue
+        for length in range(1, minimum):
+            start = end - length
+            if start < 0 or breaks[start:end].any():
+                break
+            pattern = days[start:end] + [1 - days[end]]
+            if start > 0 and not breaks[start - 1]:
+                pattern.append(1 - days[start - 1])
+            elif start == 0 and carry > 0:
+                continue
+            yield pattern, length
+        if 0 < carry and carry + end < minimum and not breaks[:end].any():
+            yield days[:end] + [1 - days[end]], carry + end
+
+
+class StreakIndex:
+    """Run-length index of the consecutive streaks of a schedule.
+
+    For each nurse and day it holds the length of the streak of working days, of days off
+    and of assignments of each shift type that has lasted until that day (including the day).
+    A run ends on its last day with a positive length and that length gives its start.
+    The streaks are computed once and read by all constraints on consecutive assignments.
+    """
+
+    def __init__(
+        self,
+        working_days: np.ndarray,
+        shifts: np.ndarray,
+        carry_working_days: np.ndarray = None,
+        carry_days_off: np.ndarray = None,
+        carry_shifts: np.ndarray = None,
+        breaks: np.ndarray = None,
+    ):
+        """
+        Args:
+            working_days (np.ndarray): 1 for each working day, shape (nurses, days)
+            shifts (np.ndarray): number of assignments of each shift type, shape (nurses, days, shifts)
+            carry_working_days (np.ndarray, optional): consecutive working days before the first day. Defaults to zeroes.
+            carry_days_off (np.ndarray, optional): consecutive days off before the first day. Defaults to zeroes.
+            carry_shifts (np.ndarray, optional): consecutive assignments of each shift type before the first day,
+                shape (nurses, shifts). Defaults to zeroes.
+            breaks (np.ndarray, optional): True for each day that ends all streaks of a nurse,
+                shape (nurses, days). Defaults to no breaks.
+        """
+        num_nurses, _, num_shifts = shifts.shape
+        self.working_days = working_days
+        self.shifts = shifts.transpose(0, 2, 1)
+        self.carry_working_days = self._carry(carry_working_days, (num_nurses,))
+        self.carry_days_off = self._carry(carry_days_off, (num_nurses,))
+        self.carry_shifts = self._carry(carry_shifts, (num_nurses, num_shifts))
+
+        not_broken = np.ones(working_days.shape, dtype=bool) if breaks is None else ~breaks
+
+        self.working_day_streaks = streak_lengths(self.working_days * not_broken, self.carry_working_days)
+        self.day_off_streaks = streak_lengths((1 - self.working_days) * not_broken, self.carry_days_off)
+        self.shift_streaks = streak_lengths(self.shifts * not_broken[:, None, :], self.carry_shifts)
+
+    @classmethod
+    def from_history(cls, working_days: np.ndarray, shifts: np.ndarray, nurse_history: list) -> "StreakIndex":
+        """Creates the index of a schedule that continues the given history.
+
+        Args:
+            working_days (np.ndarray): 1 for each working day, shape (nurses, days)
+            shifts (np.ndarray): number of assignments of each shift type, shape (nurses, days, shifts)
+            nurse_history (list): history of each nurse as loaded from the history file
+
+        Returns:
+            StreakIndex: index with the streaks carried in from the history
+        """
+        last_shifts = np.array([utils.shift_to_int[history["lastAssignedShiftType"]] for history in nurse_history])
+        is_last_shift = last_shifts[:, None] == np.arange(shifts.shape[2])[None, :]
+        consecutive_assignments = np.array([history["numberOfConsecutiveAssignments"] for history in nurse_history])
+        return cls(
+            working_days,
+            shifts,
+            np.array([history["numberOfConsecutiveWorkingDays"] for history in nurse_history]),
+            np.array([history["numberOfConsecutiveDaysOff"] for history in nurse_history]),
+            np.where(is_last_shift, consecutive_assignments[:, None], 0),
+        )
+
+    @staticmethod
+    def _carry(carry: np.ndarray, shape: tuple) -> np.ndarray:
+        if carry is None:
+            return np.zeros(shape, dtype=np.int64)
+        return np.asarray(carry, dtype=np.int64)
+
+    def previous_working_day_streaks(self) -> np.ndarray:
+        return previous_streak_lengths(self.working_day_streaks, self.carry_working_days)
+
+    def previous_day_off_streaks(self) -> np.ndarray:
+        return previous_streak_lengths(self.day_off_streaks, self.carry_days_off)
+
+    def previous_shift_streaks(self) -> np.ndarray:
+        return previous_streak_lengths(self.shift_streaks, self.carry_shifts)
+
+    def interrupted(self, breaks: np.ndarray) -> "StreakIndex":
+        """Returns the index of the same schedule in which all streaks are interrupted on the given days.
+
+        Args:
+            breaks (np.ndarray): True for each day that ends all streaks of a nurse, shape (nurses, days)
+
+        Returns:
+            StreakIndex: index with the interrupted streaks
+        """
+        return StreakIndex(
+            self.working_days,
+            self.shifts.transpose(0, 2, 1),
+            self.carry_working_days,
+            self.carry_days_off,
+            self.carry_shifts,
+            breaks,
+        )
+
+    def last_working_day_streaks(self) -> np.ndarray:
+        return self.working_day_streaks[:, -1]
+
+    def last_day_off_streaks(self) -> np.ndarray:
+        return self.day_off_streaks[:, -1]
+
+    def last_shift_streaks(self) -> np.ndarray:
+        return self.shift_streaks[:, :, -1]
@@ -43,6 +43,20 @@ def isPositiveNumber(number):
     return 0
 
 
+def relative_gap(objective, bound):
+    """Returns the gap between the objective value of a solution and the bound of the optimal value
+    relative to the objective value (0 for a proven optimal solution).
+
+    Args:
+        objective (float): objective value of the solution
+        bound (float): bound of the optimal value
+
+    Returns:
+        float: relative gap
+    """
+    return abs(objective - bound) / max(1.0, abs(objective))
+
+
 def soft_constr_value_print(func):
     """_summary_
 
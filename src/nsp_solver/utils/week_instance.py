@@ -0,0 +1,135 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from nsp_solver.utils import utils
+from nsp_solver.utils.scenario_cache import CONTRACT_FIELDS, HISTORY_FIELDS, SHIFT_TYPE_FIELDS, compile_scenario
+
+
+@dataclass
+class WeekInstance:
+    """NumPy arrays of the week being computed, built once per week from the scenario, the week data
+    and the current history, so that the solvers and the validator do not look up the JSON documents repeatedly.
+
+    The arrays are indexed as the variables of the solvers (nurses, days, shifts, skills).
+    The requirements are stored both in the order of the week file (requirement_*, one row per requirement)
+    and as the coverage of each day, shift and skill (coverage_*).
+    The week data and the history the arrays were built from are kept to recognize a stale instance (see get_week_instance).
+    """
+    week: int
+    nurse_contracts: np.ndarray
+    nurse_limits: np.ndarray
+    skills: np.ndarray
+    skills_if_needed: np.ndarray
+    wanted_overtime: np.ndarray
+    shift_types: np.ndarray
+    forbidden_successions: np.ndarray
+    history: np.ndarray
+    last_shift_types: np.ndarray
+    requirement_shifts: np.ndarray
+    requirement_skills: np.ndarray
+    requirement_minimum: np.ndarray
+    requirement_optimal: np.ndarray
+    coverage_minimum: np.ndarray
+    coverage_optimal: np.ndarray
+    preferences: np.ndarray
+    vacations: np.ndarray
+    vacation_nurses: np.ndarray
+    wd_data: dict = field(default=None, repr=False, compare=False)
+    h0_data: dict = field(default=None, repr=False, compare=False)
+    _columns: dict = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_data(cls, data: dict) -> "WeekInstance":
+        """Builds the arrays of the week given by data["wd_data"] and data["h0_data"].
+
+        Args:
+            data (dict): dictionary that contains data from input files
+
+        Returns:
+            WeekInstance: the arrays of the week
+        """
+        sc_data = data["sc_data"]
+        wd_data = data["wd_data"]
+        compiled = compile_scenario(data["configuration"], data["h0_data"], sc_data, [wd_data])
+        requirements = wd_data["requirements"]
+        return cls(
+            week=data["h0_data"]["week"],
+            nurse_contracts=compiled.nurse_contracts,
+            nurse_limits=compiled.contracts[compiled.nurse_contracts],
+            skills=compiled.nurse_skills,
+            skills_if_needed=compiled.nurse_skills_if_needed,
+            wanted_overtime=compiled.wanted_overtime,
+            shift_types=compiled.shift_types,
+            forbidden_successions=compiled.forbidden_successions,
+            history=compiled.history,
+            last_shift_types=compiled.last_shift_types,
+            requirement_shifts=np.array([utils.shift_to_int[req["shiftType"]] for req in requirements], dtype=np.int64),
+            requirement_skills=np.array([utils.skill_to_int[req["skill"]] for req in requirements], dtype=np.int64),
+            requirement_minimum=_requirement_levels(requirements, "minimum"),
+            requirement_optimal=_requirement_levels(requirements, "optimal"),
+            coverage_minimum=compiled.requirements[0, ..., 0],
+            coverage_optimal=compiled.requirements[0, ..., 1],
+            preferences=compiled.preferences[0],
+            vacations=compiled.vacations[0],
+            vacation_nurses=np.array([int(nurse.split("_")[1]) for nurse in wd_data.get("vacations", [])], dtype=np.int64),
+            wd_data=wd_data,
+            h0_data=data["h0_data"],
+        )
+
+    def contract(self, name: str) -> list[int]:
+        """Returns the value of the field of the contract of each nurse (scenario_cache.MISSING if it is not in the scenario)."""
+        return self._column("contract", name, self.nurse_limits, CONTRACT_FIELDS)
+
+    def history_values(self, name: str) -> list[int]:
+        """Returns the value of the field of the current history of each nurse."""
+        return self._column("history", name, self.history, HISTORY_FIELDS)
+
+    def shift_type(self, name: str) -> list[int]:
+        """Returns the value of the field of each shift type."""
+        return self._column("shift_type", name, self.shift_types, SHIFT_TYPE_FIELDS)
+
+    def _column(self, table: str, name: str, values: np.ndarray, names: list) -> list[int]:
+        """The columns are returned as lists of python ints, which the solver APIs accept as coefficients and bounds."""
+        key = (table, name)
+        if key not in self._columns:
+            self._columns[key] = values[:, names.index(name)].tolist()
+        return self._columns[key]
+
+    def requirements(self):
+        """Yields the requirements in the order of the week file as tuples
+        (shift, skill, minimal capacities, optimal capacities) with the capacities of each day as lists.
+        """
+        minimum = self.requirement_minimum.tolist()
+        optimal = self.requirement_optimal.tolist()
+        for r, (s, sk) in enumerate(zip(self.requirement_shifts.tolist(), self.requirement_skills.tolist())):
+            yield s, sk, minimum[r], optimal[r]
+
+
+def _requirement_levels(requirements: list, level: str) -> np.ndarray:
+    return np.array(
+        [[req[f"requirementOn{day}"][level] for day in utils.day_to_int] for req in requirements], dtype=np.int64
+    ).reshape(len(requirements), len(utils.day_to_int))
+
+
+def get_week_instance(data: dict) -> WeekInstance:
+    """Returns the arrays of the current week stored in data["week_instance"] (building them if they belong to another week
+    or were built from other week data or history documents than data["wd_data"] and data["h0_data"]).
+
+    Args:
+        data (dict): dictionary that contains data from input files
+
+    Returns:
+        WeekInstance: the arrays of the week
+    """
+    instance = data.get("week_instance")
+    if (
+        instance is None
+        or instance.week != data["h0_data"]["week"]
+        or len(instance.nurse_contracts) != data["num_nurses"]
+        or instance.wd_data is not data["wd_data"]
+        or instance.h0_data is not data["h0_data"]
+    ):
+        instance = WeekInstance.from_data(data)
+        data["week_instance"] = instance
+    return instance
@@ -0,0 +1,28 @@
+import hashlib
+import json
+
+FORMAT_VERSION = 3
+
+
+def week_model_key(data: dict) -> str:
+    """Returns the hash of all data the model of the week is generated from:
+    the scenario, the configuration, the week data, the history and the number of weeks.
+
+    Args:
+        data (dict): dictionary that contains data from input files
+
+    Returns:
+        str: hexadecimal digest
+    """
+    # vacations_with_ids is derived from vacations by the solvers
+    wd_data = {key: value for key, value in data["wd_data"].items() if key != "vacations_with_ids"}
+    content = {
+        "format": FORMAT_VERSION,
+        "sc_data": data["sc_data"],
+        "configuration": data["configuration"],
+        "wd_data": wd_data,
+        "h0_data": data["h0_data"],
+        "num_weeks": data["num_weeks"],
+        "num_nurses": data["num_nurses"],
+    }
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
@@ -1,105 +1,124 @@
-from enum import Enum
-from tkinter import LEFT, RIGHT, IntVar, Label, Tk, ttk
-
-
-class CONF_EVAL(Enum):
-    OK = 0
-    CONTINUE_EVEN_THOUGH = 1
-    STOP = 2
+from nsp_solver.validator.decision_policy import CONF_EVAL, ConfigIssue, ConfigReport, DecisionPolicy, InteractivePolicy
 
 
 class ConfigValidator:
     """Class responsible for validating the configuration of a nurse rostering problem.
+    The conflicts between enabled constraints are found by check_configuration without any interaction,
+    the decision whether to continue despite them is left to the DecisionPolicy.
     """
 
-    def evaluate_configuration(self, data) -> CONF_EVAL:
-        """Evaluates the configuration and asks the user if there is a conflict between enabled constraints.
+    def __init__(self, policy: DecisionPolicy = None):
+        """
+        Args:
+            policy (DecisionPolicy, optional): policy deciding about the conflicts.
+                Defaults to None (InteractivePolicy that asks the user in a popup window).
+        """
+        self.policy = policy if policy is not None else InteractivePolicy()
+
+    def evaluate_configuration(self, data, policy: DecisionPolicy = None) -> CONF_EVAL:
+        """Evaluates the configuration and asks the policy if there is a conflict between enabled constraints.
 
         Args:
             data (dict): dictionary that contains data from input files
+            policy (DecisionPolicy, optional): policy deciding about the conflicts. Defaults to None (the policy of the validator).
 
         Returns:
             CONF_EVAL: evaluation result that decides whether the computation will be performed or stopped
         """
         retval = CONF_EVAL.OK
+        for issue in self.check_configuration(data).issues:
+            retval = self.__update_conf_eval_retval(
+                retval, self._get_user_choice(issue, policy)
+            )
+        return retval
 
-        retval = self.__update_conf_eval_retval(
-            retval, self._check_overriding(data)
-        )
-        retval = self.__update_conf_eval_retval(
-            retval, self._check_contradicting(data)
-        )
-        retval = self.__update_conf_eval_retval(
-            retval, self._check_affecting(data)
-        )
+    def check_configuration(self, data) -> ConfigReport:
+        """Finds all conflicts between enabled constraints without asking anybody.
 
-        return retval
+        Args:
+            data (dict): dictionary that contains data from input files
 
-    def _check_overriding(self, data) -> CONF_EVAL:
+        Returns:
+            ConfigReport: the found conflicts
+        """
+        issues = [self._check_overriding(data), self._check_contradicting(data), self._check_affecting(data)]
+        return ConfigReport([issue for issue in issues if issue is not None])
+
+    def _check_overriding(self, data) -> ConfigIssue:
         """Checks configuration of possibly overriding constraints.
 
         Args:
             data (dict): dictionary that contains data from input files
 
         Returns:
-            CONF_EVAL: evaluation result that decides whether the computation will be performed or stopped
+            ConfigIssue: the conflict or None
         """
         conf = data["configuration"]
         if conf["h1"] and conf["h10"]:
-            return self._get_user_choice(
-                "Hard constraint H1 overrides hard constraint H10. \nDo you want to continue?"
+            return ConfigIssue(
+                "overriding",
+                ("h1", "h10"),
+                "Hard constraint H1 overrides hard constraint H10. \nDo you want to continue?",
             )
-        return CONF_EVAL.OK
+        return None
 
-    def _check_contradicting(self, data) -> CONF_EVAL:
+    def _check_contradicting(self, data) -> ConfigIssue:
         """Checks configuration of possibly contradicting constraints.
 
         Args:
             data (dict): dictionary that contains data from input files
 
         Returns:
-            CONF_EVAL: evaluation result that decides whether the computation will be performed or stopped
+            ConfigIssue: the conflict or None
         """
         conf = data["configuration"]
         if not conf["h6"] or not conf["h9"]:
-            return CONF_EVAL.OK
-        for contract in data["sc_data"]["contracts"]:
-            if (
-                contract["minimalFreePeriod"]
-                > contract["maximumNumberOfConsecutiveDaysOffHard"]
-            ):
-                return self._get_user_choice(
-                    "Hard constraints H6 and H9 are contradicting each other.\
-                    \nMinimal free period has more days than the hard maximum number of consecutive days off. \
-                    \nNo solution will be found. \nDo you want to continue?"
-                )
-        return CONF_EVAL.OK
-
-    def _check_affecting(self, data) -> CONF_EVAL:
+            return None
+        contracts = [
+            contract["id"]
+            for contract in data["sc_data"]["contracts"]
+            if contract["minimalFreePeriod"] > contract["maximumNumberOfConsecutiveDaysOffHard"]
+        ]
+        if contracts:
+            return ConfigIssue(
+                "contradicting",
+                ("h6", "h9"),
+                "Hard constraints H6 and H9 are contradicting each other.\
+                \nMinimal free period has more days than the hard maximum number of consecutive days off. \
+                \nNo solution will be found. \nDo you want to continue?",
+                contracts,
+            )
+        return None
+
+    def _check_affecting(self, data) -> ConfigIssue:
         """Checks configuration of constraints that possibly affect each other.
 
         Args:
             data (dict): dictionary that contains data from input files
 
         Returns:
-            CONF_EVAL: evaluation result that decides whether the computation will be performed or stopped
+            ConfigIssue: the conflict or None
         """
         conf = data["configuration"]
         if not conf["h5"] or not conf["s2"]:
-            return CONF_EVAL.OK
-        for contract in data["sc_data"]["contracts"]:
-            if (
-                contract["maximumNumberOfConsecutiveWorkingDaysHard"]
-                < contract["minimumNumberOfConsecutiveWorkingDays"]
-            ):
-                return self._get_user_choice(
-                    "Hard constraints H5 affects soft constraints S2. \
-                    \nThe hard maximum number of consecutive working days is smaller than \
-                    the soft minimum number of consecutive working days. \
-                    \nThe objective value of found solution will be negatively affected. \
-                    \nDo you want to continue?"
-                )
-        return CONF_EVAL.OK
+            return None
+        contracts = [
+            contract["id"]
+            for contract in data["sc_data"]["contracts"]
+            if contract["maximumNumberOfConsecutiveWorkingDaysHard"] < contract["minimumNumberOfConsecutiveWorkingDays"]
+        ]
+        if contracts:
+            return ConfigIssue(
+                "affecting",
+                ("h5", "s2"),
+                "Hard constraints H5 affects soft constraints S2. \
+                \nThe hard maximum number of consecutive working days is smaller than \
+                the soft minimum number of consecutive working days. \
+                \nThe objective value of found solution will be negatively affected. \
+                \nDo you want to continue?",
+                contracts,
+            )
+        return None
 
     def __update_conf_eval_retval(self, retval: CONF_EVAL, new_retval: CONF_EVAL):
         """Updated the value to the higher value of CONF_EVAL
@@ -113,50 +132,14 @@ class ConfigValidator:
         """
         return new_retval if new_retval.value > retval.value else retval
 
-    def __get_dialog_popup(self, question) -> CONF_EVAL:
-        """Returns the popup window and its elements for the given question
-
-        Args:
-            question (str): question that is displayed in the popup window
-        """
-        def stop_option():
-            selected_option.set(CONF_EVAL.STOP.value)
-            win.quit()
-
-        def continue_option():
-            selected_option.set(CONF_EVAL.CONTINUE_EVEN_THOUGH.value)
-            win.quit()
-
-        win = Tk()
-        win.title("Warning")
-        win.config(width=200, height=150)
-        style = ttk.Style()
-        style.theme_use("clam")
-
-        selected_option = IntVar()
-
-        label = Label(win, text=question)
-        label.pack(pady=20)
-
-        button_stop = ttk.Button(win, text="Stop", command=stop_option)
-        button_stop.pack(side=LEFT, padx=20, pady=20)
-        button_continue = ttk.Button(win, text="Continue", command=continue_option)
-        button_continue.pack(side=RIGHT, padx=20, pady=20)
-
-        return win, label, button_stop, button_continue, selected_option
-
-    def _get_user_choice(self, question):
-        """Opens the popup window and wait for the user to make a choice.
+    def _get_user_choice(self, issue: ConfigIssue, policy: DecisionPolicy = None) -> CONF_EVAL:
+        """Asks the policy whether to continue despite the conflict.
 
         Args:
-            question (str): question that is displayed in the popup window
+            issue (ConfigIssue): the conflict
+            policy (DecisionPolicy, optional): policy deciding about the conflict. Defaults to None (the policy of the validator).
 
         Returns:
-            CONF_EVAL: decidion of the user
+            CONF_EVAL: decidion of the policy
         """
-        win, _, _, _, selected_option = (
-            self.__get_dialog_popup(question)
-        )
-        win.mainloop()
-        win.destroy()
-        return CONF_EVAL(selected_option.get())
+        return (policy if policy is not None else self.policy).decide(issue)
@@ -0,0 +1,151 @@
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Callable
+
+
+class CONF_EVAL(Enum):
+    OK = 0
+    CONTINUE_EVEN_THOUGH = 1
+    STOP = 2
+
+
+@dataclass
+class ConfigIssue:
+    """Data class describing one conflict between enabled constraints.
+    It contains the kind of the conflict ("overriding", "contradicting" or "affecting"),
+    the conflicting constraints, the ids of the contracts in which they conflict (empty if it does not depend on contracts)
+    and the question displayed to the user.
+    """
+    kind: str
+    constraints: tuple
+    message: str
+    contracts: list = field(default_factory=list)
+
+
+@dataclass
+class ConfigReport:
+    """Data class holding all conflicts found in a configuration."""
+    issues: list[ConfigIssue] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class ConfigConflictError(ValueError):
+    """Raised by RaisePolicy for a conflict in the configuration."""
+
+    def __init__(self, issue: ConfigIssue):
+        super().__init__(issue.message)
+        self.issue = issue
+
+
+class DecisionPolicy(ABC):
+    """Abstract class that serves as the interface for deciding whether the computation continues
+    when a conflict is found in the configuration.
+    """
+
+    @abstractmethod
+    def decide(self, issue: ConfigIssue) -> CONF_EVAL:
+        """Decides whether the computation continues despite the conflict.
+
+        Args:
+            issue (ConfigIssue): the conflict
+
+        Returns:
+            CONF_EVAL: CONF_EVAL.CONTINUE_EVEN_THOUGH or CONF_EVAL.STOP
+        """
+        pass
+
+
+class AlwaysContinuePolicy(DecisionPolicy):
+    """DecisionPolicy that always continues the computation."""
+
+    def decide(self, issue: ConfigIssue) -> CONF_EVAL:
+        return CONF_EVAL.CONTINUE_EVEN_THOUGH
+
+
+class AlwaysStopPolicy(DecisionPolicy):
+    """DecisionPolicy that always stops the computation."""
+
+    def decide(self, issue: ConfigIssue) -> CONF_EVAL:
+        return CONF_EVAL.STOP
+
+
+class RaisePolicy(DecisionPolicy):
+    """DecisionPolicy that raises ConfigConflictError."""
+
+    def decide(self, issue: ConfigIssue) -> CONF_EVAL:
+        raise ConfigConflictError(issue)
+
+
+class CallbackPolicy(DecisionPolicy):
+    """DecisionPolicy that leaves the decision to the given function."""
+
+    def __init__(self, callback: Callable[[ConfigIssue], CONF_EVAL]):
+        """
+        Args:
+            callback (Callable[[ConfigIssue], CONF_EVAL]): function that returns the decision for the conflict
+        """
+        self.callback = callback
+
+    def decide(self, issue: ConfigIssue) -> CONF_EVAL:
+        return self.callback(issue)
+
+
+class InteractivePolicy(DecisionPolicy):
+    """DecisionPolicy that asks the user in a popup window. tkinter is imported only when the window is opened."""
+
+    def __get_dialog_popup(self, question):
+        """Returns the popup window and its elements for the given question
+
+        Args:
+            question (str): question that is displayed in the popup window
+        """
+        from tkinter import LEFT, RIGHT, IntVar, Label, Tk, ttk
+
+        def stop_option():
+            selected_option.set(CONF_EVAL.STOP.value)
+            win.quit()
+
+        def continue_option():
+            selected_option.set(CONF_EVAL.CONTINUE_EVEN_THOUGH.value)
+            win.quit()
+
+        win = Tk()
+        win.title("Warning")
+        win.config(width=200, height=150)
+        style = ttk.Style()
+        style.theme_use("clam")
+
+        selected_option = IntVar()
+
+        label = Label(win, text=question)
+        label.pack(pady=20)
+
+        button_stop = ttk.Button(win, text="Stop", command=stop_option)
+        button_stop.pack(side=LEFT, padx=20, pady=20)
+        button_continue = ttk.Button(win, text="Continue", command=continue_option)
+        button_continue.pack(side=RIGHT, padx=20, pady=20)
+
+        return win, label, button_stop, button_continue, selected_option
+
+    def decide(self, issue: ConfigIssue) -> CONF_EVAL:
+        """Opens the popup window and wait for the user to make a choice.
+
+        Args:
+            issue (ConfigIssue): the conflict whose question is displayed in the popup window
+
+        Returns:
+            CONF_EVAL: decidion of the user
+        """
+        win, _, _, _, selected_option = (
+            self.__get_dialog_popup(issue.message)
+        )
+        win.mainloop()
+        win.destroy()
+        return CONF_EVAL(selected_option.get())
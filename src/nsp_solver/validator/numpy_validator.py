@@ -0,0 +1,401 @@
+import numpy as np
+from nsp_solver.utils import utils
+from nsp_solver.utils.scenario_cache import CONTRACT_FIELDS, HISTORY_FIELDS, SHIFT_TYPE_FIELDS, CompiledScenario, compile_scenario
+from nsp_solver.utils.schedule_tensor import as_assignments
+from nsp_solver.utils.streak_index import StreakIndex, streak_lengths
+from nsp_solver.validator.validator import ScheduleValidator
+
+
+def _positive_part(values: np.ndarray) -> np.ndarray:
+    return np.maximum(values, 0)
+
+
+class NumpyScheduleValidator(ScheduleValidator):
+    """Class responsible for validating the computed schedule using whole-array operations.
+    Gives the same verdicts and objective values as ScheduleValidator.
+    """
+
+    def _compute_helpful_values(self):
+        """Computes the helpful values from the schedule as arrays.
+
+        Returns:
+            dict: the compiled scenario, working days, shifts, shifts with skills, vacations and streaks of each nurse as arrays
+        """
+        scenario = self._compiled_scenario()
+        num_days = len(self.all_days)
+        assignments = as_assignments(self.schedule, self.data)[:, :num_days]
+        shifts_and_skills = assignments.astype(np.int64)
+        shifts = shifts_and_skills.sum(axis=3)
+        working_days = (shifts.sum(axis=2) > 0).astype(np.int64)
+
+        vacation_mask = np.zeros((self.data["num_nurses"], num_days), dtype=bool)
+        any_vacation_days = np.zeros(num_days, dtype=bool)
+        ret_val = {}
+        if self.data["configuration"]["h12"]:
+            nurses_ids_on_vacation = [np.flatnonzero(on_vacation).tolist() for on_vacation in scenario.vacations]
+            for w, nurses_ids in enumerate(nurses_ids_on_vacation):
+                vacation_mask[nurses_ids, w * 7: (w + 1) * 7] = True
+                any_vacation_days[w * 7: (w + 1) * 7] = len(nurses_ids) > 0
+            ret_val["nurses_ids_on_vacation"] = nurses_ids_on_vacation
+
+        ret_val["scenario"] = scenario
+        ret_val["working_days"] = working_days
+        ret_val["shifts"] = shifts
+        ret_val["shifts_and_skills"] = shifts_and_skills
+        ret_val["vacation_mask"] = vacation_mask
+        ret_val["any_vacation_days"] = any_vacation_days
+        ret_val["streaks"] = StreakIndex.from_history(
+            working_days, shifts, self.data["h0_data_original"]["nurseHistory"]
+        )
+        return ret_val
+
+    def _compiled_scenario(self) -> CompiledScenario:
+        """Returns the scenario compiled when the input files were loaded (data["compiled_scenario"]),
+        the input files are compiled again only if the validated weeks are not the weeks of the compiled scenario.
+
+        Returns:
+            CompiledScenario: the compiled arrays of the validated weeks
+        """
+        weeks = list(self.data["all_weeks"])
+        scenario = self.data.get("compiled_scenario")
+        if scenario is not None and weeks == list(range(len(scenario.vacations))):
+            return scenario
+        return compile_scenario(
+            self.data["configuration"],
+            self.data["h0_data_original"],
+            self.data["sc_data"],
+            [self.data["all_wd_data"][w] for w in weeks],
+        )
+
+    def _contract_values(self, key: str) -> np.ndarray:
+        scenario = self.help_vars["scenario"]
+        return scenario.contracts[scenario.nurse_contracts, CONTRACT_FIELDS.index(key)]
+
+    def _shift_type_values(self, key: str) -> np.ndarray:
+        return self.help_vars["scenario"].shift_types[:, SHIFT_TYPE_FIELDS.index(key)]
+
+    def _history_values(self, key: str) -> np.ndarray:
+        return self.help_vars["scenario"].history[:, HISTORY_FIELDS.index(key)]
+
+    def _requirements(self, level: str):
+        """Returns the coverage requirements of all weeks together with the actual coverage.
+
+        Args:
+            level (str): "minimum" or "optimal"
+
+        Returns:
+            (np.ndarray, np.ndarray): required and assigned number of nurses, both of shape (requirements, days in week)
+        """
+        weeks, shifts, skills, capacities = [], [], [], []
+        for w in self.data["all_weeks"]:
+            for req in self.data["all_wd_data"][w]["requirements"]:
+                weeks.append(w)
+                shifts.append(utils.shift_to_int[req["shiftType"]])
+                skills.append(utils.skill_to_int[req["skill"]])
+                capacities.append([req[f"requirementOn{day}"][level] for day in utils.day_to_int])
+        coverage = self.help_vars["shifts_and_skills"].sum(axis=0)
+        days = 7 * np.array(weeks, dtype=np.int64)[:, None] + np.arange(7)[None, :]
+        assigned = coverage[days, np.array(shifts, dtype=np.int64)[:, None], np.array(skills, dtype=np.int64)[:, None]]
+        return np.array(capacities, dtype=np.int64).reshape(assigned.shape), assigned
+
+    def _weekend_working_days(self) -> np.ndarray:
+        """Returns the number of worked weekend days of each nurse in each week.
+
+        Returns:
+            np.ndarray: array of shape (nurses, weeks)
+        """
+        saturdays = np.array([w * 7 + 5 for w in self.data["all_weeks"]], dtype=np.int64)
+        working_days = self.help_vars["working_days"]
+        return working_days[:, saturdays] + working_days[:, saturdays + 1]
+
+    def _total_assignments(self) -> np.ndarray:
+        return self.help_vars["shifts"].sum(axis=(1, 2))
+
+    @utils.hard_constr_value_print
+    def _is_minimal_capacity_satisfied(self) -> bool:
+        required, assigned = self._requirements("minimum")
+        return not bool((required > assigned).any())
+
+    @utils.hard_constr_value_print
+    def _is_max_assignments_per_day_satisfied(self) -> bool:
+        return bool((self.help_vars["shifts_and_skills"].sum(axis=(2, 3)) <= 1).all())
+
+    @utils.hard_constr_value_print
+    def _is_max_assignments_per_day_with_exception_satisfied(self) -> bool:
+        shifts = self.help_vars["shifts"]
+        return not bool(
+            (shifts[:, :, 1:].sum(axis=2) > 1).any() or (shifts[:, :, :-1].sum(axis=2) > 1).any()
+        )
+
+    @utils.hard_constr_value_print
+    def _is_planned_vacations_satisfied(self) -> bool:
+        return not bool((self.help_vars["working_days"].astype(bool) & self.help_vars["vacation_mask"]).any())
+
+    @utils.hard_constr_value_print
+    def _is_maximum_shifts_of_specific_type_satisfied(self) -> bool:
+        shift_totals = self.help_vars["shifts"].sum(axis=1)
+        for n, nurse_data in enumerate(self.data["sc_data"]["nurses"]):
+            for restriction in nurse_data["restrictions"]:
+                if shift_totals[n, utils.shift_to_int[restriction["type"]]] > restriction["limit"]:
+                    return False
+        return True
+
+    @utils.hard_constr_value_print
+    def _is_required_skill_satisfied(self) -> bool:
+        nurses_data = self.data["sc_data"]["nurses"]
+        has_skill = np.zeros((len(nurses_data), self.data["num_skills"]), dtype=bool)
+        for n, nurse_data in enumerate(nurses_data):
+            for skill in nurse_data["skills"]:
+                if utils.skill_to_int[skill] < self.data["num_skills"]:
+                    has_skill[n, utils.skill_to_int[skill]] = True
+        shifts_and_skills = self.help_vars["shifts_and_skills"][: len(nurses_data)]
+        return not bool(((shifts_and_skills > 0) & ~has_skill[:, None, None, :]).any())
+
+    @utils.hard_constr_value_print
+    def _is_shift_successsion_satisfied(self) -> bool:
+        restrictions = self.data["sc_data"]["forbiddenShiftTypeSuccessions"]
+        num_shifts = self.data["num_shifts"]
+        shifts = self.help_vars["shifts"]
+
+        forbidden = np.zeros((num_shifts, num_shifts), dtype=bool)
+        for s in self.data["all_shifts"]:
+            for forbidden_shift_succession in restrictions[s]["succeedingShiftTypes"]:
+                forbidden[s, utils.shift_to_int[forbidden_shift_succession]] = True
+
+        worked = shifts[:, :-1, :, None] != 0
+        worked_next = shifts[:, 1:, None, :] == 1
+        violated_in_schedule = (worked & worked_next & forbidden).any(axis=(1, 2, 3))
+
+        # the nurses are checked in order and the check stops at the first nurse without a restricting history
+        for n in self.data["all_nurses"]:
+            if violated_in_schedule[n]:
+                return False
+            last_shift = utils.shift_to_int[
+                self.data["h0_data_original"]["nurseHistory"][n]["lastAssignedShiftType"]
+            ]
+            if last_shift == utils.shift_to_int["None"]:
+                break
+            if restrictions[last_shift]["succeedingShiftTypes"] == []:
+                break
+            if (forbidden[last_shift] & (shifts[n, 0] == 1)).any():
+                return False
+        return True
+
+    def _is_max_total_assignments_satisfied(self):
+        return not bool((self._total_assignments() > self._contract_values("maximumNumberOfAssignmentsHard")).any())
+
+    def _is_min_total_assignments_satisfied(self):
+        on_vacation = self.help_vars["vacation_mask"].any(axis=1)
+        under_limit = self._total_assignments() < self._contract_values("minimumNumberOfAssignmentsHard")
+        return not bool((under_limit & ~on_vacation).any())
+
+    @utils.hard_constr_value_print
+    def _is_max_total_incomplete_weekends_satisfied(self):
+        incomplete_weekends = (self._weekend_working_days() == 1).sum(axis=1)
+        return not bool((incomplete_weekends > self._contract_values("maximumNumberOfIncompleteWeekendsHard")).any())
+
+    @utils.hard_constr_value_print
+    def _is_min_free_period_satisfied(self):
+        num_weeks = len(self.data["all_weeks"])
+        num_days = len(self.data["all_days"])
+        days_off = 1 - self.help_vars["working_days"][:, : num_weeks * 7].reshape(-1, num_weeks, 7)[:, :, :num_days]
+        longest_free_periods = streak_lengths(days_off, np.zeros(days_off.shape[:-1], dtype=np.int64)).max(axis=2, initial=0)
+        return not bool((longest_free_periods < self._contract_values("minimalFreePeriod")[:, None]).any())
+
+    def _is_max_consecutive_work_days_satisfied(self):
+        streaks = self.help_vars["streaks"].working_day_streaks
+        return not bool((streaks > self._contract_values("maximumNumberOfConsecutiveWorkingDaysHard")[:, None]).any())
+
+    def _is_max_consecutive_days_off_satisfied(self):
+        streaks = self._streaks_interrupted_by_any_vacation().day_off_streaks
+        return not bool((streaks > self._contract_values("maximumNumberOfConsecutiveDaysOffHard")[:, None]).any())
+
+    def _is_min_consecutive_work_days_satisfied(self):
+        working_days = self.help_vars["working_days"]
+        skipped = self.help_vars["any_vacation_days"][None, :]
+        previous = self._streaks_interrupted_by_any_vacation().previous_working_day_streaks()
+        minimum = self._contract_values("minimumNumberOfConsecutiveWorkingDaysHard")[:, None]
+        return not bool((~skipped & (working_days == 0) & (previous > 0) & (previous < minimum)).any())
+
+    def _is_min_consecutive_days_off_satisfied(self):
+        working_days = self.help_vars["working_days"]
+        previous = self.help_vars["streaks"].previous_day_off_streaks()
+        minimum = self._contract_values("minimumNumberOfConsecutiveDaysOffHard")[:, None]
+        return not bool(((working_days == 1) & (previous > 0) & (previous < minimum)).any())
+
+    def _is_max_consecutive_work_shifts_satisfied(self):
+        streaks = self.help_vars["streaks"].shift_streaks
+        maximum = self._shift_type_values("maximumNumberOfConsecutiveAssignmentsHard")[None, :, None]
+        return not bool((streaks > maximum).any())
+
+    def _is_min_consecutive_work_shifts_satisfied(self):
+        shifts = self.help_vars["shifts"]
+        skipped = self.help_vars["vacation_mask"][:, None, :]
+        index = self._streaks_interrupted_by_vacation()
+        previous = index.previous_shift_streaks()
+        minimum = self._shift_type_values("minimumNumberOfConsecutiveAssignmentsHard")[None, :, None]
+        # the day before the first day is taken from the end of the schedule as before
+        previous_days = np.roll(shifts, 1, axis=1)
+        early_and_night = ((previous_days[:, :, 0] == 1) & (previous_days[:, :, 3] == 1))[:, None, :]
+        violations = ~skipped & (index.shifts == 0) & (previous > 0) & (previous < minimum) & ~early_and_night
+        return not bool(violations.any())
+
+    def _streaks_interrupted_by_vacation(self) -> StreakIndex:
+        """Returns the streaks interrupted on the days of the vacation of each nurse."""
+        if "streaks_interrupted_by_vacation" not in self.help_vars:
+            self.help_vars["streaks_interrupted_by_vacation"] = self.help_vars["streaks"].interrupted(
+                self.help_vars["vacation_mask"]
+            )
+        return self.help_vars["streaks_interrupted_by_vacation"]
+
+    def _streaks_interrupted_by_any_vacation(self) -> StreakIndex:
+        """Returns the streaks interrupted in the weeks in which any nurse is on vacation."""
+        if "streaks_interrupted_by_any_vacation" not in self.help_vars:
+            breaks = np.broadcast_to(self.help_vars["any_vacation_days"][None, :], self.help_vars["working_days"].shape)
+            self.help_vars["streaks_interrupted_by_any_vacation"] = self.help_vars["streaks"].interrupted(breaks)
+        return self.help_vars["streaks_interrupted_by_any_vacation"]
+
+    @utils.soft_constr_value_print
+    def _get_optimal_capacity_value(self) -> int:
+        required, assigned = self._requirements("optimal")
+        return int((required > assigned).sum()) * utils.OPT_CAPACITY_WEIGHT
+
+    def _get_max_consecutive_work_days_value(self) -> int:
+        streaks = self.help_vars["streaks"].working_day_streaks
+        maximum = self._contract_values("maximumNumberOfConsecutiveWorkingDays")[:, None]
+        return int((streaks > maximum).sum()) * utils.CONS_WORK_DAY_WEIGHT
+
+    def _get_max_consecutive_shifts_value(self) -> int:
+        index = self.help_vars["streaks"]
+        shifts = index.shifts
+        num_nurses, num_shifts, num_days = shifts.shape
+        maximum = self._shift_type_values("maximumNumberOfConsecutiveAssignments")[None, :, None]
+        previous_week = index.carry_shifts[:, :, None]
+        days = np.arange(num_days)[None, None, :]
+        # several assignments of the same shift type on one day are counted over a sliding window as before
+        cumulative = np.concatenate([np.zeros((num_nurses, num_shifts, 1), dtype=np.int64), shifts.cumsum(axis=2)], axis=2)
+
+        start = days - maximum
+        in_week = np.broadcast_to(start >= 0, shifts.shape)
+        window = cumulative[:, :, 1:] - np.take_along_axis(cumulative, np.broadcast_to(np.clip(start, 0, None), shifts.shape), axis=2)
+        from_prev_week = ~in_week & (previous_week >= maximum - days)
+        subtotal = _positive_part(window - maximum)[in_week].sum()
+        subtotal += _positive_part(cumulative[:, :, 1:] - days)[from_prev_week].sum()
+        return int(subtotal) * utils.CONS_SHIFT_WEIGHT
+
+    @utils.soft_constr_value_print
+    def _get_min_consecutive_work_days_value(self) -> int:
+        working_days = self.help_vars["working_days"]
+        skipped = self.help_vars["vacation_mask"]
+        previous = self._streaks_interrupted_by_vacation().previous_working_day_streaks()
+        minimum = self._contract_values("minimumNumberOfConsecutiveWorkingDays")[:, None]
+        ends_of_streaks = ~skipped & (working_days == 0) & (previous > 0)
+        return int(_positive_part(minimum - previous)[ends_of_streaks].sum()) * utils.CONS_WORK_DAY_WEIGHT
+
+    def _get_min_consecutive_shifts_value(self) -> int:
+        shifts = self.help_vars["shifts"]
+        working_days = self.help_vars["working_days"]
+        skipped = self.help_vars["vacation_mask"]
+        num_skills = self.data["num_skills"]
+
+        last_shift = np.array(
+            [utils.shift_to_int[history["lastAssignedShiftType"]] for history in self.data["h0_data_original"]["nurseHistory"]]
+        )
+        current_count = self._history_values("numberOfConsecutiveAssignments")
+        minimum = np.zeros(max(num_skills, *utils.shift_to_int.values()) + 1, dtype=np.int64)
+        minimum[: self.data["num_shifts"]] = self._shift_type_values("minimumNumberOfConsecutiveAssignments")
+
+        # the streaks of the same shift type are followed day by day for all nurses at once
+        subtotal = 0
+        for d in self.all_days:
+            day_off = ~skipped[:, d] & (working_days[:, d] == 0)
+            ended = day_off & (last_shift < num_skills)
+            subtotal += _positive_part(minimum[last_shift] - current_count)[ended].sum()
+            reset = skipped[:, d] | day_off
+            last_shift = np.where(reset, num_skills, last_shift)
+            current_count = np.where(reset, 0, current_count)
+            for s in self.data["all_shifts"]:
+                assigned = ~reset & (shifts[:, d, s] == 1)
+                continued = assigned & (last_shift == s)
+                changed = assigned & (last_shift != s)
+                ended = changed & (last_shift < num_skills)
+                subtotal += _positive_part(minimum[last_shift] - current_count)[ended].sum()
+                current_count = np.where(continued, current_count + 1, np.where(changed, 1, current_count))
+                last_shift = np.where(changed, s, last_shift)
+
+        return int(subtotal) * utils.CONS_SHIFT_WEIGHT
+
+    def _get_max_consecutive_days_off_value(self) -> int:
+        streaks = self.help_vars["streaks"].day_off_streaks
+        maximum = self._contract_values("maximumNumberOfConsecutiveDaysOff")[:, None]
+        return int((streaks > maximum).sum()) * utils.CONS_DAY_OFF_WEIGHT
+
+    def _get_min_consecutive_days_off_value(self) -> int:
+        working_days = self.help_vars["working_days"]
+        previous = self.help_vars["streaks"].previous_day_off_streaks()
+        minimum = self._contract_values("minimumNumberOfConsecutiveDaysOff")[:, None]
+        ends_of_streaks = (working_days == 1) & (previous > 0)
+        return int(_positive_part(minimum - previous)[ends_of_streaks].sum()) * utils.CONS_DAY_OFF_WEIGHT
+
+    @utils.soft_constr_value_print
+    def _get_assignment_preferences_value(self) -> int:
+        nurses, days, shifts = [], [], []
+        for w in self.data["all_weeks"]:
+            for preference in self.data["all_wd_data"][w]["shiftOffRequests"]:
+                nurses.append(int(preference["nurse"].split("_")[1]))
+                days.append(utils.day_to_int[preference["day"]] + 7 * w)
+                shifts.append(utils.shift_to_int[preference["shiftType"]])
+        if not nurses:
+            return 0
+        nurses, days, shifts = np.array(nurses), np.array(days), np.array(shifts)
+        any_shift = shifts == utils.shift_to_int["Any"]
+        unsatisfied = np.where(
+            any_shift,
+            self.help_vars["working_days"][nurses, days] == 1,
+            self.help_vars["shifts"][nurses, days, np.where(any_shift, 0, shifts)] == 1,
+        )
+        return int(unsatisfied.sum()) * utils.UNSATISFIED_PREFERENCE_WEIGHT
+
+    @utils.soft_constr_value_print
+    def _get_incomplete_weekends_value(self) -> int:
+        complete_weekend_requested = self._contract_values("completeWeekends") == 1
+        incomplete_weekends = (self._weekend_working_days() == 1).sum(axis=1)
+        return int(incomplete_weekends[complete_weekend_requested].sum()) * utils.INCOMPLETE_WEEKEND_WEIGHT
+
+    @utils.soft_constr_value_print
+    def _get_total_assignments_out_of_limits_value(self) -> int:
+        total_assignments = self._total_assignments()
+        on_vacation = self.help_vars["vacation_mask"].any(axis=1)
+        over_limit = _positive_part(total_assignments - self._contract_values("maximumNumberOfAssignments"))
+        under_limit = _positive_part(self._contract_values("minimumNumberOfAssignments") - total_assignments)
+        return int(over_limit.sum() + under_limit[~on_vacation].sum()) * utils.TOTAL_ASSIGNMENTS_WEIGHT
+
+    def _get_total_uses_of_ifneeded_skills_value(self) -> int:
+        num_skills = self.data["num_skills"]
+        ifneeded_counts = np.zeros((self.data["num_nurses"], num_skills), dtype=np.int64)
+        for n, nurse_data in enumerate(self.data["sc_data"]["nurses"]):
+            for skill in nurse_data["skillsIfNeeded"]:
+                ifneeded_counts[n, utils.skill_to_int[skill]] += 1
+        # the shift types are iterated over the range of skills as before
+        uses_of_skills = self.help_vars["shifts_and_skills"][:, :, :num_skills, :].sum(axis=(1, 2))
+        return int((uses_of_skills * ifneeded_counts).sum()) * utils.TOTAL_IFNEEDED_SKILL_WEIGHT
+
+    def _get_unsatisfied_overtime_preferences_value(self) -> int:
+        wanted_overtime = np.array([nurse["wantedOvertime"] for nurse in self.data["sc_data"]["nurses"]])
+        considered = ~self.help_vars["vacation_mask"].any(axis=1) & (wanted_overtime != 0)
+        ideal_total_assignments = self._contract_values("maximumNumberOfAssignments") + wanted_overtime
+        total_assignments = self._total_assignments()
+        missing = _positive_part(ideal_total_assignments - total_assignments)[considered]
+        extra = _positive_part(total_assignments - ideal_total_assignments)[considered]
+        return int(
+            missing.sum() * utils.UNSATISFIED_OVERTIME_PREFERENCE_WEIGHT + extra.sum() * utils.TOTAL_ASSIGNMENTS_WEIGHT
+        )
+
+    @utils.soft_constr_value_print
+    def _get_total_weekends_over_limit_value(self) -> int:
+        working_weekends = (self._weekend_working_days() > 0).sum(axis=1)
+        over_limit = _positive_part(working_weekends - self._contract_values("maximumNumberOfWorkingWeekends"))
+        return int(over_limit.sum()) * utils.TOTAL_WORKING_WEEKENDS_WEIGHT
+
+    def _is_nurse_on_vacation_any_week(self, nurse_id: int) -> bool:
+        return bool(self.help_vars["vacation_mask"][nurse_id].any())
@@ -1,6 +1,8 @@
 import logging
 import math
 from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import as_assignments
+import numpy as np
 
 
 class ScheduleValidator:
@@ -10,7 +12,7 @@ class ScheduleValidator:
         """Initialize the helpful variables for the evaluation.
 
         Args:
-            schedule (dict): computed schedule
+            schedule (ScheduleTensor | dict): computed schedule
             data (dict): dictionary that contains data from input files
         """
         self.schedule = schedule
@@ -29,7 +31,7 @@ class ScheduleValidator:
         """Evaluates the computed schedule.
 
         Args:
-            schedule (dict): computed schedule
+            schedule (ScheduleTensor | dict): computed schedule
             data (dict): dictionary that contains data from input files
             output_file_path (str, optional): Path for the written output of the evaluation. Defaults to None.
 
@@ -695,40 +697,20 @@ class ScheduleValidator:
         return True
 
     def _compute_helpful_values(self):
-        """
+        """Computes the helpful values from the schedule with whole-array operations.
 
         Returns:
-            _type_: _description_
+            dict: working days, shifts and shifts with skills of each nurse as nested lists
         """
-        num_nurses = self.data["num_nurses"]
-        num_skills = self.data["num_skills"]
-        num_shifts = self.data["num_shifts"]
         all_weeks = self.data["all_weeks"]
-        working_days = [[0 for _ in self.all_days] for _ in range(num_nurses)]
-        shifts = [
-            [[0 for _ in range(num_shifts)] for _ in self.all_days]
-            for _ in range(num_nurses)
-        ]
-        shifts_and_skills = [
-            [
-                [[0 for _ in range(num_skills)] for _ in range(num_shifts)]
-                for _ in self.all_days
-            ]
-            for _ in range(num_nurses)
-        ]
+        assignments = as_assignments(self.schedule, self.data)[:, :len(self.all_days)]
+        shifts_and_skills = assignments.astype(np.int64)
+        shifts = shifts_and_skills.sum(axis=3)
+        working_days = (shifts.sum(axis=2) > 0).astype(np.int64)
+        working_days = working_days.tolist()
+        shifts = shifts.tolist()
+        shifts_and_skills = shifts_and_skills.tolist()
 
-        for n in range(num_nurses):
-            for d in self.all_days:
-                for s in range(num_shifts):
-                    for sk in range(num_skills):
-                        self.schedule[(n, d, s, sk)] = round(
-                            self.schedule[(n, d, s, sk)]
-                        )
-                        shifts_and_skills[n][d][s][sk] = self.schedule[(n, d, s, sk)]
-                    shifts[n][d][s] = sum(
-                        [self.schedule[(n, d, s, sk)] for sk in range(num_skills)]
-                    )
-                working_days[n][d] = utils.isPositiveNumber(sum(shifts[n][d][:]))
         if self.data["configuration"]["h12"]:
             nurses_ids_on_vacation = [
                 list(
@@ -0,0 +1,62 @@
+import json
+from nsp_solver.batch.batch_runner import STATUS_ERROR, BatchJob, BatchRunner
+from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.utils import utils
+
+"""
+Tests for batch_runner.py
+"""
+
+
+class EmptyScheduleSolver(NSP_solver):
+    name = "EMPTY"
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        results[(data["h0_data"]["week"], "status")] = utils.STATUS_OK
+
+
+class FailingSolver(NSP_solver):
+    name = "FAILING"
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        results[(data["h0_data"]["week"], "status")] = utils.STATUS_FAIL
+
+
+class BrokenSolver(NSP_solver):
+    name = "BROKEN"
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        raise ValueError("broken solver")
+
+
+def test_batch_runner__records(simulator_input_generator, tmp_path):
+    # Arrange
+    def get_job(solver, name, repetition=0):
+        return BatchJob(name, simulator_input_generator.get_input(solver, week_ids=(1, 7)), repetition)
+
+    jobs = [get_job(EmptyScheduleSolver(), "empty", r) for r in range(3)]
+    jobs.append(get_job(FailingSolver(), "failing"))
+    jobs.append(get_job(BrokenSolver(), "broken"))
+    output_path = tmp_path / "records.jsonl"
+
+    # Act
+    records = BatchRunner(workers=2).run_to_file(jobs, str(output_path))
+
+    # Assert
+    records = {(record.name, record.repetition): record for record in records}
+    assert len(records) == 5
+    for r in range(3):
+        record = records[("empty", r)]
+        assert record.status == utils.STATUS_OK
+        assert record.solver == "EMPTY"
+        assert record.week_statuses == [utils.STATUS_OK, utils.STATUS_OK]
+        assert len(record.week_times) == 2
+        assert record.objective > 0
+    assert records[("failing", 0)].status == utils.STATUS_FAIL
+    assert records[("failing", 0)].objective == 99999
+    assert records[("broken", 0)].status == STATUS_ERROR
+    assert "broken solver" in records[("broken", 0)].error
+
+    with open(output_path) as file:
+        lines = [json.loads(line) for line in file]
+    assert sorted((line["name"], line["repetition"]) for line in lines) == sorted(records)
@@ -1,8 +1,13 @@
 import copy
 import json
+import os
+from nsp_solver.simulator.history_simulator import HistorySimulator
+from nsp_solver.simulator.simulator import Simulator, SimulatorInput
 from nsp_solver.utils import utils
+from nsp_solver.validator.conf_validator import ConfigValidator
 import pytest
 
+from src.nsp_solver.validator.numpy_validator import NumpyScheduleValidator
 from src.nsp_solver.validator.validator import ScheduleValidator
 
 
@@ -416,9 +421,14 @@ def results_1nurse_1full_week(data_for_1_nurse, empty_results_1nurse_1week):
     return results
 
 
+@pytest.fixture(params=[ScheduleValidator, NumpyScheduleValidator], ids=["loops", "numpy"])
+def validator_class(request):
+    return request.param
+
+
 @pytest.fixture
-def validator_for_1nurse_1week(data_for_1_nurse, empty_results_1nurse_1week):
-    validator = ScheduleValidator()
+def validator_for_1nurse_1week(validator_class, data_for_1_nurse, empty_results_1nurse_1week):
+    validator = validator_class()
     validator._init_variables(empty_results_1nurse_1week, data_for_1_nurse)
     return validator
 
@@ -563,3 +573,42 @@ class data_generator():
 @pytest.fixture
 def integration_tests_data_generator():
     return data_generator
+
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), "test_data")
+
+
+class input_generator():
+    @staticmethod
+    def get_input(solver=None, week_ids=(1, 7, 1, 8), history_file_id=0, config_file_path=None, timelimit=1, **kwargs):
+        """Returns the input of the simulator for the n035w4 test data,
+        the other fields of SimulatorInput can be given by keyword arguments.
+        """
+        kwargs.setdefault("schedule_validator", NumpyScheduleValidator())
+        kwargs.setdefault("config_validator", ConfigValidator())
+        kwargs.setdefault("historySimulator", HistorySimulator())
+        kwargs.setdefault("graph_output_path", None)
+        kwargs.setdefault("validator_output_path", None)
+        return SimulatorInput(
+            config_file_path=config_file_path or os.path.join(TEST_DATA, "C0.json"),
+            history_file_path=os.path.join(TEST_DATA, f"H0-n035w4-{history_file_id}.json"),
+            scenario_file_path=os.path.join(TEST_DATA, "Sc-n035w4.json"),
+            week_files_paths=[os.path.join(TEST_DATA, f"WD-n035w4-{w}.json") for w in week_ids],
+            timelimit=timelimit,
+            solver=solver,
+            **kwargs,
+        )
+
+    @staticmethod
+    def get_data(**kwargs):
+        """Returns the data loaded by the simulator from the input given by the keyword arguments of get_input."""
+        simulator = Simulator()
+        # a new dictionary, the class attribute is shared by all simulators
+        simulator.data = {}
+        simulator._load_data(input_generator.get_input(**kwargs))
+        return simulator.data
+
+
+@pytest.fixture
+def simulator_input_generator():
+    return input_generator
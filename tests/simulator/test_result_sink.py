@@ -0,0 +1,108 @@
+import os
+
+from nsp_solver.simulator.result_sink import JsonlResultSink, WeekRecord
+from nsp_solver.simulator.simulator import Simulator
+from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.solver.warm_start import GreedyWarmStart
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import store_week
+import numpy as np
+import pytest
+
+"""
+Tests for result_sink.py
+"""
+
+
+class GreedySolver(NSP_solver):
+    """Solver that stores the greedy schedule and crashes in the given week."""
+    name = "GREEDY"
+
+    def __init__(self, crash_in_week=None):
+        self.crash_in_week = crash_in_week
+        self.computed_weeks = []
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        week_number = data["h0_data"]["week"]
+        if week_number == self.crash_in_week:
+            raise RuntimeError("crash")
+        self.computed_weeks.append(week_number)
+        store_week(results, week_number, GreedyWarmStart().get_week_start(data))
+        results[(week_number, "status")] = utils.STATUS_OK
+        results[(week_number, "objective")] = 10.0 * week_number
+
+
+def test_week_record_round_trip():
+    # Arrange
+    assignments = np.zeros((2, 7, 4, 4), dtype=np.uint8)
+    assignments[1, 3, 2, 0] = 1
+    record = WeekRecord(0, "WD-0.json", utils.STATUS_OK, 12.0, 1.5, assignments, {"week": 1})
+
+    # Act
+    loaded = WeekRecord.from_dict(record.to_dict())
+
+    # Assert
+    assert np.array_equal(loaded.assignments, assignments)
+    assert loaded.history == {"week": 1}
+    assert loaded.objective == 12.0
+
+
+def test_jsonl_result_sink_ignores_cut_off_line(tmp_path):
+    # Arrange
+    sink = JsonlResultSink(str(tmp_path / "weeks.jsonl"))
+    sink.write_week(WeekRecord(0, "WD-0.json", utils.STATUS_OK, 1.0, 1.0))
+    with open(sink.path, "a") as file:
+        file.write('{"week": 1, "stat')
+
+    # Act
+    records = sink.read_weeks()
+
+    # Assert
+    assert [record.week for record in records] == [0]
+
+
+def test_simulator_resumes_after_crash(simulator_input_generator, tmp_path):
+    # Arrange
+    sink = JsonlResultSink(str(tmp_path / "weeks.jsonl"))
+    expected_value, expected_results = Simulator().simulate_computation(
+        simulator_input_generator.get_input(GreedySolver(), validator_output_path=os.devnull)
+    )
+    with pytest.raises(RuntimeError):
+        Simulator().simulate_computation(
+            simulator_input_generator.get_input(GreedySolver(crash_in_week=2), validator_output_path=os.devnull, result_sink=sink)
+        )
+    solver = GreedySolver()
+
+    # Act
+    value, results = Simulator().simulate_computation(
+        simulator_input_generator.get_input(solver, validator_output_path=os.devnull, result_sink=sink, resume_from=sink)
+    )
+
+    # Assert
+    assert solver.computed_weeks == [2, 3]
+    assert value == expected_value
+    assert np.array_equal(results.assignments, expected_results.assignments)
+    assert [record.week for record in sink.read_weeks()] == [0, 1, 2, 3]
+    assert sink.read_weeks()[1].objective == 10.0
+
+
+def test_simulator_does_not_resume_from_other_input_files(simulator_input_generator, tmp_path):
+    # Arrange
+    sink = JsonlResultSink(str(tmp_path / "weeks.jsonl"))
+    with pytest.raises(RuntimeError):
+        Simulator().simulate_computation(
+            simulator_input_generator.get_input(GreedySolver(crash_in_week=2), validator_output_path=os.devnull, result_sink=sink)
+        )
+    solver = GreedySolver()
+
+    # Act
+    # the week files are the same, but the history is another one
+    Simulator().simulate_computation(
+        simulator_input_generator.get_input(
+            solver, history_file_id=1, validator_output_path=os.devnull, result_sink=sink, resume_from=sink
+        )
+    )
+
+    # Assert
+    assert solver.computed_weeks == [0, 1, 2, 3]
+    assert [record.week for record in sink.read_weeks()] == [0, 1, 2, 3]
@@ -0,0 +1,117 @@
+import os
+
+from nsp_solver.simulator.simulator import Simulator
+from nsp_solver.simulator.solution_cache import SolutionCache, solver_signature
+from nsp_solver.simulator.time_budget import TimeBudget
+from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
+from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.solver.warm_start import GreedyWarmStart
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import store_week
+import numpy as np
+
+"""
+Tests for solution_cache.py
+"""
+
+
+class GreedySolver(NSP_solver):
+    """Deterministic solver that stores the greedy schedule."""
+    name = "GREEDY"
+
+    def __init__(self):
+        # private, so that it is not a parameter of the solver
+        self._computed_weeks = []
+
+    @property
+    def computed_weeks(self):
+        return self._computed_weeks
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        week_number = data["h0_data"]["week"]
+        self._computed_weeks.append(week_number)
+        store_week(results, week_number, GreedyWarmStart().get_week_start(data))
+        results[(week_number, "status")] = utils.STATUS_OK
+        results[(week_number, "objective")] = 10.0 * week_number
+
+
+def test_simulator_reuses_shared_prefix_of_weeks(simulator_input_generator):
+    # Arrange
+    def get_input(solver, week_ids, cache):
+        return simulator_input_generator.get_input(solver, week_ids=week_ids, validator_output_path=os.devnull, solution_cache=cache)
+
+    cache = SolutionCache()
+    Simulator().simulate_computation(get_input(GreedySolver(), (1, 7, 1, 8), cache))
+    expected_value, expected_results = Simulator().simulate_computation(get_input(GreedySolver(), (1, 7, 3, 3), None))
+    solver = GreedySolver()
+
+    # Act
+    value, results = Simulator().simulate_computation(get_input(solver, (1, 7, 3, 3), cache))
+
+    # Assert
+    assert solver.computed_weeks == [2, 3]
+    assert value == expected_value
+    assert np.array_equal(results.assignments, expected_results.assignments)
+    assert results[(1, "objective")] == 10.0
+
+
+def test_simulator_does_not_reuse_week_with_other_time_limit(simulator_input_generator):
+    # Arrange
+    cache = SolutionCache()
+    Simulator().simulate_computation(
+        simulator_input_generator.get_input(GreedySolver(), validator_output_path=os.devnull, solution_cache=cache)
+    )
+    solver = GreedySolver()
+
+    # Act
+    Simulator().simulate_computation(
+        simulator_input_generator.get_input(solver, timelimit=2, validator_output_path=os.devnull, solution_cache=cache)
+    )
+
+    # Assert
+    assert solver.computed_weeks == [0, 1, 2, 3]
+
+
+def test_solution_cache_on_disk(simulator_input_generator, tmp_path):
+    # Arrange
+    Simulator().simulate_computation(
+        simulator_input_generator.get_input(GreedySolver(), validator_output_path=os.devnull, solution_cache=SolutionCache(str(tmp_path)))
+    )
+    cache = SolutionCache(str(tmp_path))
+    solver = GreedySolver()
+
+    # Act
+    Simulator().simulate_computation(
+        simulator_input_generator.get_input(solver, validator_output_path=os.devnull, solution_cache=cache)
+    )
+
+    # Assert
+    assert solver.computed_weeks == []
+    assert (cache.hits, cache.misses) == (4, 0)
+
+
+def test_simulator_reuses_weeks_with_time_budget(simulator_input_generator):
+    # Arrange
+    def get_input(solver, time_budget):
+        return simulator_input_generator.get_input(
+            solver, validator_output_path=os.devnull, solution_cache=cache, time_budget=time_budget
+        )
+
+    cache = SolutionCache()
+    Simulator().simulate_computation(get_input(GreedySolver(), TimeBudget(40, stagnation=0.1)))
+    solver = GreedySolver()
+    other_budget_solver = GreedySolver()
+
+    # Act
+    # the time limits given by the budget depend on the measured time of the weeks computed before
+    Simulator().simulate_computation(get_input(solver, TimeBudget(40, stagnation=0.1)))
+    Simulator().simulate_computation(get_input(other_budget_solver, TimeBudget(20, stagnation=0.1)))
+
+    # Assert
+    assert solver.computed_weeks == []
+    assert other_budget_solver.computed_weeks == [0, 1, 2, 3]
+
+
+def test_solver_signature_contains_parameters():
+    assert solver_signature(ORTOOLS_Solver()) == solver_signature(ORTOOLS_Solver())
+    assert solver_signature(ORTOOLS_Solver()) != solver_signature(ORTOOLS_Solver(reuse_model=True))
@@ -0,0 +1,50 @@
+import os
+
+from nsp_solver.simulator.simulator import Simulator
+from nsp_solver.simulator.time_budget import TimeBudget, week_weights
+from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
+from nsp_solver.utils import utils
+import pytest
+
+"""
+Tests for time_budget.py
+"""
+
+
+def test_time_budget_carries_unused_time_forward(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    weights = week_weights(data)
+    budget = TimeBudget(40)
+
+    # Act
+    budget.start(data)
+    first_week = budget.allocate(0, 0)
+    second_week = budget.allocate(1, first_week)
+    second_week_after_early_stop = budget.allocate(1, first_week / 2)
+
+    # Assert
+    assert first_week == pytest.approx(40 * weights[0] / weights.sum())
+    assert second_week == pytest.approx((40 - first_week) * weights[1] / weights[1:].sum())
+    assert second_week_after_early_stop > second_week
+    assert budget.allocate(3, 39.5) == budget.minimum_time
+    with pytest.raises(ValueError):
+        TimeBudget(40, stagnation=2)
+
+
+def test_simulator_records_time_limits_and_gaps(simulator_input_generator):
+    # Arrange
+    input = simulator_input_generator.get_input(
+        ORTOOLS_Solver(), week_ids=(1, 7), validator_output_path=os.devnull, time_budget=TimeBudget(40, stagnation=0.1)
+    )
+
+    # Act
+    simulator = Simulator()
+    total_value, results = simulator.simulate_computation(input)
+
+    # Assert
+    assert all(results[(w, "status")] == utils.STATUS_OK for w in range(2))
+    assert simulator.week_time_limits[1] == pytest.approx(40 - simulator.week_times[0])
+    assert all(0 <= gap <= 1 for gap in simulator.week_gaps)
+    # the first week stops when its gap has not improved for a tenth of its time limit
+    assert simulator.week_times[0] < simulator.week_time_limits[0]
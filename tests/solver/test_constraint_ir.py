@@ -0,0 +1,93 @@
+from nsp_solver.solver.constraint_ir import ZERO, IRBuilder
+from nsp_solver.solver.ir_compilers import compile_skeleton_to_cp_sat, compile_to_cp_sat, compile_to_cplex
+from nsp_solver.solver.ir_solver import IR_Solver
+from nsp_solver.solver.model_generator import HorizonWindow, build_horizon_ir, build_week_ir
+from nsp_solver.solver.warm_start import GreedyWarmStart
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import ScheduleTensor
+import numpy as np
+import pytest
+
+"""
+Tests for constraint_ir.py, ir_compilers.py, model_generator.py and ir_solver.py
+"""
+
+
+def test_builder_leaves_out_constant():
+    # Arrange
+    builder = IRBuilder()
+    x, y = builder.add_variables(2).tolist()
+
+    # Act
+    builder.add_row([x, ZERO, y], [1, 1, 1], "L", 1)
+    builder.add_rows(np.array([[ZERO, x], [y, ZERO]]), 1, "G", 0)
+    builder.add_objective([x, y, x, ZERO], [2, 3, 4, 5])
+    ir = builder.to_ir(np.array([ZERO, x]))
+
+    # Assert
+    assert list(ir.rows()) == [([x, y], [1, 1], "L", 1), ([x], [1], "G", 0), ([y], [1], "G", 0)]
+    assert ir.objective(integer=True) == ([x, y], [6, 3])
+    assert ir.assignment_mask.tolist() == [False, True]
+
+
+def test_compiled_models_have_all_rows(simulator_input_generator):
+    # Arrange
+    ir = build_week_ir(simulator_input_generator.get_data())
+
+    # Act
+    cp_sat_model = compile_to_cp_sat(ir)
+    cplex_model = compile_to_cplex(ir)
+
+    # Assert
+    assert len(cp_sat_model.Proto().variables) == cplex_model.variables.get_num() == ir.num_variables
+    assert len(cp_sat_model.Proto().constraints) == cplex_model.linear_constraints.get_num() == ir.num_rows
+    assert ir.shifts_with_skills.shape == (35, 7, 4, 4)
+
+
+def test_skeleton_is_shared_by_weeks(simulator_input_generator):
+    # Arrange
+    ir = build_week_ir(simulator_input_generator.get_data(), skeleton=True)
+    other_ir = build_week_ir(simulator_input_generator.get_data(week_ids=(8, 1, 7, 1), history_file_id=1), skeleton=True)
+    skeleton = compile_skeleton_to_cp_sat(ir)
+
+    # Act
+    model = compile_to_cp_sat(other_ir, skeleton.Clone())
+
+    # Assert
+    assert np.array_equal(ir.skeleton, other_ir.skeleton)
+    assert str(model.Proto()) == str(compile_to_cp_sat(other_ir).Proto())
+
+
+def test_week_and_horizon_windows_generate_same_model(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    window = HorizonWindow.from_data(data, ScheduleTensor.from_data(data), range(1))
+
+    # Act
+    week_ir = build_week_ir(data)
+    horizon_ir = build_horizon_ir(data, window)
+
+    # Assert
+    assert list(week_ir.rows()) == list(horizon_ir.rows())
+    assert week_ir.objective() == horizon_ir.objective()
+    assert np.array_equal(week_ir.shifts_with_skills, horizon_ir.shifts_with_skills)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        IR_Solver("gurobi")
+
+
+def test_ir_solver_cp_sat_computes_week(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    data["warm_start"] = GreedyWarmStart().get_week_start(data)
+    results = ScheduleTensor.from_data(data)
+
+    # Act
+    IR_Solver("cp-sat").compute_one_week(5, data, results)
+
+    # Assert
+    assert results[(0, "status")] == utils.STATUS_OK
+    assert results[(0, "objective")] is not None
+    assert np.all(np.asarray(results.week(0)).sum(axis=(2, 3)) <= 1)
@@ -0,0 +1,59 @@
+import os
+
+from nsp_solver.simulator.simulator import Simulator
+from nsp_solver.solver.cp_sat_profiles import PROFILES, get_profile
+from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
+from nsp_solver.solver.nsp_solver import SolverResources
+from nsp_solver.solver.stopping import StoppingCriteria
+from nsp_solver.utils import utils
+from ortools.sat.python import cp_model
+import pytest
+
+"""
+Tests for cp_sat_profiles.py
+"""
+
+
+def test_profiles_set_parameters():
+    # Arrange
+    solver = ORTOOLS_Solver(cp_sat_profile="fast-feasible")
+    solver.resources = SolverResources(threads=2)
+    fast = cp_model.CpSolver()
+    deterministic = cp_model.CpSolver()
+
+    # Act
+    solver.set_parameters(fast, 5)
+    get_profile("deterministic-benchmark").apply(deterministic, 5)
+
+    # Assert
+    assert fast.parameters.linearization_level == 0
+    assert fast.parameters.num_search_workers == 2
+    assert fast.parameters.max_time_in_seconds == 5
+    assert not fast.parameters.enumerate_all_solutions
+    assert deterministic.parameters.max_deterministic_time == 5
+    assert deterministic.parameters.random_seed == 0
+    assert set(PROFILES) == {"default", "fast-feasible", "quality", "deterministic-benchmark", "multi-core"}
+    with pytest.raises(ValueError):
+        ORTOOLS_Solver(cp_sat_profile="fastest")
+
+
+def test_simulator_input_selects_profile(simulator_input_generator):
+    # Arrange
+    solver = ORTOOLS_Solver()
+    input = simulator_input_generator.get_input(
+        solver,
+        week_ids=(1,),
+        timelimit=60,
+        validator_output_path=os.devnull,
+        cp_sat_profile="fast-feasible",
+        # the week stops at its first solution, so the test does not depend on the speed of the machine
+        stopping_criteria=StoppingCriteria(objective_target=float("inf")),
+    )
+
+    # Act
+    total_value, results = Simulator().simulate_computation(input)
+
+    # Assert
+    assert solver.cp_sat_profile == "fast-feasible"
+    assert results[(0, "status")] == utils.STATUS_OK
+    assert total_value != 99999
@@ -0,0 +1,72 @@
+import copy
+
+from nsp_solver.solver.nsp_cplex import CplexSolver
+from nsp_solver.utils.schedule_tensor import ScheduleTensor
+import cplex
+import numpy as np
+import pytest
+
+"""
+Tests for the construction of the model in nsp_cplex.py
+"""
+
+
+def _build(solver, data):
+    model = cplex.Cplex()
+    ir = solver.setup_problem(model, data, ScheduleTensor.from_data(data))
+    return model, ir
+
+
+@pytest.mark.parametrize("debug_names", [False, True])
+def test_cplex_variables_are_indexed(data_for_1_nurse, debug_names):
+    # Arrange
+    solver = CplexSolver(debug_names=debug_names)
+
+    # Act
+    model, ir = _build(solver, copy.deepcopy(data_for_1_nurse))
+
+    # Assert
+    indices = ir.shifts_with_skills
+    assert indices.shape == (1, 7, 4, 4)
+    assert model.variables.get_num() == ir.num_variables
+    n, d, s, sk = np.argwhere(ir.assignment_mask)[-1].tolist()
+    if debug_names:
+        assert model.variables.get_names(int(indices[n, d, s, sk])) == f"shift_with_skill_n{n}_d{d}_s{s}_sk{sk}"
+
+
+def test_cplex_debug_names_do_not_change_model(data_for_1_nurse):
+    # Act
+    model, _ = _build(CplexSolver(), copy.deepcopy(data_for_1_nurse))
+    named_model, _ = _build(CplexSolver(debug_names=True), copy.deepcopy(data_for_1_nurse))
+
+    # Assert
+    assert model.variables.get_num() == named_model.variables.get_num()
+    assert model.variables.get_types() == named_model.variables.get_types()
+    assert model.linear_constraints.get_rhs() == named_model.linear_constraints.get_rhs()
+    assert model.objective.get_linear() == named_model.objective.get_linear()
+
+
+def test_cplex_build_times(data_for_1_nurse):
+    # Arrange
+    solver = CplexSolver()
+
+    # Act
+    model, _ = _build(solver, copy.deepcopy(data_for_1_nurse))
+
+    # Assert
+    assert "variables" in solver.build_times
+    assert "h1" in solver.build_times
+    assert sum(count for _, count in solver.build_times.values()) == model.linear_constraints.get_num()
+
+
+@pytest.mark.parametrize("verbose", [False, True])
+def test_cplex_build_times_are_printed_only_when_verbose(data_for_1_nurse, verbose, capsys):
+    # Arrange
+    solver = CplexSolver(verbose=verbose)
+    data = copy.deepcopy(data_for_1_nurse)
+
+    # Act
+    solver.compute_one_week(10, data, ScheduleTensor.from_data(data))
+
+    # Assert
+    assert ("variables:" in capsys.readouterr().out) == verbose
@@ -0,0 +1,86 @@
+import json
+import os
+
+from nsp_solver.simulator.simulator import Simulator
+from nsp_solver.solver.horizon_solver import HorizonSolver, HorizonWindow
+from nsp_solver.solver.stopping import StoppingCriteria
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import ScheduleTensor, store_week
+from nsp_solver.validator.decision_policy import AlwaysContinuePolicy
+from nsp_solver.validator.numpy_validator import NumpyScheduleValidator
+from ortools.sat.python import cp_model
+import numpy as np
+import pytest
+
+"""
+Tests for horizon_solver.py
+"""
+
+TEST_DATA = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_data")
+
+
+def test_get_window_weeks():
+    # Arrange
+    solver = HorizonSolver(window=2, overlap=1)
+
+    # Act
+    first_window = solver.get_window_weeks(0, 4)
+    last_window = solver.get_window_weeks(2, 4)
+
+    # Assert
+    assert first_window == (range(0, 2), range(0, 1))
+    assert last_window == (range(2, 4), range(2, 4))
+    assert HorizonSolver().get_window_weeks(1, 4) == (range(1, 4), range(1, 4))
+    with pytest.raises(ValueError):
+        HorizonSolver(window=2, overlap=2)
+
+
+def test_horizon_model_counts_schedule_as_validator(simulator_input_generator, tmp_path):
+    # Arrange
+    with open(os.path.join(TEST_DATA, "C0.json")) as file:
+        config = {constraint: True for constraint in json.load(file)}
+    config_file_path = tmp_path / "C_all.json"
+    config_file_path.write_text(json.dumps(config))
+    data = simulator_input_generator.get_data(history_file_id=1, config_file_path=str(config_file_path))
+    results = ScheduleTensor.from_data(data)
+    solver = HorizonSolver()
+    model, ir = solver.build_model(data, HorizonWindow.from_data(data, results, range(4)))
+    cp_solver = cp_model.CpSolver()
+    cp_solver.parameters.max_time_in_seconds = 60
+    cp_solver.parameters.stop_after_first_solution = True
+    assert cp_solver.Solve(model) in (cp_model.FEASIBLE, cp_model.OPTIMAL)
+    assignments = np.asarray(cp_solver.response_proto.solution)[ir.shifts_with_skills]
+
+    # Act
+    # with the fixed schedule only the penalties are minimized
+    cp_solver.parameters.stop_after_first_solution = False
+    for index, value in zip(ir.shifts_with_skills[ir.assignment_mask].tolist(), assignments[ir.assignment_mask].tolist()):
+        model.Add(model.get_int_var_from_proto_index(index) == value)
+    status = cp_solver.Solve(model)
+    for w in range(4):
+        store_week(results, w, assignments[:, 7 * w: 7 * (w + 1)])
+
+    # Assert
+    assert status == cp_model.OPTIMAL
+    assert cp_solver.ObjectiveValue() == NumpyScheduleValidator().evaluate_schedule(results, data)
+
+
+def test_rolling_windows_compute_all_weeks(simulator_input_generator):
+    # Arrange
+    # each window stops at its first solution, so the test does not depend on the speed of the machine
+    input = simulator_input_generator.get_input(
+        HorizonSolver(window=2, overlap=1),
+        history_file_id=1,
+        timelimit=60,
+        config_policy=AlwaysContinuePolicy(),
+        stopping_criteria=StoppingCriteria(objective_target=float("inf")),
+    )
+
+    # Act
+    total_value, results = Simulator().simulate_computation(input)
+
+    # Assert
+    assert total_value != 99999
+    assert all(results[(w, "status")] == utils.STATUS_OK for w in range(4))
+    # the last window computes both of its weeks
+    assert results[(2, "objective")] == results[(3, "objective")]
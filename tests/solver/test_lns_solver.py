@@ -0,0 +1,119 @@
+import random
+import time
+
+from nsp_solver.simulator.simulator import Simulator
+from nsp_solver.solver.lns_solver import (
+    DayBlockNeighbourhood,
+    LNS_Solver,
+    RandomNursesNeighbourhood,
+    SkillGroupNeighbourhood,
+)
+from nsp_solver.solver.stopping import StoppingCriteria
+from nsp_solver.utils import utils
+import numpy as np
+import pytest
+
+"""
+Tests for lns_solver.py
+"""
+
+
+@pytest.mark.parametrize(
+    "selector,expected_freed",
+    [
+        (RandomNursesNeighbourhood(fraction=0.2), 7 * 7),
+        (DayBlockNeighbourhood(length=2), 35 * 2),
+    ],
+)
+def test_neighbourhood_size(simulator_input_generator, selector, expected_freed):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1,))
+
+    # Act
+    freed = selector.select(data, random.Random(0))
+
+    # Assert
+    assert freed.shape == (35, 7)
+    assert freed.sum() == expected_freed
+
+
+def test_skill_group_neighbourhood(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1,))
+    nurses = data["sc_data"]["nurses"]
+
+    # Act
+    freed = SkillGroupNeighbourhood().select(data, random.Random(0))
+
+    # Assert
+    freed_nurses = [n for n in range(len(nurses)) if freed[n].all()]
+    assert freed_nurses
+    common_skills = set.intersection(*(set(nurses[n]["skills"]) for n in freed_nurses))
+    assert common_skills
+
+
+def test_neighbourhood_model_is_valid(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1,))
+    solver = LNS_Solver()
+    model, ir = solver.build_model(data)
+    incumbent = np.zeros((35, 7, 4, 4), dtype=int)
+    freed = DayBlockNeighbourhood(length=2).select(data, random.Random(0))
+
+    # Act
+    neighbourhood = solver.build_neighbourhood(model, ir, incumbent, freed)
+
+    # Assert
+    # the impossible assignments are the constant ZERO, which must be neither hinted nor fixed
+    hinted = neighbourhood.Proto().solution_hint.vars
+    assert len(hinted) == (ir.assignment_mask & freed[:, :, None, None]).sum()
+    assert len(set(hinted)) == len(hinted)
+    fixed = ir.shifts_with_skills[ir.assignment_mask & ~freed[:, :, None, None]]
+    assert all(list(neighbourhood.Proto().variables[index].domain) == [0, 0] for index in fixed.tolist())
+    assert neighbourhood.Validate() == ""
+
+
+def test_lns_solver__improves_week(simulator_input_generator):
+    # Arrange
+    solver = LNS_Solver(initial_time_fraction=0.5, step_time_limit=1)
+    solve = solver.solve
+    week_solvers = []
+
+    def solve_and_record(model, time_limit, stopping_criteria=None):
+        cp_solver, status = solve(model, time_limit, stopping_criteria)
+        # the neighbourhoods are copies of the model of the week
+        if not week_solvers or model is week_solvers[0][0]:
+            week_solvers.append((model, cp_solver))
+        return cp_solver, status
+
+    solver.solve = solve_and_record
+
+    # Act
+    _, results = Simulator().simulate_computation(simulator_input_generator.get_input(solver, week_ids=(1,), timelimit=12))
+
+    # Assert
+    assert results[(0, "status")] == utils.STATUS_OK
+    assert sum(statistics["attempts"] for statistics in solver.statistics.values()) > 0
+    # the neighbourhoods are solved and some of them improve the first solution
+    assert sum(statistics["improvements"] for statistics in solver.statistics.values()) > 0
+    # the gap is given by the bound of the week, not by the bound of the last neighbourhood
+    week_bound = week_solvers[-1][1].BestObjectiveBound()
+    assert results[(0, "gap")] == utils.relative_gap(results[(0, "objective")], week_bound)
+    assert set(solver.success_rates()) == {"nurses", "days", "skill"}
+
+
+def test_lns_solver_stops_at_objective_target(simulator_input_generator):
+    # Arrange
+    solver = LNS_Solver()
+    input = simulator_input_generator.get_input(
+        solver, week_ids=(1,), timelimit=60, stopping_criteria=StoppingCriteria(objective_target=float("inf"))
+    )
+
+    # Act
+    start = time.time()
+    _, results = Simulator().simulate_computation(input)
+
+    # Assert
+    assert results[(0, "status")] == utils.STATUS_OK
+    assert time.time() - start < 30
+    assert sum(statistics["attempts"] for statistics in solver.statistics.values()) == 0
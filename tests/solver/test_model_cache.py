@@ -0,0 +1,82 @@
+import copy
+import os
+
+from nsp_solver.solver.model_cache import ModelCache, week_model_key
+import numpy as np
+
+"""
+Tests for model_cache.py
+"""
+
+
+def _other_week(data):
+    other = copy.deepcopy(data)
+    other["wd_data"] = other["all_wd_data"][1]
+    return other
+
+
+def test_week_model_key(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    other_history = copy.deepcopy(data)
+    other_history["h0_data"]["nurseHistory"][0]["numberOfAssignments"] += 1
+    with_vacation_ids = copy.deepcopy(data)
+    with_vacation_ids["wd_data"]["vacations_with_ids"] = []
+
+    # Act
+    key = week_model_key(data)
+
+    # Assert
+    assert key == week_model_key(copy.deepcopy(data))
+    assert key == week_model_key(with_vacation_ids)
+    assert key != week_model_key(other_history)
+    assert key != week_model_key(_other_week(data))
+
+
+def test_model_cache_evicts_least_recently_used(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    cache = ModelCache(max_entries=1)
+    ir = cache.get_or_build(data)
+
+    # Act
+    same_ir = cache.get_or_build(data)
+    cache.get_or_build(_other_week(data))
+
+    # Assert
+    assert same_ir is ir
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert list(cache.entries) == [week_model_key(_other_week(data))]
+
+
+def test_model_cache_on_disk(simulator_input_generator, tmp_path):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    ir = ModelCache(cache_dir=str(tmp_path)).get_or_build(data)
+    cache = ModelCache(cache_dir=str(tmp_path))
+
+    # Act
+    loaded = cache.get_or_build(data)
+
+    # Assert
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert np.array_equal(loaded.columns, ir.columns)
+    assert np.array_equal(loaded.senses, ir.senses)
+    assert np.array_equal(loaded.shifts_with_skills, ir.shifts_with_skills)
+    assert loaded.names == ir.names
+
+
+def test_model_cache_rebuilds_unreadable_file(simulator_input_generator, tmp_path):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    with open(os.path.join(tmp_path, f"{week_model_key(data)}.npz"), "w") as file:
+        file.write("not a model")
+    cache = ModelCache(cache_dir=str(tmp_path))
+
+    # Act
+    ir = cache.get_or_build(data)
+
+    # Assert
+    assert cache.misses == 1
+    assert ir.num_rows > 0
+    assert ModelCache(cache_dir=str(tmp_path)).get(week_model_key(data)) is not None
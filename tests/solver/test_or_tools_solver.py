@@ -0,0 +1,137 @@
+import copy
+
+from nsp_solver.simulator.history_simulator import HistorySimulator
+from nsp_solver.solver.constraint_ir import IRBuilder
+from nsp_solver.solver.model_generator import HorizonWindow, generate_window
+from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
+from nsp_solver.solver.stopping import StoppingCriteria
+from nsp_solver.solver.warm_start import GreedyWarmStart
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import ScheduleTensor, store_week
+from nsp_solver.utils.week_instance import WeekInstance
+import numpy as np
+from ortools.sat.python import cp_model
+
+"""
+Tests for the extraction of the solution in nsp_or_tools.py
+"""
+
+
+def test_or_tools_week_values_match_variables(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1,))
+    data["warm_start"] = GreedyWarmStart().get_week_start(data)
+    solver = ORTOOLS_Solver()
+    model, ir = solver.build_model(data)
+    solver.add_warm_start(model, ir, data)
+    cp_solver = cp_model.CpSolver()
+    cp_solver.parameters.max_time_in_seconds = 5
+    cp_solver.parameters.num_search_workers = 1
+    cp_solver.Solve(model)
+
+    # Act
+    week_values = solver.get_week_values(cp_solver, ir)
+
+    # Assert
+    assert week_values.shape == (35, 7, 4, 4)
+    for (n, d, s, sk), index in np.ndenumerate(ir.shifts_with_skills):
+        assert week_values[n, d, s, sk] == cp_solver.Value(model.get_int_var_from_proto_index(index))
+
+
+def _fixed_objective(solver, data, schedule):
+    model, ir = solver.build_model(data)
+    mask = ir.assignment_mask
+    for index, value in zip(ir.shifts_with_skills[mask].tolist(), schedule[mask].tolist()):
+        model.Add(model.get_int_var_from_proto_index(index) == value)
+    cp_solver = cp_model.CpSolver()
+    cp_solver.parameters.max_time_in_seconds = 60
+    assert cp_solver.Solve(model) == cp_model.OPTIMAL
+    return cp_solver.ObjectiveValue()
+
+
+def test_or_tools_reused_model_matches_new_model(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1, 7))
+    data["warm_start"] = None
+    reused_solver = ORTOOLS_Solver(reuse_model=True)
+    new_solver = ORTOOLS_Solver()
+    results = ScheduleTensor.from_data(data)
+    reused_objectives, new_objectives = [], []
+
+    # Act
+    for week_number in range(2):
+        data["wd_data"] = data["all_wd_data"][week_number]
+        data["week_instance"] = WeekInstance.from_data(data)
+        model, ir = new_solver.build_model(data)
+        cp_solver = cp_model.CpSolver()
+        cp_solver.parameters.max_time_in_seconds = 60
+        cp_solver.parameters.stop_after_first_solution = True
+        assert cp_solver.Solve(model) in (cp_model.FEASIBLE, cp_model.OPTIMAL)
+        schedule = new_solver.get_week_values(cp_solver, ir)
+        # the skeleton is compiled in the first week and only completed in the second week
+        reused_objectives.append(_fixed_objective(reused_solver, data, schedule))
+        new_objectives.append(_fixed_objective(new_solver, data, schedule))
+        store_week(results, week_number, schedule)
+        HistorySimulator().update_history_for_next_week(results, data)
+
+    # Assert
+    assert reused_objectives == new_objectives
+
+
+def test_or_tools_does_not_update_history(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1,))
+    data["warm_start"] = GreedyWarmStart().get_week_start(data)
+    history = copy.deepcopy(data["h0_data"])
+    results = ScheduleTensor.from_data(data)
+
+    # Act
+    ORTOOLS_Solver().compute_one_week(5, data, results)
+
+    # Assert
+    assert results[(0, "status")] == utils.STATUS_OK
+    assert data["h0_data"] == history
+
+
+def test_or_tools_lookahead_adds_relaxed_next_week(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1, 7))
+    data["warm_start"] = GreedyWarmStart().get_week_start(data)
+    solver = ORTOOLS_Solver(lookahead=True)
+    objective_size = len(ORTOOLS_Solver().build_model(data)[0].Proto().objective.vars)
+
+    # Act
+    variables = generate_window(IRBuilder(), data, HorizonWindow.from_week(data), lookahead=True)
+    model, _ = solver.build_model(data)
+    results = ScheduleTensor.from_data(data)
+    # the week stops at its first solution, so the test does not depend on the speed of the machine
+    data["stopping_criteria"] = StoppingCriteria(objective_target=float("inf"))
+    solver.compute_one_week(60, data, results)
+
+    # Assert
+    assert variables["next_working_days"].shape == (35, 7)
+    assert len(model.Proto().objective.vars) == len(model.Proto().objective.coeffs) > objective_size
+    assert results[(0, "status")] == utils.STATUS_OK
+    # the last week has no next week
+    data["h0_data"]["week"] = 1
+    assert "next_working_days" not in generate_window(IRBuilder(), data, HorizonWindow.from_week(data), lookahead=True)
+
+
+def test_or_tools_lookahead_follows_forbidden_successions_of_scenario(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1, 7))
+    data.pop("week_instance", None)
+    no_successions = copy.deepcopy(data)
+    no_successions["sc_data"]["forbiddenShiftTypeSuccessions"] = []
+
+    # Act
+    sizes = []
+    for week_data in (data, no_successions):
+        builder = IRBuilder()
+        generate_window(builder, week_data, HorizonWindow.from_week(week_data), lookahead=True)
+        sizes.append(builder.build_times["lookahead"][1])
+
+    # Assert
+    # one constraint for each nurse and each forbidden succession from the last day to the first day of the next week
+    successions = WeekInstance.from_data(data).forbidden_successions.sum()
+    assert sizes[0] - sizes[1] == 35 * successions
@@ -0,0 +1,65 @@
+import time
+from nsp_solver.simulator.simulator import Simulator
+from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.solver.portfolio_solver import PortfolioSolver
+from nsp_solver.solver.warm_start import GreedyWarmStart
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import store_week
+
+"""
+Tests for portfolio_solver.py
+"""
+
+
+class GreedySolver(NSP_solver):
+    name = "GREEDY"
+
+    def __init__(self, optimal=False):
+        self.optimal = optimal
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        week_number = data["h0_data"]["week"]
+        store_week(results, week_number, GreedyWarmStart().get_week_start(data))
+        results[(week_number, "status")] = utils.STATUS_OK
+        results[(week_number, "optimal")] = self.optimal
+
+
+class EmptyScheduleSolver(NSP_solver):
+    name = "EMPTY"
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        results[(data["h0_data"]["week"], "status")] = utils.STATUS_OK
+
+
+class SlowSolver(NSP_solver):
+    name = "SLOW"
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        time.sleep(60)
+        results[(data["h0_data"]["week"], "status")] = utils.STATUS_OK
+
+
+def test_portfolio_solver__keeps_best_schedule(simulator_input_generator):
+    # Arrange
+    solver = PortfolioSolver([EmptyScheduleSolver(), GreedySolver()])
+
+    # Act
+    _, results = Simulator().simulate_computation(simulator_input_generator.get_input(solver, week_ids=(1,), timelimit=5))
+
+    # Assert
+    assert results[(0, "status")] == utils.STATUS_OK
+    assert results[(0, "solver")] == "GREEDY"
+    assert results.week(0).sum() > 0
+
+
+def test_portfolio_solver__stops_after_optimality(simulator_input_generator):
+    # Arrange
+    solver = PortfolioSolver([SlowSolver(), GreedySolver(optimal=True)])
+    start = time.time()
+
+    # Act
+    _, results = Simulator().simulate_computation(simulator_input_generator.get_input(solver, week_ids=(1,), timelimit=5))
+
+    # Assert
+    assert time.time() - start < 30
+    assert results[(0, "solver")] == "GREEDY"
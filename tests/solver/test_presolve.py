@@ -0,0 +1,63 @@
+from nsp_solver.solver.constraint_ir import ZERO
+from nsp_solver.solver.model_generator import HorizonWindow, build_week_ir
+from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
+from nsp_solver.solver.presolve import assignment_mask
+from nsp_solver.utils import utils
+from nsp_solver.utils.week_instance import get_week_instance
+import numpy as np
+
+"""
+Tests for presolve.py
+"""
+
+
+def test_assignment_mask(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    data["configuration"]["h12"] = True
+    window = HorizonWindow.from_week(data)
+    history = data["h0_data"]["nurseHistory"]
+    night_nurse = next(n for n, record in enumerate(history) if record["lastAssignedShiftType"] == "Night")
+    vacation_nurse = get_week_instance(data).vacation_nurses[0]
+    nurse, missing_skill = np.argwhere(~get_week_instance(data).skills)[0]
+
+    # Act
+    mask = assignment_mask(data, window, vacations=True)
+
+    # Assert
+    assert not mask[nurse, :, :, missing_skill].any()
+    assert mask[nurse, 1:].any(axis=2).all()
+    assert not mask[night_nurse, 0, :utils.shift_to_int["Night"]].any()
+    assert mask[night_nurse, 0, utils.shift_to_int["Night"]].any()
+    assert not mask[vacation_nurse].any()
+    assert assignment_mask(data, window, skills=False, history=False).all()
+
+
+def test_skeleton_model_fixes_impossible_assignments(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+
+    # Act
+    ir = build_week_ir(data, skeleton=True)
+
+    # Assert
+    # C0 enables h1, h3 and h4, but not h11 and h12
+    window = HorizonWindow.from_week(data)
+    assert np.array_equal(ir.assignment_mask, assignment_mask(data, window, skills=True, history=False))
+    assert np.array_equal(ir.ub[ir.shifts_with_skills] == 1, assignment_mask(data, window, skills=True, history=True))
+
+
+def test_or_tools_model_does_not_create_impossible_assignments(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    mask = assignment_mask(data, HorizonWindow.from_week(data))
+
+    # Act
+    model, ir = ORTOOLS_Solver().build_model(data)
+
+    # Assert
+    indices = ir.shifts_with_skills
+    assert np.all(indices[~mask] == ZERO)
+    assert list(model.Proto().variables[ZERO].domain) == [0, 0]
+    assert len(np.unique(indices[mask])) == mask.sum()
+    assert ZERO not in indices[mask]
@@ -0,0 +1,52 @@
+from nsp_solver.solver.nsp_cplex import CplexSolver
+from nsp_solver.solver.nsp_docplex import DOCPLEX_Solver
+from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
+from nsp_solver.solver.nsp_solver import SolverResources
+import cplex
+from ortools.sat.python import cp_model
+
+"""
+Tests for the mapping of SolverResources to the parameters of the solvers
+"""
+
+
+def test_or_tools_resources():
+    # Arrange
+    solver = ORTOOLS_Solver()
+    solver.resources = SolverResources(threads=4, memory_limit=512, deterministic=True)
+    cp_solver = cp_model.CpSolver()
+
+    # Act
+    solver.set_resources(cp_solver)
+
+    # Assert
+    assert cp_solver.parameters.num_search_workers == 4
+    assert cp_solver.parameters.interleave_search
+    assert cp_solver.parameters.max_memory_in_mb == 512
+
+
+def test_cplex_resources():
+    # Arrange
+    solver = CplexSolver()
+    solver.resources = SolverResources(threads=4, memory_limit=512, deterministic=False)
+    model = cplex.Cplex()
+
+    # Act
+    solver.set_resources(model)
+
+    # Assert
+    assert model.parameters.threads.get() == 4
+    assert model.parameters.parallel.get() == model.parameters.parallel.values.opportunistic
+    assert model.parameters.mip.limits.treememory.get() == 512
+
+
+def test_docplex_resources():
+    # Arrange
+    solver = DOCPLEX_Solver()
+    solver.resources = SolverResources(threads=4)
+
+    # Act
+    parameters = solver.get_resources_parameters()
+
+    # Assert
+    assert parameters == {"Workers": 4}
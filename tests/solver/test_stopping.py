@@ -0,0 +1,117 @@
+import time
+
+from docplex.cp.model import CpoModel
+from nsp_solver.solver.nsp_cplex import StoppingInfoCallback
+from nsp_solver.solver.nsp_docplex import StoppingCpoCallback
+from nsp_solver.solver.nsp_or_tools import ORTOOLS_Solver
+from nsp_solver.solver.stopping import StoppingCriteria, StoppingTracker
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import ScheduleTensor
+import cplex
+import numpy as np
+import pytest
+
+"""
+Tests for stopping.py and the callbacks of the engines
+"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _knapsack():
+    # small enough for the community edition of CPLEX, the first solution without any item has the objective 0
+    rng = np.random.default_rng(0)
+    values = (-rng.integers(10, 100, 150)).tolist()
+    weights = rng.integers(10, 100, (5, 150)).tolist()
+    return values, weights
+
+
+def test_stopping_tracker():
+    # Arrange
+    clock = FakeClock()
+    no_improvement = StoppingTracker(StoppingCriteria(no_improvement_time=5), clock)
+    gap = StoppingTracker(StoppingCriteria(relative_gap=0.1), clock)
+    target = StoppingTracker(StoppingCriteria(objective_target=100), clock)
+
+    # Act
+    stops_before_solution = no_improvement.should_stop()
+    no_improvement.update(200, 0)
+    clock.now = 4
+    no_improvement.update(None, 150)
+    clock.now = 8
+    stops_after_bound = no_improvement.should_stop()
+    clock.now = 9
+    gap.update(200, 150)
+    target.update(120, None)
+
+    # Assert
+    assert not stops_before_solution
+    assert not stops_after_bound
+    assert no_improvement.should_stop()
+    assert not gap.should_stop()
+    gap.update(190, 180)
+    assert gap.should_stop()
+    assert not target.should_stop()
+    target.update(100, None)
+    assert target.should_stop()
+    assert not StoppingTracker(None, clock).should_stop()
+    with pytest.raises(ValueError):
+        StoppingCriteria(no_improvement_time=0)
+
+
+def test_cp_sat_stops_without_improvement(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1,))
+    data["stopping_criteria"] = StoppingCriteria(no_improvement_time=1)
+    results = ScheduleTensor.from_data(data)
+
+    # Act
+    start = time.time()
+    ORTOOLS_Solver().compute_one_week(60, data, results)
+
+    # Assert
+    assert results[(0, "status")] == utils.STATUS_OK
+    assert time.time() - start < 60
+
+
+def test_cplex_stops_at_objective_target():
+    # Arrange
+    values, weights = _knapsack()
+    model = cplex.Cplex()
+    model.set_results_stream(None)
+    model.set_log_stream(None)
+    model.variables.add(obj=values, types="B" * len(values))
+    for row in weights:
+        model.linear_constraints.add(lin_expr=[cplex.SparsePair(list(range(len(row))), row)], senses="L", rhs=[2000])
+
+    # Act
+    StoppingInfoCallback.register(model, StoppingCriteria(objective_target=0))
+    model.solve()
+
+    # Assert
+    assert model.solution.get_status() == model.solution.status.MIP_abort_feasible
+    assert model.solution.get_objective_value() <= 0
+
+
+def test_cp_optimizer_stops_at_objective_target():
+    # Arrange
+    values, weights = _knapsack()
+    model = CpoModel()
+    items = [model.binary_var() for _ in values]
+    for row in weights:
+        model.add(model.sum(weight * item for weight, item in zip(row, items)) <= 2000)
+    model.minimize(model.sum(value * item for value, item in zip(values, items)))
+
+    # Act
+    StoppingCpoCallback.register(model, StoppingCriteria(objective_target=0))
+    sol = model.solve(TimeLimit=20, LogVerbosity='Quiet', Workers=1)
+
+    # Assert
+    assert sol.get_objective_value() <= 0
+    assert sol.get_solve_time() < 20
@@ -0,0 +1,86 @@
+from nsp_solver.simulator.simulator import Simulator
+from nsp_solver.solver.nsp_solver import NSP_solver
+from nsp_solver.solver.warm_start import GreedyWarmStart, PreviousRunWarmStart
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import store_week
+import numpy as np
+import pytest
+
+"""
+Tests for warm_start.py
+"""
+
+
+class WarmStartSolver(NSP_solver):
+    """Solver that returns the initial schedule as the computed schedule."""
+    name = "WARM_START"
+
+    def compute_one_week(self, time_limit_for_week, data, results):
+        week_number = data["h0_data"]["week"]
+        store_week(results, week_number, data["warm_start"])
+        results[(week_number, "status")] = utils.STATUS_OK
+
+
+@pytest.mark.parametrize("history_id", [0, 1, 2])
+def test_greedy_warm_start__feasible_assignments(simulator_input_generator, history_id):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1, 7), history_file_id=history_id)
+    minimal_capacities, _ = GreedyWarmStart._capacities(
+        data["wd_data"], data["num_days"], data["num_shifts"], data["num_skills"]
+    )
+    forbidden = GreedyWarmStart._forbidden_successions(data["sc_data"], data["num_shifts"])
+
+    # Act
+    week_values = GreedyWarmStart().get_week_start(data)
+
+    # Assert
+    assert week_values.shape == (data["num_nurses"], 7, data["num_shifts"], data["num_skills"])
+    assert week_values.sum(axis=(2, 3)).max() <= 1
+    assert np.all(week_values.sum(axis=0) >= minimal_capacities)
+    for n, nurse in enumerate(data["sc_data"]["nurses"]):
+        nurse_skills = [utils.skill_to_int[skill] for skill in nurse["skills"]]
+        assert week_values[n][:, :, np.setdiff1d(range(data["num_skills"]), nurse_skills)].sum() == 0
+        last_shift = utils.shift_to_int[data["h0_data"]["nurseHistory"][n]["lastAssignedShiftType"]]
+        for d in range(7):
+            shift = np.flatnonzero(week_values[n, d].sum(axis=1))
+            shift = shift[0] if shift.size else utils.shift_to_int["None"]
+            if shift != utils.shift_to_int["None"]:
+                assert not forbidden[last_shift, shift]
+            last_shift = shift
+
+
+def test_previous_run_warm_start__save_and_load(simulator_input_generator, tmp_path):
+    # Arrange
+    data = simulator_input_generator.get_data(week_ids=(1, 7))
+    week_values = np.zeros((data["num_nurses"], 7, data["num_shifts"], data["num_skills"]), dtype=np.uint8)
+    week_values[0, 0, 1, 1] = 1
+    warm_start = PreviousRunWarmStart()
+    file_path = str(tmp_path / "warm_start.npz")
+
+    # Act
+    missing_week = warm_start.get_week_start(data)
+    warm_start.record_week(data, week_values)
+    warm_start.save(file_path)
+    loaded = PreviousRunWarmStart.load(file_path)
+
+    # Assert
+    assert missing_week is None
+    assert np.array_equal(loaded.get_week_start(data), week_values)
+    data["wd_data"] = data["all_wd_data"][1]
+    assert loaded.get_week_start(data) is None
+
+
+def test_simulator__reuses_previous_run(simulator_input_generator):
+    # Arrange
+    warm_start = PreviousRunWarmStart(GreedyWarmStart())
+    input = simulator_input_generator.get_input(WarmStartSolver(), week_ids=(1, 7), warm_start=warm_start)
+
+    # Act
+    _, first_results = Simulator().simulate_computation(input)
+    warm_start.fallback = None
+    _, second_results = Simulator().simulate_computation(input)
+
+    # Assert
+    assert len(warm_start.solutions) == 2
+    assert first_results.assignments.sum() > 0
+    assert np.array_equal(first_results.assignments, second_results.assignments)
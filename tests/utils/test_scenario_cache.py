@@ -0,0 +1,111 @@
+import json
+import os
+
+from nsp_solver.solver.warm_start import GreedyWarmStart
+from nsp_solver.utils import utils
+from nsp_solver.utils.scenario_cache import ScenarioCache, compile_scenario
+from nsp_solver.utils.schedule_tensor import ScheduleTensor, store_week
+from nsp_solver.validator import numpy_validator
+from nsp_solver.validator.validator import ScheduleValidator
+import numpy as np
+
+"""
+Tests for scenario_cache.py
+"""
+
+TEST_DATA = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_data")
+FILES = [
+    os.path.join(TEST_DATA, "C0.json"),
+    os.path.join(TEST_DATA, "H0-n035w4-0.json"),
+    os.path.join(TEST_DATA, "Sc-n035w4.json"),
+    [os.path.join(TEST_DATA, f"WD-n035w4-{week}.json") for week in [1, 7, 1, 8]],
+]
+
+
+def _parse():
+    documents = []
+    for file_path in FILES[:3] + FILES[3]:
+        with open(file_path) as file:
+            documents.append(json.load(file))
+    return documents[0], documents[1], documents[2], documents[3:]
+
+
+def test_compile_scenario():
+    # Arrange
+    config_data, history_data, sc_data, wd_data = _parse()
+
+    # Act
+    compiled = compile_scenario(config_data, history_data, sc_data, wd_data)
+
+    # Assert
+    assert compiled.nurse_ids.shape == (35,)
+    assert compiled.requirements.shape == (4, 7, 4, 4, 2)
+    req = wd_data[0]["requirements"][0]
+    s, sk = utils.shift_to_int[req["shiftType"]], utils.skill_to_int[req["skill"]]
+    assert compiled.requirements[0, 0, s, sk].tolist() == [req["requirementOnMonday"]["minimum"], req["requirementOnMonday"]["optimal"]]
+    request = wd_data[0]["shiftOffRequests"][0]
+    n = compiled.nurse_index[request["nurse"]]
+    assert compiled.preferences[0, n, utils.day_to_int[request["day"]]].any()
+    assert compiled.history[n, 0] == history_data["nurseHistory"][n]["numberOfAssignments"]
+
+
+def test_scenario_cache_round_trip(tmp_path):
+    # Arrange
+    cache = ScenarioCache(str(tmp_path))
+    config_data, history_data, sc_data, wd_data = _parse()
+
+    # Act
+    compiled_first = cache.load(*FILES)[-1]
+    loaded = cache.load(*FILES)
+
+    # Assert
+    assert len(os.listdir(tmp_path)) == 1
+    assert loaded[:5] == (config_data, history_data, history_data, sc_data, wd_data)
+    assert loaded[1] is not loaded[2]
+    compiled = loaded[-1]
+    assert isinstance(compiled.requirements, np.memmap)
+    assert compiled.key == compiled_first.key
+    assert np.array_equal(compiled.requirements, compile_scenario(config_data, history_data, sc_data, wd_data).requirements)
+
+
+def test_scenario_cache_recompiles_corrupt_artifact(tmp_path):
+    # Arrange
+    cache = ScenarioCache(str(tmp_path))
+    key = cache.load(*FILES)[-1].key
+    with open(os.path.join(tmp_path, key, "documents.pickle"), "wb") as file:
+        file.write(b"corrupt")
+
+    # Act
+    loaded = cache.load(*FILES)
+
+    # Assert
+    assert loaded[3]["id"] == _parse()[2]["id"]
+
+
+def test_numpy_validator_reuses_compiled_scenario(simulator_input_generator, monkeypatch):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    results = ScheduleTensor.from_data(data)
+    for w in data["all_weeks"]:
+        data["wd_data"] = data["all_wd_data"][w]
+        store_week(results, w, GreedyWarmStart().get_week_start(data))
+    compiled = []
+
+    def compile_and_count(*args):
+        compiled.append(args)
+        return compile_scenario(*args)
+
+    monkeypatch.setattr(numpy_validator, "compile_scenario", compile_and_count)
+
+    # Act
+    value = numpy_validator.NumpyScheduleValidator().evaluate_schedule(results, data)
+    data["all_weeks"] = range(2)
+    value_of_two_weeks = numpy_validator.NumpyScheduleValidator().evaluate_schedule(results, data)
+
+    # Assert
+    # the scenario compiled by the simulator is used unless the weeks differ
+    assert len(compiled) == 1
+    assert len(compiled[0][3]) == 2
+    assert value_of_two_weeks == ScheduleValidator().evaluate_schedule(results, data)
+    data["all_weeks"] = range(4)
+    assert value == ScheduleValidator().evaluate_schedule(results, data)
@@ -0,0 +1,102 @@
+from nsp_solver.simulator.history_simulator import HistorySimulator
+from nsp_solver.utils import utils
+from nsp_solver.utils.schedule_tensor import ScheduleTensor, as_assignments, store_week
+from nsp_solver.validator.validator import ScheduleValidator
+import numpy as np
+import pytest
+
+"""
+Tests for schedule_tensor.py
+"""
+
+
+def test_schedule_tensor__compatible_indexing(data_for_1_nurse):
+    # Arrange
+    schedule = ScheduleTensor.from_data(data_for_1_nurse)
+
+    # Act
+    schedule[(0, 3, 2, 1)] = 1
+    schedule[(0, "status")] = utils.STATUS_OK
+    schedule[(0, "value")] = 42
+
+    # Assert
+    assert schedule.shape == (1, 7, 4, 4)
+    assert schedule.assignments.dtype == np.uint8
+    assert schedule[(0, 3, 2, 1)] == 1
+    assert schedule[(0, 3, 2, 0)] == 0
+    assert schedule[(0, "status")] == utils.STATUS_OK
+    assert schedule.status[0] == utils.STATUS_OK
+    assert schedule[(0, "value")] == 42
+    assert (0, "status") in schedule
+    assert (1, "status") not in schedule
+
+
+def test_schedule_tensor__status_not_set(data_for_1_nurse):
+    # Arrange
+    schedule = ScheduleTensor.from_data(data_for_1_nurse)
+
+    # Act & Assert
+    with pytest.raises(KeyError):
+        schedule[(0, "status")]
+
+
+def test_schedule_tensor__week_slices():
+    # Arrange
+    schedule = ScheduleTensor(num_nurses=2, num_weeks=2, num_shifts=4, num_skills=4)
+    week_values = np.zeros((2, 7, 4, 4))
+    week_values[1, 0, 3, 2] = 0.9999
+
+    # Act
+    schedule.set_week(1, week_values)
+
+    # Assert
+    assert schedule[(1, 7, 3, 2)] == 1
+    assert schedule.week(1).sum() == 1
+    assert schedule.week(0).sum() == 0
+    assert schedule.shifts()[1, 7, 3] == 1
+    assert schedule.working_days()[1].tolist() == [0] * 7 + [1] + [0] * 6
+
+
+def test_dict_round_trip(data_for_1_nurse, results_1nurse_1full_week):
+    # Arrange
+    results_1nurse_1full_week[(0, "status")] = utils.STATUS_OK
+
+    # Act
+    schedule = ScheduleTensor.from_dict(results_1nurse_1full_week, data_for_1_nurse)
+
+    # Assert
+    assert schedule.to_dict() == results_1nurse_1full_week
+    assert np.array_equal(
+        as_assignments(results_1nurse_1full_week, data_for_1_nurse), schedule.assignments
+    )
+
+
+def test_store_week__dict(data_for_1_nurse, empty_results_1nurse_1week):
+    # Arrange
+    week_values = np.zeros((1, 7, 4, 4))
+    week_values[0, 6, 1, 2] = 1
+
+    # Act
+    store_week(empty_results_1nurse_1week, 0, week_values)
+
+    # Assert
+    assert empty_results_1nurse_1week[(0, 6, 1, 2)] == 1
+    assert sum(empty_results_1nurse_1week.values()) == 1
+
+
+def test_history_and_validator_accept_schedule_tensor(
+    data_for_1_nurse, results_1nurse_1full_week
+):
+    # Arrange
+    schedule = ScheduleTensor.from_dict(results_1nurse_1full_week, data_for_1_nurse)
+    simulator = HistorySimulator()
+
+    # Act
+    working_days, shifts = simulator._compute_helpful_values(schedule, data_for_1_nurse, 0)
+    value_from_tensor = ScheduleValidator().evaluate_schedule(schedule, data_for_1_nurse)
+    value_from_dict = ScheduleValidator().evaluate_schedule(results_1nurse_1full_week, data_for_1_nurse)
+
+    # Assert
+    assert np.sum(working_days) == 7
+    assert np.sum(shifts[:, :, 0]) == 7
+    assert value_from_tensor == value_from_dict
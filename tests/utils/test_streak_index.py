@@ -0,0 +1,81 @@
+from nsp_solver.utils.streak_index import StreakIndex, long_streaks, short_streaks, streak_lengths
+import numpy as np
+import pytest
+
+"""
+Tests for streak_index.py
+"""
+
+
+@pytest.mark.parametrize(
+    "values,carry,expected",
+    [
+        ([1, 1, 0, 1, 1, 1, 0], 0, [1, 2, 0, 1, 2, 3, 0]),
+        ([1, 1, 0, 1, 1, 1, 0], 3, [4, 5, 0, 1, 2, 3, 0]),
+        ([0, 1, 1, 1, 1, 1, 1], 3, [0, 1, 2, 3, 4, 5, 6]),
+        ([2, 1, 0, 0, 1, 0, 2], 1, [3, 4, 0, 0, 1, 0, 2]),
+    ],
+)
+def test_streak_lengths(values, carry, expected):
+    # Act
+    streaks = streak_lengths(np.array([values]), np.array([carry]))
+
+    # Assert
+    assert streaks.tolist() == [expected]
+
+
+def test_streaks_from_day():
+    # Arrange
+    # the streak of the first 8 days is too long on day 7, the streak of days 9 to 11 is too short
+    days = [1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 0]
+
+    # Act
+    too_long = [pattern for pattern in long_streaks(days, 5, 2, from_day=7) if sum(pattern) == len(pattern)]
+    too_short = [length for pattern, length in short_streaks(days, 4, 0, from_day=7) if sum(pattern) == len(pattern)]
+
+    # Assert
+    assert len(too_long) == 1
+    assert too_short == [3]
+
+
+def test_streak_index_from_history():
+    # Arrange
+    shifts = np.zeros((1, 7, 4), dtype=np.int64)
+    shifts[0, 0:3, 3] = 1
+    shifts[0, 5:7, 0] = 1
+    working_days = shifts.sum(axis=2)
+    history = [
+        {
+            "lastAssignedShiftType": "Night",
+            "numberOfConsecutiveAssignments": 2,
+            "numberOfConsecutiveWorkingDays": 4,
+            "numberOfConsecutiveDaysOff": 0,
+        }
+    ]
+
+    # Act
+    index = StreakIndex.from_history(working_days, shifts, history)
+
+    # Assert
+    assert index.working_day_streaks.tolist() == [[5, 6, 7, 0, 0, 1, 2]]
+    assert index.day_off_streaks.tolist() == [[0, 0, 0, 1, 2, 0, 0]]
+    assert index.shift_streaks[0, 3].tolist() == [3, 4, 5, 0, 0, 0, 0]
+    assert index.shift_streaks[0, 0].tolist() == [0, 0, 0, 0, 0, 1, 2]
+    assert index.previous_working_day_streaks().tolist() == [[4, 5, 6, 7, 0, 0, 1]]
+    assert index.last_shift_streaks().tolist() == [[2, 0, 0, 0]]
+
+
+def test_streak_index_interrupted():
+    # Arrange
+    working_days = np.array([[1, 1, 1, 0, 0, 0, 0]])
+    shifts = np.zeros((1, 7, 4), dtype=np.int64)
+    shifts[0, 0:3, 1] = 1
+    breaks = np.array([[False, True, False, False, True, False, False]])
+
+    # Act
+    index = StreakIndex(working_days, shifts, np.array([2]), np.array([0])).interrupted(breaks)
+
+    # Assert
+    assert index.working_day_streaks.tolist() == [[3, 0, 1, 0, 0, 0, 0]]
+    assert index.day_off_streaks.tolist() == [[0, 0, 0, 1, 0, 1, 2]]
+    assert index.shift_streaks[0, 1].tolist() == [1, 0, 1, 0, 0, 0, 0]
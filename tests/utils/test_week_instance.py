@@ -0,0 +1,71 @@
+import copy
+
+from nsp_solver.utils import utils
+from nsp_solver.utils.week_instance import WeekInstance, get_week_instance
+
+"""
+Tests for week_instance.py
+"""
+
+
+def test_week_instance_matches_input_files(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    sc_data = data["sc_data"]
+
+    # Act
+    instance = WeekInstance.from_data(data)
+
+    # Assert
+    for n, nurse in enumerate(sc_data["nurses"]):
+        contract = sc_data["contracts"][utils.contract_to_int[nurse["contract"]]]
+        assert instance.contract("minimalFreePeriod")[n] == contract["minimalFreePeriod"]
+        assert instance.history_values("numberOfAssignments")[n] == data["h0_data"]["nurseHistory"][n]["numberOfAssignments"]
+    assert all(type(value) is int for value in instance.contract("completeWeekends"))
+    requirements = list(instance.requirements())
+    assert len(requirements) == len(data["wd_data"]["requirements"])
+    req = data["wd_data"]["requirements"][-1]
+    s, sk, minimum, optimal = requirements[-1]
+    assert (s, sk) == (utils.shift_to_int[req["shiftType"]], utils.skill_to_int[req["skill"]])
+    assert minimum[6] == req["requirementOnSunday"]["minimum"]
+    assert optimal[6] == req["requirementOnSunday"]["optimal"]
+    assert instance.vacation_nurses.tolist() == [int(nurse.split("_")[1]) for nurse in data["wd_data"]["vacations"]]
+
+
+def test_get_week_instance_is_rebuilt_for_next_week(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    instance = get_week_instance(data)
+    data["h0_data"]["nurseHistory"][0]["numberOfAssignments"] += 3
+
+    # Act
+    same_week = get_week_instance(data)
+    data["h0_data"]["week"] += 1
+    data["wd_data"] = data["all_wd_data"][1]
+    next_week = get_week_instance(data)
+
+    # Assert
+    assert same_week is instance
+    assert next_week is not instance
+    assert next_week.week == 1
+    assert next_week.history_values("numberOfAssignments")[0] == instance.history_values("numberOfAssignments")[0] + 3
+
+
+def test_get_week_instance_is_rebuilt_for_other_documents(simulator_input_generator):
+    # Arrange
+    data = simulator_input_generator.get_data()
+    instance = get_week_instance(data)
+
+    # Act
+    data["wd_data"] = data["all_wd_data"][1]
+    other_week_data = get_week_instance(data)
+    data["h0_data"] = copy.deepcopy(data["h0_data"])
+    data["h0_data"]["nurseHistory"][0]["numberOfAssignments"] += 3
+    other_history = get_week_instance(data)
+
+    # Assert
+    assert other_week_data is not instance
+    assert other_week_data.week == instance.week
+    assert other_week_data.requirement_minimum.tolist() == WeekInstance.from_data(data).requirement_minimum.tolist()
+    assert other_history is not other_week_data
+    assert other_history.history_values("numberOfAssignments")[0] == instance.history_values("numberOfAssignments")[0] + 3
@@ -0,0 +1,112 @@
+import json
+import os
+import subprocess
+import sys
+
+from nsp_solver.simulator.simulator import Simulator
+from nsp_solver.validator.conf_validator import ConfigValidator
+from nsp_solver.validator.decision_policy import (
+    CONF_EVAL,
+    AlwaysContinuePolicy,
+    AlwaysStopPolicy,
+    CallbackPolicy,
+    ConfigConflictError,
+    RaisePolicy,
+)
+import pytest
+
+"""
+Tests for decision_policy.py and the report of conf_validator.py
+"""
+
+TEST_DATA = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_data")
+
+
+def _make_all_conflicts(data):
+    data["configuration"].update({"h1": True, "h10": True, "h5": True, "s2": True, "h6": True, "h9": True})
+    contract = data["sc_data"]["contracts"][-1]
+    contract["minimalFreePeriod"] = 3
+    contract["maximumNumberOfConsecutiveDaysOffHard"] = 2
+    contract["maximumNumberOfConsecutiveWorkingDaysHard"] = 3
+    contract["minimumNumberOfConsecutiveWorkingDays"] = 4
+    return contract["id"]
+
+
+def test_check_configuration_reports_all_conflicts(data_for_1_nurse):
+    # Arrange
+    contract_id = _make_all_conflicts(data_for_1_nurse)
+
+    # Act
+    report = ConfigValidator(RaisePolicy()).check_configuration(data_for_1_nurse)
+
+    # Assert
+    assert not report.ok
+    assert [issue.kind for issue in report.issues] == ["overriding", "contradicting", "affecting"]
+    assert report.issues[0].constraints == ("h1", "h10")
+    assert report.issues[1].contracts == [contract_id]
+    assert report.to_dict()["issues"][2]["constraints"] == ("h5", "s2")
+
+
+@pytest.mark.parametrize(
+    "policy,expected",
+    [
+        (AlwaysContinuePolicy(), CONF_EVAL.CONTINUE_EVEN_THOUGH),
+        (AlwaysStopPolicy(), CONF_EVAL.STOP),
+        (CallbackPolicy(lambda issue: CONF_EVAL.STOP if issue.kind == "affecting" else CONF_EVAL.CONTINUE_EVEN_THOUGH), CONF_EVAL.STOP),
+    ],
+)
+def test_policy_decides(policy, expected, data_for_1_nurse):
+    # Arrange
+    _make_all_conflicts(data_for_1_nurse)
+
+    # Act
+    result = ConfigValidator(policy).evaluate_configuration(data_for_1_nurse)
+
+    # Assert
+    assert result == expected
+
+
+def test_raise_policy(data_for_1_nurse):
+    # Arrange
+    _make_all_conflicts(data_for_1_nurse)
+
+    # Act
+    with pytest.raises(ConfigConflictError) as error:
+        ConfigValidator().evaluate_configuration(data_for_1_nurse, RaisePolicy())
+
+    # Assert
+    assert error.value.issue.kind == "overriding"
+
+
+def test_simulator_uses_policy_of_input(simulator_input_generator, tmp_path):
+    # Arrange
+    with open(os.path.join(TEST_DATA, "C0.json")) as file:
+        config_data = json.load(file)
+    config_data["h10"] = True
+    config_path = tmp_path / "C.json"
+    config_path.write_text(json.dumps(config_data))
+    input = simulator_input_generator.get_input(
+        config_file_path=str(config_path),
+        config_validator=ConfigValidator(RaisePolicy()),
+        validator_output_path=os.devnull,
+        config_policy=AlwaysStopPolicy(),
+    )
+
+    # Act
+    result = Simulator().simulate_computation(input)
+
+    # Assert
+    assert result is None
+
+
+def test_simulator_does_not_import_tkinter():
+    # Act
+    output = subprocess.run(
+        [sys.executable, "-c", "import sys, nsp_solver.simulator.simulator; print('tkinter' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    # Assert
+    assert output.strip() == "False"
@@ -6,8 +6,6 @@ from nsp_solver.utils import utils
 import numpy as np
 import pytest
 
-from src.nsp_solver.validator.validator import ScheduleValidator
-
 
 def test_compute_helpful_values__1nurse_5shifts_5_days(validator_for_1nurse_1week):
     """This is a mock test"""
@@ -77,13 +75,13 @@ def test_compute_helpful_values__1nurse_5_4_days(validator_for_1nurse_1week):
     ],
 )
 def test_is_max_assignments_per_day_satisfied(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
     for input in input_data:
         schedule[input] = 1
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -189,7 +187,7 @@ def test_is_max_assignments_per_day_satisfied(
     ],
 )
 def _test_is_shift_successsion_satisfied(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -198,7 +196,7 @@ def _test_is_shift_successsion_satisfied(
     data_for_1_nurse["h0_data_original"]["nurseHistory"][0][
         "lastAssignedShiftType"
     ] = input_data["lastAssignedShiftType"]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -247,14 +245,14 @@ def _test_is_shift_successsion_satisfied(
     ],
 )
 def _test_is_required_skill_satisfied(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
     for input in input_data["schedule"]:
         schedule[input] = 1
     data_for_1_nurse["sc_data"]["nurses"][0]["skills"] = input_data["skills"]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -355,7 +353,7 @@ def _test_is_required_skill_satisfied(
     ],
 )
 def _test_is_max_consecutive_work_days_satisfied(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -369,7 +367,7 @@ def _test_is_max_consecutive_work_days_satisfied(
     ]["maximumNumberOfConsecutiveWorkingDaysHard"] = input_data[
         "maximumNumberOfConsecutiveWorkingDaysHard"
     ]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -455,7 +453,7 @@ def _test_is_max_consecutive_work_days_satisfied(
     ],
 )
 def _test_is_min_consecutive_work_days_satisfied(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -469,7 +467,7 @@ def _test_is_min_consecutive_work_days_satisfied(
     ]["minimumNumberOfConsecutiveWorkingDaysHard"] = input_data[
         "minimumNumberOfConsecutiveWorkingDaysHard"
     ]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -558,7 +556,7 @@ def _test_is_min_consecutive_work_days_satisfied(
     ],
 )
 def _test_is_max_consecutive_work_shifts_satisfied(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -574,7 +572,7 @@ def _test_is_max_consecutive_work_shifts_satisfied(
         "maximumNumberOfConsecutiveAssignmentsHard"
     ] = input_data["maximumNumberOfConsecutiveAssignmentsHard"]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -666,7 +664,7 @@ def _test_is_max_consecutive_work_shifts_satisfied(
     ],
 )
 def test_is_min_max_consecutive_assignments_satisfied(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -682,7 +680,7 @@ def test_is_min_max_consecutive_assignments_satisfied(
         "minimumNumberOfConsecutiveAssignmentsHard"
     ] = input_data["minimumNumberOfConsecutiveAssignmentsHard"]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -792,7 +790,7 @@ def test_is_min_max_consecutive_assignments_satisfied(
     ],
 )
 def _test_is_min_consecutive_work_shifts_satisfied(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -820,7 +818,7 @@ def _test_is_min_consecutive_work_shifts_satisfied(
         "minimumNumberOfConsecutiveAssignmentsHard"
     ] = input_data["minimumNumberOfConsecutiveAssignmentsHard"]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -901,7 +899,7 @@ def _test_is_min_consecutive_work_shifts_satisfied(
     ],
 )
 def test_is_max_consecutive_days_off_satisfied(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -916,7 +914,7 @@ def test_is_max_consecutive_days_off_satisfied(
         "maximumNumberOfConsecutiveDaysOffHard"
     ]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -991,7 +989,7 @@ def test_is_max_consecutive_days_off_satisfied(
     ],
 )
 def test_is_min_consecutive_days_off_satisfied(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1009,7 +1007,7 @@ def test_is_min_consecutive_days_off_satisfied(
         "minimumNumberOfConsecutiveDaysOffHard"
     ]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1089,7 +1087,7 @@ def test_is_min_consecutive_days_off_satisfied(
     ],
 )
 def test_is_max_total_incomplete_weekends_satisfied(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1104,7 +1102,7 @@ def test_is_max_total_incomplete_weekends_satisfied(
         "maximumNumberOfIncompleteWeekendsHard"
     ]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1161,7 +1159,7 @@ def test_is_max_total_incomplete_weekends_satisfied(
     ],
 )
 def test_is_min_total_assignments_satisfied(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1174,7 +1172,7 @@ def test_is_min_total_assignments_satisfied(
         utils.contract_to_int[data_for_1_nurse["sc_data"]["nurses"][0]["contract"]]
     ]["minimumNumberOfAssignmentsHard"] = input_data["minimumNumberOfAssignmentsHard"]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1239,7 +1237,7 @@ def test_is_min_total_assignments_satisfied(
     ],
 )
 def test_is_max_total_assignments_satisfied(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1252,7 +1250,7 @@ def test_is_max_total_assignments_satisfied(
         utils.contract_to_int[data_for_1_nurse["sc_data"]["nurses"][0]["contract"]]
     ]["maximumNumberOfAssignmentsHard"] = input_data["maximumNumberOfAssignmentsHard"]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1332,7 +1330,7 @@ def test_is_max_total_assignments_satisfied(
     ],
 )
 def test_is_min_free_period_satisfied(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1348,7 +1346,7 @@ def test_is_min_free_period_satisfied(
         utils.contract_to_int[data_for_1_nurse["sc_data"]["nurses"][0]["contract"]]
     ]["minimalFreePeriod"] = input_data["minimalFreePeriod"]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1432,7 +1430,7 @@ def test_is_min_free_period_satisfied(
     ],
 )
 def test_is_max_assignments_per_day_with_exception_satisfied(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1442,7 +1440,7 @@ def test_is_max_assignments_per_day_with_exception_satisfied(
     for input in input_data["schedule"]:
         schedule[input] = 1
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1504,7 +1502,7 @@ def test_is_max_assignments_per_day_with_exception_satisfied(
     ],
 )
 def test_is_maximum_shifts_of_specific_type_satisfied(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1517,7 +1515,7 @@ def test_is_maximum_shifts_of_specific_type_satisfied(
         input_data["restriction"]
     ]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1569,7 +1567,7 @@ def test_is_maximum_shifts_of_specific_type_satisfied(
     ],
 )
 def test_is_planned_vacations_satisfied(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1579,7 +1577,7 @@ def test_is_planned_vacations_satisfied(
     for input in input_data["schedule"]:
         schedule[input] = 1
     data_for_1_nurse["all_wd_data"][0]["vacations"] = ["HN_0"]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
     # Act
     retval = validator._is_planned_vacations_satisfied()
@@ -1688,7 +1686,7 @@ def test_is_planned_vacations_satisfied(
     ],
 )
 def test_is_minimal_capacity_satisfied(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1698,7 +1696,7 @@ def test_is_minimal_capacity_satisfied(
     for input in input_data["schedule"]:
         schedule[input] = 1
     data_for_1_nurse["all_wd_data"][0]["requirements"] = input_data["requirements"]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
     # Act
     retval = validator._is_minimal_capacity_satisfied()
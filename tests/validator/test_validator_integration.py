@@ -5,8 +5,6 @@ Tests for solver
 from nsp_solver.utils import utils
 import pytest
 
-from src.nsp_solver.validator.validator import ScheduleValidator
-
 
 @pytest.mark.parametrize(
     "input_data,expected",
@@ -116,7 +114,7 @@ from src.nsp_solver.validator.validator import ScheduleValidator
     ],
 )
 def test_is_schedule_valid(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -140,7 +138,7 @@ def test_is_schedule_valid(
     ]
     data_for_1_nurse["all_wd_data"][0]["vacations"] = ["HN_0"]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -253,7 +251,7 @@ def test_is_schedule_valid(
     ],
 )
 def test_get_objective_value_of_schedule(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -277,7 +275,7 @@ def test_get_objective_value_of_schedule(
         {"nurse": "HN_0", "shiftType": "Any", "day": "Monday"}
     ]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -310,7 +308,7 @@ def test_get_objective_value_of_schedule(
     ],
 )
 def test_evaluate_schedule(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -325,7 +323,7 @@ def test_evaluate_schedule(
     for constr in input_data["tested_constraints"]:
         data_for_1_nurse["configuration"][constr] = True
 
-    validator = ScheduleValidator()
+    validator = validator_class()
 
     # Act
     retval = validator.evaluate_schedule(schedule, data_for_1_nurse)
@@ -5,8 +5,6 @@ Tests for solver
 from nsp_solver.utils import utils
 import pytest
 
-from src.nsp_solver.validator.validator import ScheduleValidator
-
 
 @pytest.mark.parametrize(
     "input_data,expected",
@@ -108,7 +106,7 @@ from src.nsp_solver.validator.validator import ScheduleValidator
     ],
 )
 def test_get_optimal_capacity_value(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -118,7 +116,7 @@ def test_get_optimal_capacity_value(
     for input in input_data["schedule"]:
         schedule[input] = 1
     data_for_1_nurse["all_wd_data"][0]["requirements"] = input_data["requirements"]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
     # Act
     retval = validator._get_optimal_capacity_value()
@@ -212,7 +210,7 @@ def test_get_optimal_capacity_value(
     ],
 )
 def test_get_max_consecutive_work_days_value(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -226,7 +224,7 @@ def test_get_max_consecutive_work_days_value(
     ]["maximumNumberOfConsecutiveWorkingDays"] = input_data[
         "maximumNumberOfConsecutiveWorkingDays"
     ]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -303,7 +301,7 @@ def test_get_max_consecutive_work_days_value(
     ],
 )
 def test_get_min_consecutive_work_days_value(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -317,7 +315,7 @@ def test_get_min_consecutive_work_days_value(
     ]["minimumNumberOfConsecutiveWorkingDays"] = input_data[
         "minimumNumberOfConsecutiveWorkingDays"
     ]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -408,7 +406,7 @@ def test_get_min_consecutive_work_days_value(
     ],
 )
 def test_get_max_consecutive_shifts_value(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -424,7 +422,7 @@ def test_get_max_consecutive_shifts_value(
         "maximumNumberOfConsecutiveAssignments"
     ] = input_data["maximumNumberOfConsecutiveAssignments"]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -516,7 +514,7 @@ def test_get_max_consecutive_shifts_value(
     ],
 )
 def test_get_min_consecutive_shifts_value(
-    input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
+    validator_class, input_data, expected, data_for_1_nurse, empty_results_1nurse_1week
 ):
     # Arrange
     schedule = empty_results_1nurse_1week
@@ -533,7 +531,7 @@ def test_get_min_consecutive_shifts_value(
     ] = input_data["minimumNumberOfConsecutiveAssignments"]
     # print(f'mincons{data_for_1_nurse["sc_data"]["shiftTypes"][0]["minimumNumberOfConsecutiveAssignments"]}')
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
     print(
         validator.data["h0_data_original"]["nurseHistory"][0][
@@ -752,7 +750,7 @@ def test_get_min_consecutive_shifts_value(
     ],
 )
 def test_get_max_consecutive_days_off_value(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     results_1nurse_1full_week,
@@ -775,7 +773,7 @@ def test_get_max_consecutive_days_off_value(
     ]["maximumNumberOfConsecutiveDaysOff"] = input_data[
         "maximumNumberOfConsecutiveDaysOff"
     ]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -890,7 +888,7 @@ def test_get_max_consecutive_days_off_value(
     ],
 )
 def test_get_min_consecutive_days_off_value(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     results_1nurse_1full_week,
@@ -913,7 +911,7 @@ def test_get_min_consecutive_days_off_value(
     ]["minimumNumberOfConsecutiveDaysOff"] = input_data[
         "minimumNumberOfConsecutiveDaysOff"
     ]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -953,7 +951,7 @@ def test_get_min_consecutive_days_off_value(
     ],
 )
 def test_get_consecutive_days_off_value(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     results_1nurse_1full_week,
@@ -981,7 +979,7 @@ def test_get_consecutive_days_off_value(
     ]["maximumNumberOfConsecutiveDaysOff"] = input_data[
         "maximumNumberOfConsecutiveDaysOff"
     ]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1085,7 +1083,7 @@ def test_get_consecutive_days_off_value(
     ],
 )
 def test_get_assignment_preferences_value(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1097,7 +1095,7 @@ def test_get_assignment_preferences_value(
     data_for_1_nurse["all_wd_data"][0]["shiftOffRequests"] = input_data[
         "preferences"
     ]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1183,7 +1181,7 @@ def test_get_assignment_preferences_value(
     ],
 )
 def test_get_incomplete_weekends_value(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1195,7 +1193,7 @@ def test_get_incomplete_weekends_value(
     data_for_1_nurse["sc_data"]["contracts"][
         utils.contract_to_int[data_for_1_nurse["sc_data"]["nurses"][0]["contract"]]
     ]["completeWeekends"] = input_data["completeWeekends"]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1259,7 +1257,7 @@ def test_get_incomplete_weekends_value(
     ],
 )
 def test_get_total_assignments_out_of_limits_value(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1280,7 +1278,7 @@ def test_get_total_assignments_out_of_limits_value(
     data_for_1_nurse["sc_data"]["contracts"][
         utils.contract_to_int[data_for_1_nurse["sc_data"]["nurses"][0]["contract"]]
     ]["maximumNumberOfAssignments"] = input_data["maximumNumberOfAssignments"]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1366,7 +1364,7 @@ def test_get_total_assignments_out_of_limits_value(
     ],
 )
 def test_get_total_weekends_over_limit_value(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1378,7 +1376,7 @@ def test_get_total_weekends_over_limit_value(
     data_for_1_nurse["sc_data"]["contracts"][
         utils.contract_to_int[data_for_1_nurse["sc_data"]["nurses"][0]["contract"]]
     ]["maximumNumberOfWorkingWeekends"] = input_data["maximumNumberOfWorkingWeekends"]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1438,7 +1436,7 @@ def test_get_total_weekends_over_limit_value(
     ],
 )
 def test_get_total_uses_of_ifneeded_skills_value(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1450,7 +1448,7 @@ def test_get_total_uses_of_ifneeded_skills_value(
     data_for_1_nurse["sc_data"]["nurses"][0]["skillsIfNeeded"] = input_data[
         "ifneeded_skills"
     ]
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act
@@ -1546,7 +1544,7 @@ def test_get_total_uses_of_ifneeded_skills_value(
     ],
 )
 def test_get_unsatisfied_overtime_preferences_value(
-    input_data,
+    validator_class, input_data,
     expected,
     data_for_1_nurse,
     empty_results_1nurse_1week,
@@ -1568,7 +1566,7 @@ def test_get_unsatisfied_overtime_preferences_value(
         "wantedOvertime"
     ]
 
-    validator = ScheduleValidator()
+    validator = validator_class()
     validator._init_variables(schedule, data_for_1_nurse)
 
     # Act